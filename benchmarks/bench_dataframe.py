@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+from pandas_should.suite import ShouldSuite
+
+from .common import DTYPES
+from .common import LAYOUTS
+from .common import SIZES
+from .common import bounds
+from .common import make_frame
+
+
+class DataFrameChecks(object):
+
+    params = [SIZES, DTYPES, LAYOUTS]
+    param_names = ['size', 'dtype', 'layout']
+    timeout = 600
+
+    def setup(self, size, dtype, layout):
+        self.df = make_frame(dtype, size, layout)
+        self.other = self.df.copy()
+        self.min_, self.max_ = bounds(dtype)
+        self.suite = (
+            ShouldSuite()
+            .have_not_null()
+            .fall_within_range(self.min_, self.max_)
+            .gte(self.min_)
+            .lte(self.max_)
+        )
+
+    def time_equal(self, size, dtype, layout):
+        self.df.should.equal(self.other)
+
+    def peakmem_equal(self, size, dtype, layout):
+        self.df.should.equal(self.other)
+
+    def time_not_equal(self, size, dtype, layout):
+        self.df.should.not_equal(self.other)
+
+    def time_have_same_length(self, size, dtype, layout):
+        self.df.should.have_same_length(self.other)
+
+    def time_have_same_width(self, size, dtype, layout):
+        self.df.should.have_same_width(self.other)
+
+    def time_be_shaped_like(self, size, dtype, layout):
+        self.df.should.be_shaped_like(self.other)
+
+    def time_have_width(self, size, dtype, layout):
+        self.df.should.have_width(self.df.shape[1])
+
+    def time_have_length(self, size, dtype, layout):
+        self.df.should.have_length(self.df.shape[0])
+
+    def time_have_null(self, size, dtype, layout):
+        self.df.should.have_null()
+
+    def peakmem_have_null(self, size, dtype, layout):
+        self.df.should.have_null()
+
+    def time_have_null_count(self, size, dtype, layout):
+        self.df.should.have_null(count=True)
+
+    def time_have_not_null(self, size, dtype, layout):
+        self.df.should.have_not_null()
+
+    def time_fall_within_range(self, size, dtype, layout):
+        self.df.should.fall_within_range(self.min_, self.max_)
+
+    def peakmem_fall_within_range(self, size, dtype, layout):
+        self.df.should.fall_within_range(self.min_, self.max_)
+
+    def time_greater_than(self, size, dtype, layout):
+        self.df.should.greater_than(self.min_)
+
+    def time_greater_than_or_equal(self, size, dtype, layout):
+        self.df.should.greater_than_or_equal(self.min_)
+
+    def time_less_than(self, size, dtype, layout):
+        self.df.should.less_than(self.max_)
+
+    def time_less_than_or_equal(self, size, dtype, layout):
+        self.df.should.less_than_or_equal(self.max_)
+
+    def time_have_number_of_unique_values(self, size, dtype, layout):
+        self.df.should.have_number_of_unique_values(1000)
+
+    def peakmem_have_number_of_unique_values(self, size, dtype, layout):
+        self.df.should.have_number_of_unique_values(1000)
+
+    def time_run_suite(self, size, dtype, layout):
+        self.df.should.run_suite(self.suite)
+
+    def peakmem_run_suite(self, size, dtype, layout):
+        self.df.should.run_suite(self.suite)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+from .common import DTYPES
+from .common import SIZES
+from .common import bounds
+from .common import make_series
+
+
+class SeriesChecks(object):
+
+    params = [SIZES, DTYPES]
+    param_names = ['size', 'dtype']
+    timeout = 600
+
+    def setup(self, size, dtype):
+        self.series = make_series(dtype, size)
+        self.other = self.series.copy()
+        self.min_, self.max_ = bounds(dtype)
+
+    def time_equal(self, size, dtype):
+        self.series.should.equal(self.other)
+
+    def peakmem_equal(self, size, dtype):
+        self.series.should.equal(self.other)
+
+    def time_not_equal(self, size, dtype):
+        self.series.should.not_equal(self.other)
+
+    def time_have_same_length(self, size, dtype):
+        self.series.should.have_same_length(self.other)
+
+    def time_have_length(self, size, dtype):
+        self.series.should.have_length(size)
+
+    def time_have_null(self, size, dtype):
+        self.series.should.have_null()
+
+    def peakmem_have_null(self, size, dtype):
+        self.series.should.have_null()
+
+    def time_have_null_count(self, size, dtype):
+        self.series.should.have_null(count=True)
+
+    def time_have_not_null(self, size, dtype):
+        self.series.should.have_not_null()
+
+    def time_fall_within_range(self, size, dtype):
+        self.series.should.fall_within_range(self.min_, self.max_)
+
+    def peakmem_fall_within_range(self, size, dtype):
+        self.series.should.fall_within_range(self.min_, self.max_)
+
+    def time_greater_than(self, size, dtype):
+        self.series.should.greater_than(self.min_)
+
+    def time_greater_than_or_equal(self, size, dtype):
+        self.series.should.greater_than_or_equal(self.min_)
+
+    def time_less_than(self, size, dtype):
+        self.series.should.less_than(self.max_)
+
+    def time_less_than_or_equal(self, size, dtype):
+        self.series.should.less_than_or_equal(self.max_)
+
+    def time_have_number_of_unique_values(self, size, dtype):
+        self.series.should.have_number_of_unique_values(1000)
+
+    def peakmem_have_number_of_unique_values(self, size, dtype):
+        self.series.should.have_number_of_unique_values(1000)
+
+    def time_have_number_of_unique_values_approx(self, size, dtype):
+        self.series.should.have_number_of_unique_values(1000, approx=True)
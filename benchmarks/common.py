@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import numpy as np
+import pandas as pd
+
+import pandas_should  # noqa
+
+# number of elements; export PANDAS_SHOULD_BENCH_MAX_SIZE to skip the largest
+SIZES = [
+    size for size in [10 ** 3, 10 ** 5, 10 ** 7, 10 ** 8]
+    if size <= int(os.environ.get('PANDAS_SHOULD_BENCH_MAX_SIZE', 10 ** 8))
+]
+
+DTYPES = ['float', 'int', 'nullable', 'categorical', 'datetime', 'object']
+
+# tall: a few long columns, wide: many columns of 1000 rows
+LAYOUTS = ['tall', 'wide']
+TALL_COLUMNS = 4
+WIDE_ROWS = 1000
+
+
+def make_values(dtype, size, seed=0):
+    rng = np.random.RandomState(seed)
+    ints = rng.randint(0, 1000, size=size)
+
+    if dtype == 'float':
+        return ints.astype('float64')
+
+    if dtype == 'int':
+        return ints
+
+    if dtype == 'nullable':
+        return pd.array(ints, dtype='Int64')
+
+    if dtype == 'categorical':
+        categories = ['c{:04d}'.format(i) for i in range(1000)]
+        return pd.Categorical.from_codes(ints, categories=categories, ordered=True)
+
+    if dtype == 'datetime':
+        return pd.Timestamp('2020-01-01') + pd.to_timedelta(ints, unit='s')
+
+    if dtype == 'object':
+        return np.array(['v{:04d}'.format(i) for i in range(1000)], dtype=object)[ints]
+
+    raise ValueError('unknown dtype: {}'.format(dtype))
+
+
+def bounds(dtype):
+    """(min, max) that every generated value falls within."""
+    if dtype in ('float', 'int', 'nullable'):
+        return 0, 999
+
+    if dtype == 'categorical':
+        return 'c0000', 'c0999'
+
+    if dtype == 'datetime':
+        return pd.Timestamp('2020-01-01'), pd.Timestamp('2020-01-01 00:16:39')
+
+    if dtype == 'object':
+        return 'v0000', 'v0999'
+
+    raise ValueError('unknown dtype: {}'.format(dtype))
+
+
+def make_series(dtype, size):
+    return pd.Series(make_values(dtype, size))
+
+
+def make_frame(dtype, size, layout):
+    if layout == 'tall':
+        rows, columns = max(1, size // TALL_COLUMNS), TALL_COLUMNS
+    else:
+        rows, columns = min(size, WIDE_ROWS), max(1, size // WIDE_ROWS)
+
+    values = make_values(dtype, rows)
+    return pd.DataFrame({'c{}'.format(i): values for i in range(columns)})
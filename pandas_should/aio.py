@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import functools
+import threading
+
+from .blocks import cancel_scope
+
+_executor = None
+
+
+def set_executor(executor):
+    """Executor for awaitable checks; None uses the event loop's default."""
+    global _executor
+    _executor = executor
+
+
+async def run_check(func, *args, executor=None, **kwargs):
+    """Run a blocking check on an executor without blocking the event loop.
+
+    Cancelling the awaiting task also stops the check at its next chunk.
+    """
+    event = threading.Event()
+
+    def call():
+        with cancel_scope(event):
+            return func(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor or _executor, call)
+    try:
+        return await future
+    except asyncio.CancelledError:
+        event.set()
+        raise
+
+
+class AsyncShould(object):
+    """Awaitable counterpart of ``obj.should``: ``await AsyncShould(df).gt(0)``."""
+
+    def __init__(self, obj, executor=None):
+        self.should_ = obj.should
+        self.executor_ = executor
+
+    def __getattr__(self, name):
+        method = getattr(self.should_, name)
+
+        @functools.wraps(method)
+        async def check(*args, **kwargs):
+            return await run_check(method, *args, executor=self.executor_, **kwargs)
+
+        return check
+
+
+async def gather_report(checks):
+    """Await ``{label: awaitable}`` concurrently, returning ``{label: result}``."""
+    labels = list(checks)
+    results = await asyncio.gather(*(checks[label] for label in labels))
+    return dict(zip(labels, results))
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+
+import numpy as np
+
+# number of elements examined at once (bounds temporary memory per check)
+CHUNK_SIZE = 1 << 16
+
+NUMERIC_KINDS = 'biuf'
+
+
+def column_values(series):
+    """Return the underlying array of a column without copying."""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in NUMERIC_KINDS:
+        return series.to_numpy(copy=False)
+
+    return series.array
+
+
+def iter_columns(df):
+    for label, series in df.items():
+        yield label, column_values(series)
+
+
+class CheckCancelled(Exception):
+    pass
+
+
+_local = threading.local()
+
+
+@contextmanager
+def cancel_scope(event):
+    """Abort chunked scans on this thread once ``event`` is set."""
+    previous = getattr(_local, 'cancel_event', None)
+    _local.cancel_event = event
+    try:
+        yield
+    finally:
+        _local.cancel_event = previous
+
+
+def iter_chunks(values, chunk_size=CHUNK_SIZE):
+    event = getattr(_local, 'cancel_event', None)
+    for start in range(0, len(values), chunk_size):
+        if event is not None and event.is_set():
+            raise CheckCancelled()
+        yield start, values[start:start + chunk_size]
+
+
+def is_numeric_array(values):
+    return isinstance(values, np.ndarray) and values.dtype.kind in NUMERIC_KINDS
+
+
+Violation = namedtuple('Violation', ['row', 'column', 'value'])
+
+# total is None unless counting was requested
+Located = namedtuple('Located', ['violations', 'total'])
+
+
+def as_bool_mask(mask):
+    if isinstance(mask, np.ndarray):
+        return mask
+
+    # BooleanArray from nullable comparisons, NA does not violate
+    return mask.to_numpy(dtype=bool, na_value=False)
+
+
+def first_positions(masks, limit, count=False):
+    """Collect the first ``limit`` positions from lazy (start, mask) pairs.
+
+    Stops pulling masks once ``limit`` positions are found, unless
+    ``count`` asks for the total number of hits.
+    """
+    positions = []
+    total = 0
+    for start, mask in masks:
+        if mask is None:
+            continue
+
+        hits = np.flatnonzero(mask)
+        missing = limit - len(positions)
+        if missing > 0:
+            positions.extend((hits[:missing] + start).tolist())
+        total += len(hits)
+
+        if not count and len(positions) >= limit:
+            break
+
+    return positions, (total if count else None)
+
+
+def locate_in_series(series, locate, limit, count=False):
+    values = column_values(series)
+    positions, total = locate(values, limit, count)
+    violations = [
+        Violation(series.index[p], series.name, values[p]) for p in positions
+    ]
+    return Located(violations, total)
+
+
+def locate_in_frame(df, locate, limit, count=False):
+    """Locate violations column by column (first N in column order)."""
+    violations = []
+    total = 0
+    for label, values in iter_columns(df):
+        if not count and len(violations) >= limit:
+            break
+
+        positions, column_total = locate(values, limit - len(violations), count)
+        violations.extend(
+            Violation(df.index[p], label, values[p]) for p in positions
+        )
+        total += column_total or 0
+
+    return Located(violations, total if count else None)
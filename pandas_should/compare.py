@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from .blocks import CHUNK_SIZE
+from .blocks import column_values
+from .blocks import is_numeric_array
+from .blocks import iter_chunks
+
+# same tolerance as assert_frame_equal / assert_series_equal (check_exact=False)
+RTOL = 1e-5
+ATOL = 1e-8
+
+
+def _index_types_equivalent(left, right):
+    if type(left) is type(right):
+        return True
+
+    # RangeIndex is interchangeable with an int64 index ('equiv')
+    integer = (pd.RangeIndex, type(pd.Index([0])))
+    return isinstance(left, integer) and isinstance(right, integer)
+
+
+def indexes_equal(left, right):
+    if left is right:
+        return True
+
+    if len(left) != len(right):
+        return False
+
+    if not _index_types_equivalent(left, right):
+        return False
+
+    if not dtypes_equal(left.dtype, right.dtype) or len(left.names) != len(right.names):
+        return False
+
+    if not all(names_equal(*pair) for pair in zip(left.names, right.names)):
+        return False
+
+    if left.equals(right):
+        return True
+
+    if isinstance(left, pd.MultiIndex):
+        return False
+
+    # float labels compare with the tolerance too
+    return arrays_equal(column_values(left), column_values(right))
+
+
+def dtypes_equal(left, right):
+    if left != right:
+        return False
+
+    # unordered CategoricalDtypes compare equal whatever the order of their
+    # categories, check_categorical does not ignore it
+    if isinstance(left, pd.CategoricalDtype):
+        return indexes_equal(left.categories, right.categories)
+
+    return True
+
+
+def names_equal(left, right):
+    """Compare names like assert_attr_equal: matching missing values are equal."""
+    if left is right:
+        return True
+
+    if _is_missing(left) and _is_missing(right):
+        return type(left) is type(right) or isinstance(left, float) and isinstance(right, float)
+
+    return _values_equal(left, right)
+
+
+def _is_missing(value):
+    return pd.api.types.is_scalar(value) and bool(pd.isna(value))
+
+
+def _freqs_equal(left, right):
+    # check_freq only looks at the row index of series (and of frame columns)
+    if isinstance(left, (pd.DatetimeIndex, pd.TimedeltaIndex)):
+        return left.freq == right.freq
+
+    return True
+
+
+def _floats_close(left, right):
+    return bool(np.isclose(left, right, rtol=RTOL, atol=ATOL, equal_nan=True).all())
+
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+
+
+def _values_equal(left, right):
+    """Compare two objects like assert_almost_equal, element by element."""
+    if left is right:
+        return True
+
+    if _is_number(left) and _is_number(right):
+        return _floats_close(float(left), float(right))
+
+    if _is_missing(left) or _is_missing(right):
+        return _is_missing(left) and _is_missing(right)
+
+    sequences = (np.ndarray, list, tuple)
+    if isinstance(left, sequences) and isinstance(right, sequences):
+        return len(left) == len(right) and all(map(_values_equal, left, right))
+
+    try:
+        return bool(left == right)
+    except (TypeError, ValueError):
+        # e.g. an array against a scalar
+        return False
+
+
+def _objects_equal(left, right):
+    left, right = np.asarray(left), np.asarray(right)
+    missing = pd.isna(left)
+    if not np.array_equal(missing, pd.isna(right)):
+        return False
+
+    left, right = left[~missing], right[~missing]
+    try:
+        same = left == right
+    except (TypeError, ValueError):
+        same = None
+    if not isinstance(same, np.ndarray) or same.dtype != bool or same.shape != left.shape:
+        # elements such as arrays don't compare to a plain bool
+        same = np.zeros(len(left), dtype=bool)
+
+    # what == does not settle, e.g. numbers within the tolerance
+    return all(_values_equal(left[i], right[i]) for i in np.flatnonzero(~same))
+
+
+def _chunks_equal(left, right):
+    if is_numeric_array(left) and is_numeric_array(right):
+        if left.dtype.kind == 'f':
+            return _floats_close(left, right)
+
+        return bool(np.array_equal(left, right))
+
+    if isinstance(left, pd.arrays.FloatingArray):
+        if not np.array_equal(left.isna(), right.isna()):
+            return False
+
+        return _floats_close(left.to_numpy('float64', na_value=np.nan),
+                             right.to_numpy('float64', na_value=np.nan))
+
+    if (isinstance(left, pd.arrays.PandasArray) and left.dtype.kind == 'O'
+            and not isinstance(left, pd.arrays.StringArray)):
+        return _objects_equal(left, right)
+
+    return bool(left.equals(right))
+
+
+def arrays_equal(left, right, chunk_size=CHUNK_SIZE):
+    """Compare two arrays chunk by chunk, stopping at the first mismatch."""
+    if len(left) != len(right):
+        return False
+
+    for start, left_chunk in iter_chunks(left, chunk_size):
+        right_chunk = right[start:start + chunk_size]
+        if not _chunks_equal(left_chunk, right_chunk):
+            return False
+
+    return True
+
+
+def series_equal(left, right, chunk_size=CHUNK_SIZE):
+    """Equivalent of assert_series_equal that never builds a message."""
+    if not isinstance(right, pd.Series):
+        return False
+
+    if len(left) != len(right) or not dtypes_equal(left.dtype, right.dtype):
+        return False
+
+    if not names_equal(left.name, right.name):
+        return False
+
+    if not indexes_equal(left.index, right.index) or not _freqs_equal(left.index, right.index):
+        return False
+
+    return arrays_equal(column_values(left), column_values(right), chunk_size)
+
+
+def frames_equal(left, right, chunk_size=CHUNK_SIZE):
+    """Equivalent of assert_frame_equal that never builds a message."""
+    if not isinstance(right, pd.DataFrame):
+        return False
+
+    if left.shape != right.shape:
+        return False
+
+    if not indexes_equal(left.columns, right.columns):
+        return False
+
+    if not all(dtypes_equal(*pair) for pair in zip(left.dtypes, right.dtypes)):
+        return False
+
+    if not indexes_equal(left.index, right.index):
+        return False
+
+    # assert_frame_equal checks the freq through each column's series
+    if left.shape[1] and not _freqs_equal(left.index, right.index):
+        return False
+
+    for i in range(left.shape[1]):
+        left_values = column_values(left.iloc[:, i])
+        right_values = column_values(right.iloc[:, i])
+        if not arrays_equal(left_values, right_values, chunk_size):
+            return False
+
+    return True
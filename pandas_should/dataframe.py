@@ -1,17 +1,61 @@
 # -*- coding: utf-8 -*-
 
 import pandas as pd
-from pandas.util.testing import assert_frame_equal
+
+from .blocks import column_values
+from .blocks import iter_columns
+from .blocks import locate_in_frame
+from .distinct import PRECISION
+from .distinct import have_distinct
+from .drift import MAX_KS
+from .drift import MAX_SHARE_RATIO
+from .drift import MIN_SHARE
+from .drift import SIGMAS
+from .drift import match_distribution
+from .groups import GroupedShould
+from .keys import KeyIndex
+from .keys import count_duplicate_rows
+from .nulls import frame_count_null
+from .nulls import frame_has_null
+from .nulls import locate_null
+from .order import index_is_monotonic
+from .parallel import column_all
+from .predicates import count_failing
+from .profiling import instrumented
+from .ranges import check_bound_labels
+from .ranges import column_bound
+from .ranges import frame_in_range
+from .ranges import frame_violations
+from .ranges import is_per_column
+from .ranges import locate_out_of_range
+from .schema import Schema
+from .stats import STATS_CACHE
+from .stats import stats_in_range
 
 
 class EqualAccessorMixin(object):
 
-    def equal(self, other_df):
+    def equal(self, other_df, message=False):
+        # comparison utilities are imported on first use to keep
+        # `import pandas_should` cheap
+        from .compare import frames_equal
+
+        equal_ = frames_equal(self.df_, other_df)
+
+        if not message:
+            return equal_
+
+        if equal_:
+            return equal_, None
+
+        # build the (expensive) diff only when it is asked for
+        from pandas.testing import assert_frame_equal
         try:
             assert_frame_equal(self.df_, other_df)
-        except AssertionError:
-            return False
-        return True
+        except AssertionError as e:
+            return equal_, str(e)
+
+        return equal_, None
 
     # alias
     be_equal_to = be_equals_to = be_eq_to = eq = equal
@@ -41,23 +85,40 @@ class EqualAccessorMixin(object):
 
 class NullAccessorMixin(object):
 
-    def have_null(self, count=False):
-        have_null_ = self.df_.isnull().any(axis=None)
+    def _null_counts(self):
+        stats = STATS_CACHE.frame_stats(self.df_)
+        if stats is None:
+            return frame_count_null(self.df_)
+
+        return dict(zip(self.df_.columns, (s.null_count_ for s in stats)))
+
+    def _has_null(self):
+        stats = STATS_CACHE.frame_stats(self.df_)
+        if stats is None:
+            return frame_has_null(self.df_)
+
+        return any(s.null_count_ for s in stats)
 
+    def have_null(self, count=False):
         if not count:
-            return have_null_
+            return self._has_null()
 
-        count = dict(self.df_.isnull().sum())
+        count = self._null_counts()
+        have_null_ = any(count.values())
 
         return have_null_, count
 
     def have_not_null(self):
-        have_null_ = self.df_.isnull().any(axis=None)
+        have_null_ = self._has_null()
         return not have_null_
 
     # alias
     havent_null = have_not_null
 
+    def locate_null(self, n=10, count=False):
+        """Return the first ``n`` missing values and, optionally, their total."""
+        return locate_in_frame(self.df_, locate_null, n, count)
+
 
 class ShapeAccessorMixin(object):
 
@@ -96,63 +157,245 @@ class ShapeAccessorMixin(object):
     # alias
     rows = rows_len = have_length_of_rows = have_length
 
+    def have_monotonic_index(self, increasing=True, strict=False):
+        return index_is_monotonic(self.df_.index, increasing, strict)
+
 
 class ValueRangeAccessorMixin(object):
+    """Range checks.
+
+    Bounds are one value for every column, or per-column dicts / Series
+    (columns without a bound are not checked). With ``report=True`` the
+    checks also return the labels of the violating columns.
+    """
+
+    def _violating_columns(self, lower, upper, include_lower, include_upper):
+        stats = STATS_CACHE.frame_stats(self.df_)
+        if stats is None:
+            return frame_violations(self.df_, lower, upper, include_lower, include_upper)
+
+        check_bound_labels(self.df_, lower, upper)
+        return [
+            label for s, (label, values) in zip(stats, iter_columns(self.df_))
+            if not stats_in_range(s, values, column_bound(lower, label),
+                                  column_bound(upper, label), include_lower, include_upper)
+        ]
+
+    def _in_range(self, lower=None, upper=None, include_lower=True, include_upper=True,
+                  report=False):
+        if report or is_per_column(lower) or is_per_column(upper):
+            violating = self._violating_columns(lower, upper, include_lower, include_upper)
+            in_range_ = not violating
+            if not report:
+                return in_range_
+
+            return in_range_, violating
+
+        stats = STATS_CACHE.frame_stats(self.df_)
+        if stats is None:
+            return frame_in_range(self.df_, lower, upper, include_lower, include_upper)
+
+        columns = (values for _, values in iter_columns(self.df_))
+        return all(
+            stats_in_range(s, values, lower, upper, include_lower, include_upper)
+            for s, values in zip(stats, columns)
+        )
+
+    def fall_within_range(self, range_min, range_max, report=False):
+        return self._in_range(lower=range_min, upper=range_max, report=report)
 
-    def fall_within_range(self, range_min, range_max):
-        if (self.df_ < range_min).any(axis=None):
-            return False
+    # alias
+    value_range = fall_within_range
 
-        if (self.df_ > range_max).any(axis=None):
-            return False
+    def greater_than(self, min_value, report=False):
+        return self._in_range(lower=min_value, include_lower=False, report=report)
 
-        return True
+    # alias
+    gt = greater_than
+
+    def greater_than_or_equal(self, min_value, report=False):
+        return self._in_range(lower=min_value, report=report)
 
     # alias
-    value_range = fall_within_range
+    gte = greater_than_or_equal
 
-    def greater_than(self, min_value):
-        if (self.df_ <= min_value).any(axis=None):
-            return False
+    def less_than(self, max_value, report=False):
+        return self._in_range(upper=max_value, include_upper=False, report=report)
 
-        return True
+    # alias
+    lt = less_than
+
+    def less_than_or_equal(self, max_value, report=False):
+        return self._in_range(upper=max_value, report=report)
 
     # alias
-    gt = greater_than
+    lte = less_than_or_equal
+
+    def locate_out_of_range(self, range_min=None, range_max=None, n=10, count=False,
+                            include_min=True, include_max=True):
+        """Return the first ``n`` values outside the range and, optionally, their total."""
+        def locate(values, limit, count):
+            return locate_out_of_range(values, limit, count, range_min, range_max,
+                                       include_min, include_max)
+
+        return locate_in_frame(self.df_, locate, n, count)
+
 
-    def greater_than_or_equal(self, min_value):
-        if (self.df_ < min_value).any(axis=None):
-            return False
+class ValueVarietyAccessorMixin(object):
 
-        return True
+    def have_number_of_unique_values(self, size, approx=False, precision=PRECISION):
+        """Check the number of unique values of every column.
+
+        ``size`` is either one number for all columns or a dict of
+        ``{column: size}`` checking only those columns.
+        """
+        if isinstance(size, dict):
+            return all(
+                have_distinct(column_values(self.df_[label]), expect, approx, precision)
+                for label, expect in size.items()
+            )
+
+        return column_all(
+            self.df_,
+            lambda values: have_distinct(values, size, approx, precision),
+        )
 
     # alias
-    gte = greater_than_or_equal
+    unique_values = have_number_of_unique_values
+
+
+class ReferenceAccessorMixin(object):
+
+    def have_foreign_key(self, columns, other, other_columns=None, count=False):
+        """Check that every key in ``columns`` exists in ``other``.
+
+        ``other`` is a DataFrame (keyed by ``other_columns``, by default the
+        same names) or a prebuilt ``KeyIndex`` to reuse across frames.
+        """
+        if isinstance(other, KeyIndex):
+            index = other
+        else:
+            index = KeyIndex(other, columns if other_columns is None else other_columns)
+
+        orphans = index.count_orphans(self.df_, columns, stop_early=not count)
+        have_foreign_key_ = orphans == 0
+
+        if not count:
+            return have_foreign_key_
+
+        return have_foreign_key_, orphans
+
+    # alias
+    references = have_foreign_key
+
+    def have_unique_key(self, columns=None, count=False):
+        """Check that ``columns`` (by default every column) identify each row."""
+        duplicates = count_duplicate_rows(self.df_, columns, stop_early=not count)
+        have_unique_key_ = duplicates == 0
 
-    def less_than(self, max_value):
-        if (self.df_ >= max_value).any(axis=None):
-            return False
+        if not count:
+            return have_unique_key_
 
-        return True
+        return have_unique_key_, duplicates
 
     # alias
-    lt = less_than
+    unique_key = primary_key = have_unique_key
+
 
-    def less_than_or_equal(self, max_value):
-        if (self.df_ > max_value).any(axis=None):
-            return False
+class GroupAccessorMixin(object):
 
-        return True
+    def groupby(self, by, columns=None):
+        """Return checks applied to every group of ``by`` in one pass each.
+
+        ``columns`` limits the value checks (by default every column but
+        the keys), e.g. ``df.should.groupby('region').lte(limits)``.
+        """
+        return GroupedShould(self.df_, by, columns)
 
     # alias
-    lte = less_than_or_equal
+    by = groupby
+
+
+class PredicateAccessorMixin(object):
+
+    def satisfy(self, expr, engine='auto', count=False):
+        """Check that a row-wise expression holds on every row.
+
+        e.g. ``'0 <= a <= b and notnull(c)'``. ``engine`` is ``'numba'``,
+        ``'numexpr'``, ``'pandas'`` or ``'auto'`` (the best one installed);
+        columns the compiled engines can't read are checked with pandas.
+        """
+        failing = count_failing(self.df_, expr, engine, stop_early=not count)
+        satisfy_ = failing == 0
+
+        if not count:
+            return satisfy_
+
+        return satisfy_, failing
+
+    # alias
+    satisfies = satisfy
+
+
+class SchemaAccessorMixin(object):
+
+    def have_schema(self, schema, problems=False):
+        """Check columns, dtypes, nullability and index type against ``schema``.
+
+        ``schema`` is a ``Schema`` or a dict of ``{column: dtype}``. Values
+        are only read for non-nullable columns, and only once the
+        structure (names, order, dtypes, index) matches.
+        """
+        if not isinstance(schema, Schema):
+            schema = Schema(schema)
+
+        problems_ = schema.problems(self.df_)
+        have_schema_ = not problems_
+
+        if not problems:
+            return have_schema_
+
+        return have_schema_, problems_
+
+    # alias
+    match_schema = have_schema
+
+
+class SuiteAccessorMixin(object):
+
+    def run_suite(self, suite):
+        return suite.run(self.df_)
+
+    def pass_suite(self, suite):
+        return all(result.passed for result in self.run_suite(suite))
+
+
+class DriftAccessorMixin(object):
+
+    def match_distribution(self, reference, sigmas=SIGMAS, max_ks=MAX_KS,
+                           max_share_ratio=MAX_SHARE_RATIO, min_share=MIN_SHARE,
+                           problems=False):
+        """Check for drift against a saved DistributionProfile (or its path)."""
+        return match_distribution(self.df_, reference, sigmas, max_ks,
+                                  max_share_ratio, min_share, problems)
+
+    # alias
+    not_drift = match_distribution
 
 
 @pd.api.extensions.register_dataframe_accessor('should')
+@instrumented('df_')
 class ShouldDataFrameAccessor(EqualAccessorMixin,
                               NullAccessorMixin,
                               ShapeAccessorMixin,
-                              ValueRangeAccessorMixin):
+                              ValueRangeAccessorMixin,
+                              ValueVarietyAccessorMixin,
+                              ReferenceAccessorMixin,
+                              GroupAccessorMixin,
+                              PredicateAccessorMixin,
+                              SchemaAccessorMixin,
+                              DriftAccessorMixin,
+                              SuiteAccessorMixin):
 
     def __init__(self, df):
         self.df_ = df
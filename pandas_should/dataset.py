@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+import concurrent.futures
+import os
+from collections import namedtuple
+
+import pandas as pd
+
+from .streaming import ShouldStream
+
+# suffix -> reader, for files found in a directory
+READERS = {
+    '.parquet': pd.read_parquet,
+    '.pq': pd.read_parquet,
+    '.csv': pd.read_csv,
+    '.csv.gz': pd.read_csv,
+    '.csv.bz2': pd.read_csv,
+    '.csv.zip': pd.read_csv,
+}
+
+# rows counts the rows checked before every check was decided; results holds,
+# per check, the verdict the partition settles on its own (False when it fails
+# the check, True e.g. for have_null finding a null) and None otherwise
+PartitionResult = namedtuple('PartitionResult', ['path', 'rows', 'results'])
+
+
+def _suffix(path):
+    name = os.path.basename(path).lower()
+    return next((suffix for suffix in sorted(READERS, key=len, reverse=True)
+                 if name.endswith(suffix)), None)
+
+
+def list_partitions(path):
+    """Return the data files under ``path`` (or ``path`` itself), sorted."""
+    if not os.path.isdir(path):
+        return [path]
+
+    found = []
+    for root, dirs, files in os.walk(path):
+        # skip hidden and underscore entries (_SUCCESS, .crc, _delta_log, ...)
+        dirs[:] = [d for d in dirs if not d.startswith(('.', '_'))]
+        found.extend(
+            os.path.join(root, name) for name in files
+            if not name.startswith(('.', '_')) and _suffix(name) is not None
+        )
+    return sorted(found)
+
+
+def _read(path, reader, read_kwargs):
+    if reader is None:
+        suffix = _suffix(path)
+        if suffix is None:
+            raise ValueError('no reader for {}'.format(path))
+        reader = READERS[suffix]
+
+    frames = reader(path, **read_kwargs)
+    if isinstance(frames, pd.DataFrame):
+        # one frame, or an iterator of them (e.g. read_csv with chunksize)
+        return [frames]
+    return frames
+
+
+def check_partition(path, checks, reader=None, read_kwargs=None):
+    """Run ``checks`` over one file; module level so that workers can pickle it.
+
+    Returns the partition's mergeable states and its PartitionResult.
+    """
+    states = [state_class(*args) for state_class, args in checks]
+    rows = 0
+    for chunk in _read(path, reader, read_kwargs or {}):
+        pending = [state for state in states if not state.decided()]
+        if not pending:
+            break
+        for state in pending:
+            state.update(chunk)
+        rows += len(chunk)
+
+    results = [state.result() if state.decided() else None for state in states]
+    return states, PartitionResult(path, rows, results)
+
+
+class ShouldDataset(ShouldStream):
+    """Runs the checks of a ShouldStream over partition files in a process pool.
+
+    Every worker reads its own files; their states are merged into a global
+    verdict, so totals such as ``have_length`` cover the whole dataset.
+    ``reader`` (a picklable callable, by default chosen by suffix) gets the
+    path and ``read_kwargs``. ``workers=1`` runs in this process.
+    """
+
+    def __init__(self, paths, reader=None, workers=None, read_kwargs=None):
+        if isinstance(paths, (str, os.PathLike)):
+            paths = list_partitions(os.fspath(paths))
+        super(ShouldDataset, self).__init__(list(paths))
+        self.reader_ = reader
+        self.workers_ = workers
+        self.read_kwargs_ = read_kwargs or {}
+        self.report_ = []
+
+    def _merge(self, states, result):
+        for state, other in zip(self.states_, states):
+            state.merge(other)
+        self.report_.append(result)
+
+    def _run_serial(self):
+        for path in self.chunks_:
+            if all(state.decided() for state in self.states_):
+                break
+            self._merge(*check_partition(path, self.checks_, self.reader_, self.read_kwargs_))
+
+    def _run_parallel(self):
+        with concurrent.futures.ProcessPoolExecutor(self.workers_) as executor:
+            futures = [
+                executor.submit(check_partition, path, self.checks_,
+                                self.reader_, self.read_kwargs_)
+                for path in self.chunks_
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                self._merge(*future.result())
+                if all(state.decided() for state in self.states_):
+                    # the verdict can't change, drop the files not started yet
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+    def run(self):
+        self.states_ = [state_class(*args) for state_class, args in self.checks_]
+        self.report_ = []
+
+        if self.workers_ == 1 or len(self.chunks_) <= 1:
+            self._run_serial()
+        else:
+            self._run_parallel()
+
+        self.report_.sort(key=lambda result: result.path)
+        return [state.result() for state in self.states_]
+
+    def failures(self):
+        """Partitions that fail a check on their own, from the last run."""
+        return [result for result in self.report_ if False in result.results]
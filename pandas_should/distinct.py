@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from .blocks import CHUNK_SIZE
+from .blocks import iter_chunks
+
+# 2 ** 14 registers, about 0.8% standard error
+PRECISION = 14
+
+
+class DistinctCounter(object):
+    """Exact distinct counter that gives up once it exceeds ``limit``.
+
+    Missing values count as one distinct value per kind (None, NaN, NaT,
+    NA), like ``Series.unique()``.
+    """
+
+    def __init__(self, limit=None):
+        self.limit_ = limit
+        self.seen_ = set()
+        self.null_kinds_ = set()
+
+    @property
+    def count(self):
+        return len(self.seen_) + len(self.null_kinds_)
+
+    def exceeded(self):
+        return self.limit_ is not None and self.count > self.limit_
+
+    def _add_uniques(self, uniques):
+        mask = np.asarray(pd.isna(uniques), dtype=bool)
+        if mask.any():
+            self.null_kinds_.update(type(value) for value in uniques[mask])
+            uniques = uniques[~mask]
+
+        self.seen_.update(np.asarray(uniques).tolist())
+
+    def update(self, values, chunk_size=CHUNK_SIZE):
+        for _, chunk in iter_chunks(values, chunk_size):
+            if self.exceeded():
+                break
+            self._add_uniques(pd.unique(chunk))
+        return self
+
+    def merge(self, other):
+        self.seen_ |= other.seen_
+        self.null_kinds_ |= other.null_kinds_
+        return self
+
+
+def count_distinct(values, limit=None, chunk_size=CHUNK_SIZE):
+    """Count distinct values, stopping as soon as the count exceeds limit.
+
+    The result is exact when it is at most ``limit``; otherwise it is only
+    known to be greater than ``limit``.
+    """
+    return DistinctCounter(limit).update(values, chunk_size).count
+
+
+def _bit_length(values):
+    # split in halves that float64 represents exactly
+    high = (values >> np.uint64(32)).astype('float64')
+    low = (values & np.uint64(0xffffffff)).astype('float64')
+    with np.errstate(divide='ignore'):
+        high_bits = np.where(high > 0, np.floor(np.log2(high)) + 33, 0)
+        low_bits = np.where(low > 0, np.floor(np.log2(low)) + 1, 0)
+    return np.where(high > 0, high_bits, low_bits).astype('uint8')
+
+
+class HyperLogLog(object):
+    """Mergeable approximate distinct counter.
+
+    The relative standard error of ``estimate()`` is ``relative_error``
+    (1.04 / sqrt(2 ** precision)).
+    """
+
+    def __init__(self, precision=PRECISION):
+        if not 4 <= precision <= 18:
+            raise ValueError('precision must be between 4 and 18')
+
+        self.precision_ = precision
+        self.registers_ = np.zeros(1 << precision, dtype='uint8')
+
+    @property
+    def relative_error(self):
+        return 1.04 / np.sqrt(len(self.registers_))
+
+    def update(self, values, chunk_size=CHUNK_SIZE):
+        p = self.precision_
+        width = 64 - p
+        if isinstance(values, pd.arrays.PandasArray):
+            # hash_array only takes ndarrays and real extension arrays
+            values = values.to_numpy()
+
+        for _, chunk in iter_chunks(values, chunk_size):
+            hashed = pd.util.hash_array(chunk)
+            index = (hashed >> np.uint64(width)).astype('intp')
+            rest = hashed & np.uint64((1 << width) - 1)
+            rank = np.uint8(width + 1) - _bit_length(rest)
+            np.maximum.at(self.registers_, index, rank)
+        return self
+
+    def merge(self, other):
+        if other.precision_ != self.precision_:
+            raise ValueError('can not merge sketches of different precision')
+
+        np.maximum(self.registers_, other.registers_, out=self.registers_)
+        return self
+
+    def estimate(self):
+        m = len(self.registers_)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers_.astype('int64')))
+
+        zeros = np.count_nonzero(self.registers_ == 0)
+        if zeros:
+            # linear counting is more accurate up to a few times m
+            linear = m * np.log(m / zeros)
+            if linear <= 3 * m:
+                return float(linear)
+
+        return float(raw)
+
+    def matches(self, size, sigmas=3):
+        """Whether ``size`` is within ``sigmas`` standard errors of the estimate."""
+        tolerance = sigmas * self.relative_error * max(size, 1)
+        return abs(self.estimate() - size) <= tolerance
+
+
+def have_distinct(values, size, approx=False, precision=PRECISION):
+    if approx:
+        return HyperLogLog(precision).update(values).matches(size)
+
+    return count_distinct(values, limit=size) == size
@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from .blocks import CHUNK_SIZE
+from .blocks import column_values
+from .blocks import iter_chunks
+
+# items kept per level of a QuantileSketch, about 1% rank error
+CAPACITY = 256
+
+# categories kept by a FrequencyTable, the rest are counted together
+MAX_CATEGORIES = 1000
+
+# default tolerances of compare()
+SIGMAS = 5
+MAX_KS = 0.1
+MAX_SHARE_RATIO = 2.0
+MIN_SHARE = 0.01
+
+
+class QuantileSketch(object):
+    """Mergeable quantile sketch (a KLL-style compactor hierarchy).
+
+    Level ``i`` holds items of weight ``2 ** i``; a full level is sorted
+    and every other item moves up, so memory stays about
+    ``capacity * log2(n / capacity)`` items.
+    """
+
+    def __init__(self, capacity=CAPACITY):
+        self.capacity_ = capacity
+        self.levels_ = [np.empty(0)]
+        # alternate the kept half so the compaction error cancels out
+        self.offset_ = 0
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels_):
+            items = self.levels_[level]
+            if len(items) > self.capacity_:
+                items = np.sort(items)
+                keep = items[len(items) - len(items) % 2:]
+                promoted = items[self.offset_:len(items) - len(keep):2]
+                self.offset_ ^= 1
+                self.levels_[level] = keep
+                if level + 1 == len(self.levels_):
+                    self.levels_.append(np.empty(0))
+                self.levels_[level + 1] = np.concatenate([self.levels_[level + 1], promoted])
+            level += 1
+
+    def update(self, values):
+        """Add float values; NaN must be removed by the caller."""
+        self.levels_[0] = np.concatenate([self.levels_[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        for level, items in enumerate(other.levels_):
+            if level == len(self.levels_):
+                self.levels_.append(np.empty(0))
+            self.levels_[level] = np.concatenate([self.levels_[level], items])
+        self._compress()
+        return self
+
+    def _weighted(self):
+        values = np.concatenate(self.levels_)
+        weights = np.concatenate([
+            np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels_)
+        ])
+        order = np.argsort(values, kind='stable')
+        return values[order], np.cumsum(weights[order])
+
+    def cdf(self, points):
+        """Fraction of the values less than or equal to each of ``points``."""
+        values, cumulative = self._weighted()
+        if not len(values):
+            return np.zeros(len(points))
+
+        positions = np.searchsorted(values, points, side='right')
+        below = np.concatenate([[0.0], cumulative])[positions]
+        return below / cumulative[-1]
+
+    def quantile(self, q):
+        values, cumulative = self._weighted()
+        if not len(values):
+            return np.nan
+
+        return values[min(np.searchsorted(cumulative, q * cumulative[-1]), len(values) - 1)]
+
+    def ks_distance(self, other):
+        """Largest gap between the two (estimated) distribution functions."""
+        points = np.concatenate(self.levels_ + other.levels_)
+        if not len(points):
+            return 0.0
+
+        return float(np.max(np.abs(self.cdf(points) - other.cdf(points))))
+
+    def to_dict(self):
+        return {'capacity': self.capacity_, 'levels': [items.tolist() for items in self.levels_]}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['capacity'])
+        sketch.levels_ = [np.asarray(items, dtype='float64') for items in data['levels']]
+        return sketch
+
+
+class NumericSummary(object):
+    """Count, mean, variance, extremes and quantiles of a numeric column."""
+
+    kind = 'numeric'
+
+    def __init__(self, capacity=CAPACITY):
+        self.count_ = 0
+        self.mean_ = 0.0
+        # sum of squared differences from the mean
+        self.m2_ = 0.0
+        self.min_ = np.inf
+        self.max_ = -np.inf
+        self.sketch_ = QuantileSketch(capacity)
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2_ / self.count_) if self.count_ else 0.0
+
+    def _add_moments(self, count, mean, m2):
+        # Chan et al. parallel variance
+        total = self.count_ + count
+        if not total:
+            return
+        delta = mean - self.mean_
+        self.mean_ += delta * count / total
+        self.m2_ += m2 + delta ** 2 * self.count_ * count / total
+        self.count_ = total
+
+    def update(self, values):
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return self
+
+        mean = values.mean()
+        self._add_moments(len(values), mean, float(((values - mean) ** 2).sum()))
+        self.min_ = min(self.min_, values.min())
+        self.max_ = max(self.max_, values.max())
+        self.sketch_.update(values)
+        return self
+
+    def merge(self, other):
+        self._add_moments(other.count_, other.mean_, other.m2_)
+        self.min_ = min(self.min_, other.min_)
+        self.max_ = max(self.max_, other.max_)
+        self.sketch_.merge(other.sketch_)
+        return self
+
+    def compare(self, reference, sigmas=SIGMAS, max_ks=MAX_KS, **kwargs):
+        problems = []
+        if not self.count_ or not reference.count_:
+            return problems
+
+        shift = abs(self.mean_ - reference.mean_)
+        if shift > sigmas * reference.std:
+            problems.append('mean moved by {:.3g} sigma'.format(
+                shift / reference.std if reference.std else np.inf))
+
+        distance = self.sketch_.ks_distance(reference.sketch_)
+        if distance > max_ks:
+            problems.append('distribution moved by {:.3g} (KS distance)'.format(distance))
+
+        return problems
+
+    def to_dict(self):
+        return {
+            'kind': self.kind, 'count': self.count_, 'mean': self.mean_, 'm2': self.m2_,
+            'min': float(self.min_), 'max': float(self.max_), 'sketch': self.sketch_.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        summary = cls()
+        summary.count_, summary.mean_, summary.m2_ = data['count'], data['mean'], data['m2']
+        summary.min_, summary.max_ = data['min'], data['max']
+        summary.sketch_ = QuantileSketch.from_dict(data['sketch'])
+        return summary
+
+
+class FrequencyTable(object):
+    """Value counts of a categorical column, bounded to ``max_categories``."""
+
+    kind = 'frequency'
+
+    def __init__(self, max_categories=MAX_CATEGORIES):
+        self.max_categories_ = max_categories
+        self.counts_ = {}
+        # rows of the categories dropped to stay bounded
+        self.other_ = 0
+
+    @property
+    def total(self):
+        return sum(self.counts_.values()) + self.other_
+
+    def _add(self, counts):
+        for value, count in counts.items():
+            self.counts_[value] = self.counts_.get(value, 0) + int(count)
+
+        if len(self.counts_) > self.max_categories_:
+            kept = sorted(self.counts_.items(), key=lambda item: -item[1])
+            self.other_ += sum(count for _, count in kept[self.max_categories_:])
+            self.counts_ = dict(kept[:self.max_categories_])
+
+    def update(self, values):
+        counts = pd.Series(values).value_counts(dropna=True)
+        self._add({_plain(value): count for value, count in counts.items() if count})
+        return self
+
+    def merge(self, other):
+        self.other_ += other.other_
+        self._add(other.counts_)
+        return self
+
+    def shares(self):
+        total = self.total
+        return {value: count / total for value, count in self.counts_.items()} if total else {}
+
+    def compare(self, reference, max_share_ratio=MAX_SHARE_RATIO, min_share=MIN_SHARE,
+                **kwargs):
+        problems = []
+        current, expected = self.shares(), reference.shares()
+        if not current or not expected:
+            return problems
+
+        for value in sorted(set(current) | set(expected), key=str):
+            share, reference_share = current.get(value, 0.0), expected.get(value, 0.0)
+            if max(share, reference_share) < min_share:
+                continue
+            ratio = share / reference_share if reference_share else np.inf
+            if ratio > max_share_ratio or ratio < 1 / max_share_ratio:
+                problems.append('share of {!r} went from {:.3g} to {:.3g}'.format(
+                    value, reference_share, share))
+        return problems
+
+    def to_dict(self):
+        return {
+            'kind': self.kind, 'max_categories': self.max_categories_,
+            'counts': [[value, count] for value, count in self.counts_.items()],
+            'other': self.other_,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        table = cls(data['max_categories'])
+        table.counts_ = {_plain(value): count for value, count in data['counts']}
+        table.other_ = data['other']
+        return table
+
+
+def _plain(value):
+    # numpy scalars (and lists read back from JSON) to hashable Python values
+    if isinstance(value, list):
+        return tuple(value)
+    return value.item() if isinstance(value, np.generic) else value
+
+
+SUMMARIES = {summary.kind: summary for summary in (NumericSummary, FrequencyTable)}
+
+
+def _is_numeric(values):
+    """Whether a column gets a NumericSummary rather than a FrequencyTable."""
+    if isinstance(values, np.ndarray):
+        return values.dtype.kind in 'iuf'
+
+    if isinstance(values, (pd.arrays.DatetimeArray, pd.arrays.TimedeltaArray)):
+        return True
+
+    return getattr(values, '_mask', None) is not None and values.dtype.kind in 'iuf'
+
+
+def _as_float(chunk):
+    """float64 values of one chunk of a numeric column, missing values as NaN."""
+    if isinstance(chunk, np.ndarray):
+        return chunk.astype('float64', copy=False)
+
+    if isinstance(chunk, (pd.arrays.DatetimeArray, pd.arrays.TimedeltaArray)):
+        asi8 = chunk.asi8.astype('float64')
+        asi8[chunk.isna()] = np.nan
+        return asi8
+
+    return chunk.to_numpy(dtype='float64', na_value=np.nan)
+
+
+class DistributionProfile(object):
+    """Mergeable per-column summaries to compare batches against a reference.
+
+    Numeric (and datetime) columns get a NumericSummary, other columns a
+    FrequencyTable. Profiles of chunks or parallel workers can be merged.
+    """
+
+    def __init__(self):
+        self.columns_ = {}
+
+    @classmethod
+    def build(cls, obj, chunk_size=CHUNK_SIZE):
+        return cls().update(obj, chunk_size)
+
+    def update(self, obj, chunk_size=CHUNK_SIZE):
+        if isinstance(obj, pd.Series):
+            obj = obj.to_frame()
+
+        for label, series in obj.items():
+            values = column_values(series)
+            numeric = _is_numeric(values)
+            if label not in self.columns_:
+                self.columns_[label] = NumericSummary() if numeric else FrequencyTable()
+
+            summary = self.columns_[label]
+            if summary.kind == 'numeric' and not numeric:
+                raise TypeError('column {!r} is not numeric any more'.format(label))
+            for _, chunk in iter_chunks(values, chunk_size):
+                # numeric chunks are converted one at a time, never the whole column
+                summary.update(_as_float(chunk) if summary.kind == 'numeric' else chunk)
+
+        return self
+
+    def merge(self, other):
+        for label, summary in other.columns_.items():
+            if label in self.columns_:
+                self.columns_[label].merge(summary)
+            else:
+                self.columns_[label] = summary
+        return self
+
+    def compare(self, reference, **tolerances):
+        """Return the problems of each column compared with ``reference``."""
+        problems = []
+        for label, expected in reference.columns_.items():
+            summary = self.columns_.get(label)
+            if summary is None:
+                problems.append('missing column {!r}'.format(label))
+            elif summary.kind != expected.kind:
+                problems.append('column {!r} is {}, expected {}'.format(
+                    label, summary.kind, expected.kind))
+            else:
+                problems.extend('column {!r}: {}'.format(label, problem)
+                                for problem in summary.compare(expected, **tolerances))
+        return problems
+
+    def to_dict(self):
+        columns = [[label, summary.to_dict()] for label, summary in self.columns_.items()]
+        return {'columns': columns}
+
+    @classmethod
+    def from_dict(cls, data):
+        profile = cls()
+        for label, summary in data['columns']:
+            profile.columns_[_plain(label)] = SUMMARIES[summary['kind']].from_dict(summary)
+        return profile
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def match_distribution(obj, reference, sigmas=SIGMAS, max_ks=MAX_KS,
+                       max_share_ratio=MAX_SHARE_RATIO, min_share=MIN_SHARE, problems=False):
+    """Compare a Series / DataFrame with a reference DistributionProfile (or its path).
+
+    A numeric column drifts when its mean moves by more than ``sigmas``
+    reference standard deviations or its KS distance exceeds ``max_ks``; a
+    categorical one when the share of a value (of at least ``min_share``)
+    changes by more than ``max_share_ratio`` times. A Series is compared
+    with the reference's only column, or the one of its name.
+    """
+    tolerances = {'sigmas': sigmas, 'max_ks': max_ks,
+                  'max_share_ratio': max_share_ratio, 'min_share': min_share}
+    if not isinstance(reference, DistributionProfile):
+        reference = DistributionProfile.load(reference)
+
+    if isinstance(obj, pd.Series) and len(reference.columns_) == 1:
+        label, = reference.columns_
+        obj = obj.rename(label)
+
+    problems_ = DistributionProfile.build(obj).compare(reference, **tolerances)
+    match_ = not problems_
+
+    if not problems:
+        return match_
+
+    return match_, problems_
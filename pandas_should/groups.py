@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+import pandas as pd
+
+from .keys import as_column_list
+from .profiling import instrumented
+
+
+def _compare(left, op, bound):
+    """Element-wise ``left <op> bound``; a Series bound is matched by group key.
+
+    Groups missing from a Series bound never violate it.
+    """
+    if not isinstance(bound, pd.Series):
+        return getattr(left, op)(bound)
+
+    bound = bound.reindex(left.index)
+    bounded = bound.notna().to_numpy()
+    if isinstance(left, pd.DataFrame):
+        return getattr(left, op)(bound, axis=0) & bounded[:, None]
+
+    return getattr(left, op)(bound) & bounded
+
+
+def _failing(violations):
+    """Group keys of the rows of a boolean frame / series holding a True."""
+    if isinstance(violations, pd.DataFrame):
+        violations = violations.any(axis=1)
+    violations = violations.fillna(False).astype(bool)
+    return violations.index[violations.to_numpy()]
+
+
+def _expected_groups(sizes, *bounds):
+    # groups only named by a bound Series have no rows at all
+    names = sizes.index.names
+    for bound in bounds:
+        if isinstance(bound, pd.Series):
+            missing = bound.index.difference(sizes.index)
+            if len(missing):
+                sizes = pd.concat([sizes, pd.Series(0, index=missing)])
+    return sizes.rename_axis(names)
+
+
+@instrumented('df_')
+class GroupedShould(object):
+    """Checks applied to every group of a frame at once.
+
+    Each check is one vectorized groupby aggregation; the grouping itself
+    is computed once and shared by the checks. Bounds are scalars or
+    Series keyed by group (groups missing from such a Series are not
+    bounded). With ``keys=True`` checks also return the failing groups.
+    """
+
+    def __init__(self, df, by, columns=None):
+        self.df_ = df
+        self.by_ = as_column_list(by)
+        if columns is None:
+            columns = [column for column in df.columns if column not in self.by_]
+        self.columns_ = as_column_list(columns)
+        self.groupby_ = df.groupby(self.by_, sort=False, dropna=False, observed=True)
+
+    def _result(self, failing, keys):
+        passed = len(failing) == 0
+        if not keys:
+            return passed
+
+        return passed, failing
+
+    def _sizes(self):
+        return self.groupby_.size()
+
+    def _in_range(self, lower=None, upper=None, include_lower=True, include_upper=True,
+                  keys=False):
+        bounds = []
+        if lower is not None:
+            bounds.append(('min', 'lt' if include_lower else 'le', lower))
+        if upper is not None:
+            bounds.append(('max', 'gt' if include_upper else 'ge', upper))
+
+        if not bounds:
+            return self._result(self._sizes().index[:0], keys)
+
+        # one aggregation computes every extreme the bounds need
+        extremes = self.groupby_[self.columns_].agg([name for name, _, _ in bounds])
+        violations = [
+            _compare(extremes.xs(name, axis=1, level=-1), op, bound) for name, op, bound in bounds
+        ]
+
+        failing = violations[0].any(axis=1)
+        for violation in violations[1:]:
+            failing |= violation.any(axis=1)
+        return self._result(_failing(failing), keys)
+
+    def fall_within_range(self, range_min, range_max, keys=False):
+        return self._in_range(lower=range_min, upper=range_max, keys=keys)
+
+    # alias
+    value_range = fall_within_range
+
+    def greater_than(self, min_value, keys=False):
+        return self._in_range(lower=min_value, include_lower=False, keys=keys)
+
+    # alias
+    gt = greater_than
+
+    def greater_than_or_equal(self, min_value, keys=False):
+        return self._in_range(lower=min_value, keys=keys)
+
+    # alias
+    gte = greater_than_or_equal
+
+    def less_than(self, max_value, keys=False):
+        return self._in_range(upper=max_value, include_upper=False, keys=keys)
+
+    # alias
+    lt = less_than
+
+    def less_than_or_equal(self, max_value, keys=False):
+        return self._in_range(upper=max_value, keys=keys)
+
+    # alias
+    lte = less_than_or_equal
+
+    def _null_counts(self):
+        # count() skips missing values, size() does not
+        counts = self.groupby_[self.columns_].count()
+        return counts.rsub(self._sizes(), axis=0)
+
+    def have_null(self, keys=False):
+        """Every group has a missing value in one of the columns."""
+        has_null = self._null_counts().to_numpy().any(axis=1)
+        return self._result(_failing(pd.Series(~has_null, index=self._sizes().index)), keys)
+
+    def have_not_null(self, keys=False):
+        """No group has a missing value in the columns."""
+        return self._result(_failing(self._null_counts() > 0), keys)
+
+    # alias
+    havent_null = have_not_null
+
+    def have_length(self, expect, keys=False):
+        """Every group has ``expect`` rows."""
+        sizes = _expected_groups(self._sizes(), expect)
+        return self._result(_failing(_compare(sizes, 'ne', expect)), keys)
+
+    # alias
+    rows = have_length
+
+    def have_length_in_range(self, range_min=None, range_max=None, keys=False):
+        """Every group has between ``range_min`` and ``range_max`` rows.
+
+        Groups named by a Series bound but absent from the frame have 0 rows.
+        """
+        sizes = _expected_groups(self._sizes(), range_min, range_max)
+        failing = pd.Series(False, index=sizes.index)
+        if range_min is not None:
+            failing |= _compare(sizes, 'lt', range_min)
+        if range_max is not None:
+            failing |= _compare(sizes, 'gt', range_max)
+        return self._result(_failing(failing), keys)
+
+    def have_number_of_unique_values(self, size, keys=False):
+        """Every column has ``size`` unique values in every group."""
+        counts = self.groupby_[self.columns_].nunique(dropna=False)
+        return self._result(_failing(_compare(counts, 'ne', size)), keys)
+
+    # alias
+    unique_values = have_number_of_unique_values
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+from .streaming import ShouldStream
+
+
+class IncrementalValidator(ShouldStream):
+    """Re-validates an append-only frame by checking only the new rows.
+
+    Rows before the watermark were already folded into the per-check state
+    by earlier ``validate`` calls, so each call costs O(appended rows).
+    """
+
+    def __init__(self):
+        super(IncrementalValidator, self).__init__(chunks=())
+        self.watermark_ = 0
+        self.columns_ = None
+
+    def validate(self, df):
+        if len(df) < self.watermark_:
+            raise ValueError('frame has fewer rows than the watermark, '
+                             'it is not append-only (call reset())')
+
+        columns = list(getattr(df, 'columns', [getattr(df, 'name', None)]))
+        if self.columns_ is not None and columns != self.columns_:
+            raise ValueError('columns changed since the last validation (call reset())')
+
+        self.chunks_ = [df.iloc[self.watermark_:]]
+        self.watermark_ = len(df)
+        self.columns_ = columns
+        return self.run()
+
+    def reset(self):
+        """Forget the watermark and every check state (checks are kept)."""
+        self.states_ = [state_class(*args) for state_class, args in self.checks_]
+        self.watermark_ = 0
+        self.columns_ = None
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from .blocks import CHUNK_SIZE
+
+
+def as_column_list(columns):
+    if isinstance(columns, (list, tuple)):
+        return list(columns)
+
+    return [columns]
+
+
+def _key_arrays(df, columns, start=None, stop=None):
+    return [df[column].iloc[start:stop] for column in columns]
+
+
+def _build_keys(arrays):
+    if len(arrays) == 1:
+        return pd.Index(arrays[0])
+
+    return pd.MultiIndex.from_arrays(arrays)
+
+
+def _null_rows(arrays):
+    mask = np.zeros(len(arrays[0]), dtype=bool)
+    for array in arrays:
+        mask |= np.asarray(array.isnull(), dtype=bool)
+    return mask
+
+
+class KeyIndex(object):
+    """Hash index over the key columns of a (dimension) frame.
+
+    Build it once and pass it to ``have_foreign_key`` of many frames; the
+    hash table behind ``get_indexer`` is built on first use and reused.
+    Rows with a missing key value are not indexed.
+    """
+
+    def __init__(self, df, columns):
+        self.columns_ = as_column_list(columns)
+        arrays = _key_arrays(df, self.columns_)
+        keys = _build_keys(arrays)
+        nulls = _null_rows(arrays)
+        if nulls.any():
+            keys = keys[~nulls]
+        self.keys_ = keys.unique()
+
+    def __len__(self):
+        return len(self.keys_)
+
+    def count_orphans(self, df, columns=None, stop_early=False, chunk_size=CHUNK_SIZE):
+        """Count rows of ``df`` whose key is not in the index.
+
+        Rows with a missing key value are never orphans. With
+        ``stop_early`` counting stops after the first chunk holding one.
+        """
+        columns = self.columns_ if columns is None else as_column_list(columns)
+        if len(columns) != len(self.columns_):
+            raise ValueError('need {} key columns, got {}'.format(
+                len(self.columns_), len(columns)))
+
+        orphans = 0
+        for start in range(0, len(df), chunk_size):
+            arrays = _key_arrays(df, columns, start, start + chunk_size)
+            missing = self.keys_.get_indexer(_build_keys(arrays)) == -1
+            missing &= ~_null_rows(arrays)
+            orphans += int(np.count_nonzero(missing))
+
+            if stop_early and orphans:
+                break
+
+        return orphans
+
+
+def _hash_chunk(df, columns, start, stop):
+    chunk = df.iloc[start:stop][columns]
+    return pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+
+
+def hash_rows(df, columns=None, chunk_size=CHUNK_SIZE):
+    """Hash each row over ``columns`` into a uint64 array, chunk by chunk."""
+    columns = list(df.columns) if columns is None else as_column_list(columns)
+    hashes = np.empty(len(df), dtype='uint64')
+    for start in range(0, len(df), chunk_size):
+        hashes[start:start + chunk_size] = _hash_chunk(df, columns, start, start + chunk_size)
+    return hashes
+
+
+def _equal_rows(df, columns, rows):
+    """Whether two of ``rows`` (sharing a hash) hold the same values."""
+    # duplicated() treats missing values as equal, like the full count
+    return bool(df.iloc[rows][columns].duplicated().any())
+
+
+def _has_duplicate_row(df, columns, chunk_size):
+    # the hashes seen so far, as sorted runs merged like a binary counter so
+    # that each chunk costs a few vectorized binary searches
+    runs = []
+    seen = []
+    for start in range(0, len(df), chunk_size):
+        hashes = _hash_chunk(df, columns, start, start + chunk_size)
+        seen.append(hashes)
+        chunk = np.sort(hashes)
+
+        repeated = chunk[1:][chunk[1:] == chunk[:-1]]
+        candidates = [repeated]
+        for run in runs:
+            # sorted needles keep the binary search cache friendly
+            found = run[np.minimum(np.searchsorted(run, chunk), len(run) - 1)] == chunk
+            candidates.append(chunk[found])
+
+        candidates = np.unique(np.concatenate(candidates))
+        if len(candidates):
+            # rare unless there are duplicates: find the rows and compare values
+            everything = np.concatenate(seen)
+            for key in candidates:
+                if _equal_rows(df, columns, np.flatnonzero(everything == key)):
+                    return True
+
+        runs.append(chunk)
+        while len(runs) > 1 and len(runs[-2]) <= len(runs[-1]):
+            runs.append(np.sort(np.concatenate([runs.pop(-2), runs.pop()]), kind='stable'))
+
+    return False
+
+
+def count_duplicate_rows(df, columns=None, stop_early=False, chunk_size=CHUNK_SIZE):
+    """Count rows whose key duplicates an earlier row (like ``duplicated().sum()``).
+
+    Rows are compared by hash first; only rows sharing a hash are compared
+    by value. With ``stop_early`` rows are hashed chunk by chunk into a
+    running table and 1 is returned at the first confirmed duplicate.
+    """
+    columns = list(df.columns) if columns is None else as_column_list(columns)
+    if stop_early:
+        return int(_has_duplicate_row(df, columns, chunk_size))
+
+    hashes = hash_rows(df, columns, chunk_size)
+    candidates = np.flatnonzero(pd.Series(hashes).duplicated(keep=False).to_numpy())
+    if not len(candidates):
+        return 0
+
+    return int(df.iloc[candidates].duplicated(subset=columns).sum())
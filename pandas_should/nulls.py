@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from .blocks import CHUNK_SIZE
+from .blocks import first_positions
+from .blocks import iter_chunks
+from .parallel import column_any
+from .parallel import column_map
+
+# integer representation of NaT
+NAT = np.iinfo(np.int64).min
+
+
+def _kind(values):
+    """Classify an array by how its missing values are stored."""
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind in 'biu':
+            return 'never'
+        if values.dtype.kind == 'f':
+            return 'nan'
+        if values.dtype.kind in 'mM':
+            return 'nat'
+        return 'generic'
+
+    if isinstance(values, pd.arrays.SparseArray):
+        return 'sparse'
+
+    if getattr(values, '_mask', None) is not None:
+        # nullable extension arrays (Int64, Float64, boolean, ...)
+        return 'mask'
+
+    if isinstance(values, pd.Categorical):
+        return 'codes'
+
+    if hasattr(values, 'asi8'):
+        # DatetimeArray, TimedeltaArray, PeriodArray
+        return 'nat'
+
+    return 'generic'
+
+
+def _int_view(values, kind):
+    if kind == 'mask':
+        return values._mask
+
+    if kind == 'codes':
+        return values.codes
+
+    if kind == 'nat':
+        return values.asi8 if hasattr(values, 'asi8') else values.view('i8')
+
+    return values
+
+
+def _null_gaps(values):
+    """Number of missing values in the gaps of a sparse array."""
+    if not pd.isna(values.fill_value):
+        return 0
+
+    return len(values) - values.sp_index.npoints
+
+
+def has_null(values, chunk_size=CHUNK_SIZE):
+    """Check whether an array contains a missing value, stopping early."""
+    kind = _kind(values)
+    if kind == 'never':
+        return False
+
+    if kind == 'sparse':
+        return bool(_null_gaps(values)) or has_null(values.sp_values, chunk_size)
+
+    if kind == 'mask':
+        return bool(values._mask.any())
+
+    data = _int_view(values, kind)
+    for _, chunk in iter_chunks(data, chunk_size):
+        if kind == 'nan':
+            # NaN propagates through minimum without a temporary mask
+            found = np.isnan(np.minimum.reduce(chunk))
+        elif kind == 'nat':
+            found = np.minimum.reduce(chunk) == NAT
+        elif kind == 'codes':
+            found = np.minimum.reduce(chunk) < 0
+        else:
+            found = pd.isna(chunk).any()
+
+        if found:
+            return True
+
+    return False
+
+
+def count_null(values, chunk_size=CHUNK_SIZE):
+    """Count the missing values of an array in a single pass."""
+    kind = _kind(values)
+    if kind == 'never':
+        return 0
+
+    if kind == 'sparse':
+        return _null_gaps(values) + count_null(values.sp_values, chunk_size)
+
+    if kind == 'mask':
+        return int(np.count_nonzero(values._mask))
+
+    data = _int_view(values, kind)
+    count = 0
+    for _, chunk in iter_chunks(data, chunk_size):
+        if kind == 'nan':
+            count += np.count_nonzero(np.isnan(chunk))
+        elif kind == 'nat':
+            count += np.count_nonzero(chunk == NAT)
+        elif kind == 'codes':
+            count += np.count_nonzero(chunk < 0)
+        else:
+            count += np.count_nonzero(pd.isna(chunk))
+
+    return int(count)
+
+
+def frame_has_null(df, chunk_size=CHUNK_SIZE):
+    return column_any(df, lambda values: has_null(values, chunk_size))
+
+
+def frame_count_null(df, chunk_size=CHUNK_SIZE):
+    counts = column_map(df, lambda values: count_null(values, chunk_size))
+    return dict(zip(df.columns, counts))
+
+
+def _sparse_null_masks(values, chunk_size):
+    # only the stored values are tested, gaps take the fill value's answer
+    fill_is_null = bool(pd.isna(values.fill_value))
+    indices = values.sp_index.to_int_index().indices
+    stored_nulls = pd.isna(values.sp_values)
+    for start, positions in iter_chunks(range(len(values)), chunk_size):
+        mask = np.full(len(positions), fill_is_null)
+        first, last = np.searchsorted(indices, [start, start + len(positions)])
+        mask[indices[first:last] - start] = stored_nulls[first:last]
+        yield start, mask
+
+
+def _null_masks(values, chunk_size):
+    kind = _kind(values)
+    if kind == 'never':
+        return
+
+    if kind == 'sparse':
+        yield from _sparse_null_masks(values, chunk_size)
+        return
+
+    data = _int_view(values, kind)
+    for start, chunk in iter_chunks(data, chunk_size):
+        if kind == 'nan':
+            yield start, np.isnan(chunk)
+        elif kind == 'nat':
+            yield start, chunk == NAT
+        elif kind == 'codes':
+            yield start, chunk < 0
+        elif kind == 'mask':
+            yield start, chunk
+        else:
+            yield start, np.asarray(pd.isna(chunk), dtype=bool)
+
+
+def locate_null(values, limit, count=False, chunk_size=CHUNK_SIZE):
+    """Return (first ``limit`` null positions, total or None)."""
+    return first_positions(_null_masks(values, chunk_size), limit, count)
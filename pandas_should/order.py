@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from .blocks import CHUNK_SIZE
+from .nulls import has_null
+
+
+def _is_datetimelike(values):
+    if isinstance(values, np.ndarray):
+        return values.dtype.kind in 'mM'
+
+    return hasattr(values, 'asi8')
+
+
+def _ordered_view(values):
+    """Return a plain ndarray that orders like ``values`` (int64 for datetimes)."""
+    if _is_datetimelike(values):
+        return values.asi8 if hasattr(values, 'asi8') else values.view('i8')
+
+    if isinstance(values, pd.Categorical):
+        if not values.ordered:
+            raise TypeError('unordered categoricals have no order')
+        return values.codes
+
+    data = getattr(values, '_data', None)
+    if getattr(values, '_mask', None) is not None and isinstance(data, np.ndarray):
+        return data
+
+    return np.asarray(values)
+
+
+def _windows(values, chunk_size):
+    # consecutive chunks overlap by one element so every pair is seen once
+    for start in range(0, max(len(values) - 1, 0), chunk_size):
+        window = values[start:start + chunk_size + 1]
+        yield window[:-1], window[1:]
+
+
+def is_monotonic(values, increasing=True, strict=False, chunk_size=CHUNK_SIZE):
+    """Check the order of an array, stopping at the first unordered chunk.
+
+    Like pandas, an array containing missing values is not monotonic.
+    """
+    if has_null(values):
+        return False
+
+    if increasing:
+        op = np.greater if strict else np.greater_equal
+    else:
+        op = np.less if strict else np.less_equal
+
+    data = _ordered_view(values)
+    for previous, current in _windows(data, chunk_size):
+        if not op(current, previous).all():
+            return False
+
+    return True
+
+
+def has_max_gap(values, max_gap, chunk_size=CHUNK_SIZE):
+    """Check that consecutive values differ by at most ``max_gap``.
+
+    Datetime-like values take a Timedelta (or anything it accepts).
+    """
+    if has_null(values):
+        return False
+
+    if _is_datetimelike(values):
+        max_gap = pd.Timedelta(max_gap).value
+
+    data = _ordered_view(values)
+    for previous, current in _windows(data, chunk_size):
+        # max - min instead of abs(diff) so unsigned values can't wrap
+        gaps = np.maximum(current, previous) - np.minimum(current, previous)
+        if not (gaps <= max_gap).all():
+            return False
+
+    return True
+
+
+def index_is_monotonic(index, increasing=True, strict=False):
+    """Answer from pandas' own (cached) flags on the index."""
+    if increasing:
+        monotonic = index.is_monotonic_increasing
+    else:
+        monotonic = index.is_monotonic_decreasing
+
+    if not strict or not monotonic:
+        return monotonic
+
+    return index.is_unique
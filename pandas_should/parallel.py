@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from contextlib import contextmanager
+
+from .blocks import CheckCancelled
+from .blocks import cancel_scope
+from .blocks import iter_columns
+
+# frames with fewer elements than this are always checked serially
+MIN_SIZE = 1 << 20
+
+
+class _Options(object):
+
+    def __init__(self):
+        self.workers_ = 1
+        self.min_size_ = MIN_SIZE
+        self.executor_ = None
+
+
+_options = _Options()
+_lock = threading.Lock()
+
+
+def set_parallel(workers=None, min_size=MIN_SIZE):
+    """Check DataFrame columns on a thread pool of the given size.
+
+    ``workers=None`` uses one thread per CPU, ``workers=1`` turns it off.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with _lock:
+        if _options.executor_ is not None:
+            _options.executor_.shutdown(wait=False)
+
+        _options.executor_ = None
+        _options.workers_ = workers
+        _options.min_size_ = min_size
+
+
+def get_parallel():
+    return _options.workers_, _options.min_size_
+
+
+@contextmanager
+def parallel(workers=None, min_size=MIN_SIZE):
+    previous = get_parallel()
+    set_parallel(workers, min_size)
+    try:
+        yield
+    finally:
+        set_parallel(*previous)
+
+
+def _executor(df):
+    if _options.workers_ <= 1 or df.shape[1] < 2 or df.size < _options.min_size_:
+        return None
+
+    with _lock:
+        if _options.executor_ is None:
+            _options.executor_ = ThreadPoolExecutor(
+                max_workers=_options.workers_,
+                thread_name_prefix='pandas_should',
+            )
+        return _options.executor_
+
+
+def column_map(df, func, labels=False):
+    """Apply func to the values of every column, returning results in column order.
+
+    With ``labels`` func gets the column label too: ``func(label, values)``.
+    """
+    columns = iter_columns(df) if labels else ((values,) for _, values in iter_columns(df))
+    executor = _executor(df)
+    if executor is None:
+        return [func(*column) for column in columns]
+
+    futures = [executor.submit(func, *column) for column in columns]
+    return [future.result() for future in futures]
+
+
+def _cancellable(event, func, values):
+    with cancel_scope(event):
+        try:
+            return func(values)
+        except CheckCancelled:
+            # the verdict was reached on another column
+            return None
+
+
+def column_all(df, func):
+    """Check that func holds for every column, stopping at the first failure.
+
+    On a pool, columns still running stop at their next chunk.
+    """
+    executor = _executor(df)
+    if executor is None:
+        return all(func(values) for _, values in iter_columns(df))
+
+    event = threading.Event()
+    futures = [
+        executor.submit(_cancellable, event, func, values) for _, values in iter_columns(df)
+    ]
+    try:
+        for future in as_completed(futures):
+            if not future.result():
+                return False
+    finally:
+        # stop the running columns, drop the ones that have not started
+        event.set()
+        for future in futures:
+            future.cancel()
+
+    return True
+
+
+def column_any(df, func):
+    return not column_all(df, lambda values: not func(values))
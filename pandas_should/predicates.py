@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import functools
+import importlib
+import importlib.util
+import operator
+
+import numpy as np
+import pandas as pd
+
+from .blocks import CHUNK_SIZE
+from .blocks import column_values
+from .blocks import is_numeric_array
+
+ENGINES = ('auto', 'numba', 'numexpr', 'pandas')
+
+# numexpr has no unsigned or small integer types
+NUMEXPR_DTYPES = {np.dtype(name) for name in ('bool', 'int32', 'int64', 'float32', 'float64')}
+
+# function name -> whether it is true for missing values
+NULL_FUNCTIONS = {'isnull': True, 'isna': True, 'notnull': False, 'notna': False}
+
+COMPARE_OPS = {
+    ast.Eq: ('==', operator.eq),
+    ast.NotEq: ('!=', operator.ne),
+    ast.Lt: ('<', operator.lt),
+    ast.LtE: ('<=', operator.le),
+    ast.Gt: ('>', operator.gt),
+    ast.GtE: ('>=', operator.ge),
+}
+
+BINARY_OPS = {
+    ast.Add: ('+', operator.add),
+    ast.Sub: ('-', operator.sub),
+    ast.Mult: ('*', operator.mul),
+    ast.Div: ('/', operator.truediv),
+    ast.Mod: ('%', operator.mod),
+    ast.Pow: ('**', operator.pow),
+}
+
+
+def _null_call(node):
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+        return None
+
+    if node.func.id not in NULL_FUNCTIONS or len(node.args) != 1 or node.keywords:
+        raise ValueError('unsupported call: {}'.format(ast.dump(node)))
+
+    return NULL_FUNCTIONS[node.func.id], node.args[0]
+
+
+def _check_node(node, names):
+    if isinstance(node, ast.Name):
+        if node.id not in names:
+            names.append(node.id)
+        return
+
+    if isinstance(node, ast.Call):
+        if _null_call(node) is None:
+            raise ValueError('unsupported call: {}'.format(ast.dump(node)))
+        return _check_node(node.args[0], names)
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str)):
+        return
+
+    allowed = (
+        (ast.Compare, lambda: all(type(op) in COMPARE_OPS for op in node.ops)),
+        (ast.BinOp, lambda: type(node.op) in BINARY_OPS),
+        (ast.BoolOp, lambda: True),
+        (ast.UnaryOp, lambda: isinstance(node.op, (ast.Not, ast.USub))),
+    )
+    if not any(isinstance(node, kind) and check() for kind, check in allowed):
+        raise ValueError('unsupported expression: {}'.format(ast.dump(node)))
+
+    for child in ast.iter_child_nodes(node):
+        if not isinstance(child, (ast.cmpop, ast.boolop, ast.operator, ast.unaryop)):
+            _check_node(child, names)
+
+
+class Predicate(object):
+    """A row-wise boolean expression over the columns of a frame.
+
+    The syntax is Python's: comparisons (chained or not), ``and``, ``or``,
+    ``not``, arithmetic, numbers, strings and ``isnull(column)`` /
+    ``notnull(column)``. Rows where it is not true (including missing
+    values compared to anything) fail.
+    """
+
+    def __init__(self, expr):
+        self.expr_ = expr
+        self.tree_ = ast.parse(expr.strip(), mode='eval').body
+        self.columns_ = []
+        _check_node(self.tree_, self.columns_)
+
+    def has_strings(self):
+        return any(
+            isinstance(node, ast.Constant) and isinstance(node.value, str)
+            for node in ast.walk(self.tree_)
+        )
+
+
+def to_numexpr(node):
+    """Translate to a numexpr expression (``&``, ``|`` and ``~`` for logic)."""
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Constant):
+        return repr(node.value)
+
+    null = _null_call(node)
+    if null is not None:
+        is_null, arg = null
+        arg = to_numexpr(arg)
+        # only NaN differs from itself
+        return '({0} != {0})'.format(arg) if is_null else '({0} == {0})'.format(arg)
+
+    if isinstance(node, ast.Compare):
+        operands = [node.left] + node.comparators
+        return '({})'.format(' & '.join(
+            '({} {} {})'.format(to_numexpr(left), COMPARE_OPS[type(op)][0], to_numexpr(right))
+            for left, op, right in zip(operands, node.ops, operands[1:])
+        ))
+
+    if isinstance(node, ast.BoolOp):
+        joiner = ' & ' if isinstance(node.op, ast.And) else ' | '
+        return '({})'.format(joiner.join(_numexpr_truth(value) for value in node.values))
+
+    if isinstance(node, ast.UnaryOp):
+        if isinstance(node.op, ast.Not):
+            return '(~{})'.format(_numexpr_truth(node.operand))
+        return '(-{})'.format(to_numexpr(node.operand))
+
+    return '({} {} {})'.format(
+        to_numexpr(node.left), BINARY_OPS[type(node.op)][0], to_numexpr(node.right))
+
+
+def _numexpr_truth(node):
+    # numexpr can't combine numbers with booleans, constants become True / False
+    if isinstance(node, ast.Constant):
+        return repr(bool(node.value))
+    return to_numexpr(node)
+
+
+def to_python(node, names):
+    """Translate to a Python expression over row ``i`` of the arrays ``names``."""
+    if isinstance(node, ast.Name):
+        return '{}[i]'.format(names[node.id])
+
+    if isinstance(node, ast.Constant):
+        return repr(node.value)
+
+    null = _null_call(node)
+    if null is not None:
+        is_null, arg = null
+        arg = to_python(arg, names)
+        return '({0} != {0})'.format(arg) if is_null else '({0} == {0})'.format(arg)
+
+    if isinstance(node, ast.Compare):
+        parts = [to_python(node.left, names)]
+        for op, right in zip(node.ops, node.comparators):
+            parts.extend([COMPARE_OPS[type(op)][0], to_python(right, names)])
+        return '({})'.format(' '.join(parts))
+
+    if isinstance(node, ast.BoolOp):
+        joiner = ' and ' if isinstance(node.op, ast.And) else ' or '
+        return '({})'.format(joiner.join(to_python(value, names) for value in node.values))
+
+    if isinstance(node, ast.UnaryOp):
+        prefix = 'not ' if isinstance(node.op, ast.Not) else '-'
+        return '({}{})'.format(prefix, to_python(node.operand, names))
+
+    return '({} {} {})'.format(
+        to_python(node.left, names), BINARY_OPS[type(node.op)][0], to_python(node.right, names))
+
+
+def kernel_source(predicate):
+    """Source of a row loop counting failing rows (only the first with ``stop_early``)."""
+    names = {column: 'c{}'.format(i) for i, column in enumerate(predicate.columns_)}
+    arguments = ', '.join(names[column] for column in predicate.columns_)
+    return '\n'.join([
+        'def kernel({}, stop_early):'.format(arguments),
+        '    failing = 0',
+        '    for i in range(len(c0)):',
+        '        if not {}:'.format(to_python(predicate.tree_, names)),
+        '            failing += 1',
+        '            if stop_early:',
+        '                break',
+        '    return failing',
+    ])
+
+
+@functools.lru_cache(maxsize=128)
+def _numba_kernel(source):
+    # compiled once per expression; numba specializes it per dtype signature
+    numba = importlib.import_module('numba')
+    namespace = {}
+    exec(source, namespace)
+    return numba.njit(nogil=True)(namespace['kernel'])
+
+
+def _evaluate(node, arrays):
+    if isinstance(node, ast.Name):
+        return arrays[node.id]
+
+    if isinstance(node, ast.Constant):
+        return node.value
+
+    null = _null_call(node)
+    if null is not None:
+        is_null, arg = null
+        nulls = pd.isna(_evaluate(arg, arrays))
+        return nulls if is_null else ~nulls
+
+    if isinstance(node, ast.Compare):
+        operands = [_evaluate(operand, arrays) for operand in [node.left] + node.comparators]
+        result = True
+        for left, op, right in zip(operands, node.ops, operands[1:]):
+            result = result & _passed(COMPARE_OPS[type(op)][1](left, right))
+        return result
+
+    if isinstance(node, ast.BoolOp):
+        combine = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+        return functools.reduce(
+            combine, (_passed(_evaluate(value, arrays)) for value in node.values))
+
+    if isinstance(node, ast.UnaryOp):
+        operand = _evaluate(node.operand, arrays)
+        return ~_passed(operand) if isinstance(node.op, ast.Not) else -operand
+
+    return BINARY_OPS[type(node.op)][1](
+        _evaluate(node.left, arrays), _evaluate(node.right, arrays))
+
+
+def _passed(result):
+    if isinstance(result, np.ndarray):
+        return result.astype(bool, copy=False)
+
+    if isinstance(result, (bool, int, float, str, np.generic)):
+        # constants, e.g. in 'a > 0 or 1'; np.bool_ so that ~ negates it
+        return np.bool_(result)
+
+    # BooleanArray from nullable columns, NA is not true
+    return result.to_numpy(dtype=bool, na_value=False)
+
+
+def _available(module):
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_engine(engine, predicate, arrays):
+    """Pick the engine; compiled ones only take plain numeric columns."""
+    if engine not in ENGINES:
+        raise ValueError('unknown engine: {}'.format(engine))
+
+    if engine != 'pandas' and engine != 'auto' and not _available(engine):
+        raise ImportError('engine {!r} needs the {} package'.format(engine, engine))
+
+    if predicate.has_strings() or not all(is_numeric_array(v) for v in arrays.values()):
+        return 'pandas'
+
+    if engine == 'auto':
+        engine = next((name for name in ('numba', 'numexpr') if _available(name)), 'pandas')
+
+    if engine == 'numexpr' and any(v.dtype not in NUMEXPR_DTYPES for v in arrays.values()):
+        return 'pandas'
+
+    return engine
+
+
+def _chunked_failing(evaluate, arrays, length, stop_early, chunk_size):
+    failing = 0
+    for start in range(0, length, chunk_size):
+        chunk = {name: values[start:start + chunk_size] for name, values in arrays.items()}
+        passed = _passed(evaluate(chunk))
+        failing += int(np.size(passed) - np.count_nonzero(passed))
+
+        if stop_early and failing:
+            break
+
+    return failing
+
+
+def count_failing(df, predicate, engine='auto', stop_early=False, chunk_size=CHUNK_SIZE):
+    """Count rows of ``df`` where ``predicate`` is not true.
+
+    numba stops at the first failing row, numexpr and pandas at the first
+    chunk holding one, when ``stop_early``.
+    """
+    if not isinstance(predicate, Predicate):
+        predicate = Predicate(predicate)
+
+    missing = [column for column in predicate.columns_ if column not in df.columns]
+    if missing:
+        raise KeyError('unknown columns: {}'.format(missing))
+
+    arrays = {column: column_values(df[column]) for column in predicate.columns_}
+    engine = resolve_engine(engine, predicate, arrays)
+
+    if not arrays:
+        # no column involved: the predicate is the same for every row
+        if _evaluate(predicate.tree_, arrays) or not len(df):
+            return 0
+        return 1 if stop_early else len(df)
+
+    if engine == 'numba':
+        kernel = _numba_kernel(kernel_source(predicate))
+        return int(kernel(*[arrays[column] for column in predicate.columns_], stop_early))
+
+    if engine == 'numexpr':
+        numexpr = importlib.import_module('numexpr')
+        expr = to_numexpr(predicate.tree_)
+
+        def evaluate(chunk):
+            return numexpr.evaluate(expr, local_dict=chunk)
+    else:
+        def evaluate(chunk):
+            return _evaluate(predicate.tree_, chunk)
+
+    return _chunked_failing(evaluate, arrays, len(df), stop_early, chunk_size)
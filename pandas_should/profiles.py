@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from .blocks import column_values
+from .dataset import _read
+from .distinct import PRECISION
+from .distinct import DistinctCounter
+from .distinct import HyperLogLog
+from .stats import ColumnStats
+from .stats import scan_column
+
+# file layout: MAGIC, then two length-prefixed zlib blocks holding the
+# JSON metadata and the concatenated sketch registers
+MAGIC = b'PSPF\x01'
+SUFFIX = '.pspf'
+
+# exact distinct counts are kept up to this many values per column
+DISTINCT_LIMIT = 1 << 16
+
+# 64 MiB
+MAX_BYTES = 1 << 26
+
+
+def _encode(value):
+    """Tag a scalar for JSON, or return None if it can't be stored."""
+    if isinstance(value, (bool, np.bool_)):
+        return ['b', bool(value)]
+    if isinstance(value, (int, np.integer)):
+        return ['i', int(value)]
+    if isinstance(value, (float, np.floating)):
+        return ['f', float(value)]
+    if isinstance(value, str):
+        return ['s', value]
+    if isinstance(value, pd.Timestamp):
+        return ['M', value.value, None if value.tz is None else str(value.tz)]
+    if isinstance(value, pd.Timedelta):
+        return ['m', value.value]
+    return None
+
+
+def _decode(tagged):
+    tag = tagged[0]
+    if tag == 'M':
+        value = pd.Timestamp(tagged[1])
+        return value if tagged[2] is None else value.tz_localize('UTC').tz_convert(tagged[2])
+    if tag == 'm':
+        return pd.Timedelta(tagged[1])
+    return tagged[1]
+
+
+class ColumnProfile(object):
+    """ColumnStats plus a distinct sketch of one column."""
+
+    def __init__(self, stats, sketch):
+        self.stats_ = stats
+        self.sketch_ = sketch
+
+    @classmethod
+    def build(cls, chunks, precision=PRECISION):
+        builder = _ColumnBuilder(precision)
+        for values in chunks:
+            builder.update(values)
+        return builder.profile()
+
+
+class _ColumnBuilder(object):
+    """Accumulates a ColumnProfile one chunk at a time."""
+
+    def __init__(self, precision=PRECISION):
+        self.stats_ = None
+        self.sketch_ = HyperLogLog(precision)
+        self.counter_ = DistinctCounter(DISTINCT_LIMIT)
+
+    def update(self, values):
+        stats = scan_column(values)
+        self.stats_ = stats if self.stats_ is None else self.stats_.merge(stats)
+        self.sketch_.update(values)
+        if not self.counter_.exceeded():
+            self.counter_.update(values)
+
+    def profile(self):
+        stats = self.stats_ or ColumnStats()
+        stats.nunique_ = None if self.counter_.exceeded() else self.counter_.count
+        return ColumnProfile(stats, self.sketch_)
+
+
+class FileProfile(object):
+    """Row count and column profiles of one data file."""
+
+    def __init__(self, rows, columns, key=None):
+        self.rows_ = rows
+        self.columns_ = columns
+        self.key_ = key
+
+    @classmethod
+    def build(cls, frames, precision=PRECISION, key=None):
+        """Profile ``frames`` (e.g. the chunks of read_csv) holding one at a time."""
+        rows, builders = 0, None
+        for df in frames:
+            if builders is None:
+                builders = {label: _ColumnBuilder(precision) for label in df.columns}
+            for label, builder in builders.items():
+                builder.update(column_values(df[label]))
+            rows += len(df)
+
+        columns = {label: builder.profile() for label, builder in (builders or {}).items()}
+        return cls(rows, columns, key)
+
+    def to_bytes(self):
+        meta = {'key': self.key_, 'rows': self.rows_, 'columns': []}
+        registers = []
+        for label, profile in self.columns_.items():
+            stats = profile.stats_
+            low, high = _encode(stats.min_), _encode(stats.max_)
+            has_extremes = stats.has_extremes_ and (stats.min_ is None or None not in (low, high))
+            meta['columns'].append([
+                _encode(label) or ['s', str(label)], stats.count_, stats.null_count_, has_extremes,
+                low if has_extremes else None, high if has_extremes else None,
+                stats.nunique_, profile.sketch_.precision_,
+            ])
+            registers.append(profile.sketch_.registers_.tobytes())
+
+        blocks = [zlib.compress(json.dumps(meta).encode('utf-8')),
+                  zlib.compress(b''.join(registers))]
+        return MAGIC + b''.join(struct.pack('<I', len(b)) + b for b in blocks)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if not data.startswith(MAGIC):
+            raise ValueError('not a profile (or an older format)')
+
+        blocks, offset = [], len(MAGIC)
+        for _ in range(2):
+            size, = struct.unpack_from('<I', data, offset)
+            offset += 4
+            blocks.append(zlib.decompress(data[offset:offset + size]))
+            offset += size
+
+        meta = json.loads(blocks[0].decode('utf-8'))
+        registers = np.frombuffer(blocks[1], dtype='uint8')
+        columns, start = {}, 0
+        for label, count, nulls, has_extremes, low, high, nunique, precision in meta['columns']:
+            stats = ColumnStats(count, nulls, None if low is None else _decode(low),
+                                None if high is None else _decode(high), has_extremes)
+            stats.nunique_ = nunique
+            sketch = HyperLogLog(precision)
+            sketch.registers_ = registers[start:start + len(sketch.registers_)].copy()
+            start += len(sketch.registers_)
+            columns[_decode(label)] = ColumnProfile(stats, sketch)
+
+        return cls(meta['rows'], columns, meta['key'])
+
+
+def file_key(path, block_size=1 << 20):
+    """[absolute path, size, mtime in ns, blake2b of the content]."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return [path, stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+
+
+class ProfileCache(object):
+    """On-disk cache of FileProfiles, evicting the least recently used.
+
+    Entries are keyed by path, size, mtime and content hash, so a changed
+    file is profiled again. The directory is kept under ``max_bytes``.
+    """
+
+    def __init__(self, directory, max_bytes=MAX_BYTES, precision=PRECISION):
+        self.directory_ = directory
+        self.max_bytes_ = max_bytes
+        self.precision_ = precision
+        os.makedirs(directory, exist_ok=True)
+
+    def _entry(self, key):
+        name = hashlib.blake2b(json.dumps(key).encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.directory_, name + SUFFIX)
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory_):
+            if name.endswith(SUFFIX):
+                path = os.path.join(self.directory_, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return sorted(entries)
+
+    def get(self, path, key=None):
+        key = key or file_key(path)
+        entry = self._entry(key)
+        try:
+            with open(entry, 'rb') as f:
+                profile = FileProfile.from_bytes(f.read())
+        except FileNotFoundError:
+            return None
+        except (ValueError, struct.error, zlib.error):
+            # unreadable entry, e.g. written by an older version
+            os.remove(entry)
+            return None
+
+        if profile.key_ != key:
+            return None
+
+        # entries age by last use
+        os.utime(entry)
+        return profile
+
+    def put(self, profile):
+        data = profile.to_bytes()
+        fd, tmp = tempfile.mkstemp(dir=self.directory_, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, self._entry(profile.key_))
+        self.evict()
+
+    def evict(self):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes_:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self._entries():
+            os.remove(path)
+
+    def profile(self, path, reader=None, read_kwargs=None):
+        """Return the profile of a data file, reading it only on a miss."""
+        key = file_key(path)
+        profile = self.get(path, key)
+        if profile is None:
+            frames = _read(path, reader, read_kwargs or {})
+            profile = FileProfile.build(frames, self.precision_, key)
+            self.put(profile)
+        return profile
+
+    def should(self, path, reader=None, read_kwargs=None):
+        return ProfileShould(self, path, reader, read_kwargs)
+
+
+class ProfileShould(object):
+    """``should`` checks on a data file, answered from its cached profile.
+
+    Checks the profile can't answer (e.g. ranges over values that can't be
+    stored) read the file and use ``DataFrame.should``.
+    """
+
+    def __init__(self, cache, path, reader=None, read_kwargs=None):
+        self.cache_ = cache
+        self.path_ = path
+        self.reader_ = reader
+        self.read_kwargs_ = read_kwargs or {}
+        self.profile_ = cache.profile(path, reader, read_kwargs)
+
+    def _frame(self):
+        frames = list(_read(self.path_, self.reader_, self.read_kwargs_))
+        return pd.concat(frames) if len(frames) != 1 else frames[0]
+
+    def _stats(self):
+        return [column.stats_ for column in self.profile_.columns_.values()]
+
+    def have_length(self, expect):
+        return self.profile_.rows_ == expect
+
+    # alias
+    rows = rows_len = have_length_of_rows = have_length
+
+    def have_width(self, expect):
+        return len(self.profile_.columns_) == expect
+
+    # alias
+    columns = columns_len = have_length_of_columns = have_width
+
+    def have_null(self):
+        return any(stats.null_count_ for stats in self._stats())
+
+    def have_not_null(self):
+        return not self.have_null()
+
+    # alias
+    havent_null = have_not_null
+
+    def _in_range(self, method, *args, **bounds):
+        answers = [stats.in_range(**bounds) for stats in self._stats()]
+        if False in answers:
+            return False
+
+        if None in answers:
+            return getattr(self._frame().should, method)(*args)
+
+        return True
+
+    def fall_within_range(self, range_min, range_max):
+        return self._in_range('fall_within_range', range_min, range_max,
+                              lower=range_min, upper=range_max)
+
+    # alias
+    value_range = fall_within_range
+
+    def greater_than(self, min_value):
+        return self._in_range('greater_than', min_value,
+                              lower=min_value, include_lower=False)
+
+    # alias
+    gt = greater_than
+
+    def greater_than_or_equal(self, min_value):
+        return self._in_range('greater_than_or_equal', min_value, lower=min_value)
+
+    # alias
+    gte = greater_than_or_equal
+
+    def less_than(self, max_value):
+        return self._in_range('less_than', max_value,
+                              upper=max_value, include_upper=False)
+
+    # alias
+    lt = less_than
+
+    def less_than_or_equal(self, max_value):
+        return self._in_range('less_than_or_equal', max_value, upper=max_value)
+
+    # alias
+    lte = less_than_or_equal
+
+    def have_number_of_unique_values(self, size, approx=False):
+        """Like ``DataFrame.should``: ``size`` is a number or ``{column: size}``."""
+        expected = size if isinstance(size, dict) else dict.fromkeys(self.profile_.columns_, size)
+        for label, expect in expected.items():
+            column = self.profile_.columns_[label]
+            if approx:
+                if not column.sketch_.matches(expect):
+                    return False
+            elif column.stats_.nunique_ is not None:
+                if column.stats_.nunique_ != expect:
+                    return False
+            else:
+                return self._frame().should.have_number_of_unique_values(size)
+
+        return True
+
+    # alias
+    unique_values = have_number_of_unique_values
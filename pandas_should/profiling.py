@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+
+CheckRecord = namedtuple('CheckRecord', [
+    'name',  # canonical method name (aliases report their target)
+    'kind',  # 'DataFrame' or 'Series'
+    'shape',
+    'seconds',
+    'bytes_scanned',  # size of the checked data, an upper bound with early exit
+    'peak_bytes',  # peak traced allocation, None unless trace_memory is on
+])
+
+
+class MemorySink(object):
+    """Keeps every record and aggregates them per check."""
+
+    def __init__(self):
+        self.records_ = []
+
+    def __call__(self, record):
+        self.records_.append(record)
+
+    def summary(self):
+        """Return {name: (calls, total seconds, total bytes scanned)}."""
+        summary = {}
+        for record in self.records_:
+            calls, seconds, scanned = summary.get(record.name, (0, 0.0, 0))
+            summary[record.name] = (
+                calls + 1,
+                seconds + record.seconds,
+                scanned + record.bytes_scanned,
+            )
+        return summary
+
+
+class LoggingSink(object):
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger_ = logger or logging.getLogger('pandas_should')
+        self.level_ = level
+
+    def __call__(self, record):
+        self.logger_.log(self.level_, 'should.%s %s%s %.6fs %d bytes',
+                         record.name, record.kind, record.shape,
+                         record.seconds, record.bytes_scanned)
+
+
+class JsonLinesSink(object):
+
+    def __init__(self, path):
+        self.path_ = path
+        self.lock_ = threading.Lock()
+
+    def __call__(self, record):
+        line = json.dumps(dict(record._asdict(), shape=list(record.shape)))
+        with self.lock_:
+            with open(self.path_, 'a') as f:
+                f.write(line + '\n')
+
+
+class _Registry(object):
+
+    def __init__(self):
+        self.sinks_ = []
+        self.trace_memory_ = False
+        self.local_ = threading.local()
+
+
+_registry = _Registry()
+
+
+def add_sink(sink, trace_memory=False):
+    """Send a CheckRecord for every should check to ``sink`` (any callable)."""
+    _registry.sinks_ = _registry.sinks_ + [sink]
+    _registry.trace_memory_ = _registry.trace_memory_ or trace_memory
+
+
+def remove_sink(sink):
+    _registry.sinks_ = [s for s in _registry.sinks_ if s != sink]
+    if not _registry.sinks_:
+        _registry.trace_memory_ = False
+
+
+@contextmanager
+def profile(sink=None, trace_memory=False):
+    """Record the checks run inside the block, by default into a MemorySink."""
+    sink = MemorySink() if sink is None else sink
+    add_sink(sink, trace_memory)
+    try:
+        yield sink
+    finally:
+        remove_sink(sink)
+
+
+def _bytes(obj):
+    usage = obj.memory_usage(index=False)
+    return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+
+
+def _measure(func, self, args, kwargs, obj):
+    trace = _registry.trace_memory_ and hasattr(tracemalloc, 'reset_peak')
+    started_tracing = trace and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if trace:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    try:
+        return func(self, *args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - start
+        peak = None
+        if trace:
+            peak = tracemalloc.get_traced_memory()[1] - base
+        if started_tracing:
+            tracemalloc.stop()
+
+        record = CheckRecord(
+            name=func.__name__,
+            kind=type(obj).__name__,
+            shape=tuple(obj.shape),
+            seconds=seconds,
+            bytes_scanned=_bytes(obj),
+            peak_bytes=peak,
+        )
+        for sink in _registry.sinks_:
+            sink(record)
+
+
+def _instrument(func, target):
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        # no sinks: a single list check on top of the plain call
+        if not _registry.sinks_ or getattr(_registry.local_, 'active', False):
+            return func(self, *args, **kwargs)
+
+        _registry.local_.active = True
+        try:
+            return _measure(func, self, args, kwargs, getattr(self, target))
+        finally:
+            _registry.local_.active = False
+
+    return wrapper
+
+
+def instrumented(target):
+    """Class decorator reporting every public check of an accessor to the sinks.
+
+    ``target`` is the attribute holding the checked DataFrame / Series.
+    Nested checks (e.g. not_equal calling equal) are reported once.
+    """
+
+    def decorate(cls):
+        wrappers = {}
+        for name in dir(cls):
+            func = getattr(cls, name)
+            if name.startswith('_') or not callable(func):
+                continue
+            # aliases share the wrapper of their target
+            if func not in wrappers:
+                wrappers[func] = _instrument(func, target)
+            setattr(cls, name, wrappers[func])
+        return cls
+
+    return decorate
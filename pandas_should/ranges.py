@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+
+import operator
+
+import numpy as np
+import pandas as pd
+
+from .blocks import CHUNK_SIZE
+from .blocks import as_bool_mask
+from .blocks import column_values
+from .blocks import first_positions
+from .blocks import is_numeric_array
+from .blocks import iter_chunks
+from .nulls import NAT
+from .parallel import column_all
+from .parallel import column_map
+
+
+def _lower_violation(include_lower):
+    return operator.lt if include_lower else operator.le
+
+
+def _upper_violation(include_upper):
+    return operator.gt if include_upper else operator.ge
+
+
+def _numeric_chunk_in_range(chunk, lower, upper, include_lower, include_upper):
+    # fmin / fmax skip NaN like the element-wise comparisons do
+    if lower is not None:
+        if _lower_violation(include_lower)(np.fmin.reduce(chunk), lower):
+            return False
+
+    if upper is not None:
+        if _upper_violation(include_upper)(np.fmax.reduce(chunk), upper):
+            return False
+
+    return True
+
+
+def _generic_chunk_in_range(chunk, lower, upper, include_lower, include_upper):
+    if lower is not None:
+        if _lower_violation(include_lower)(chunk, lower).any():
+            return False
+
+    if upper is not None:
+        if _upper_violation(include_upper)(chunk, upper).any():
+            return False
+
+    return True
+
+
+def _datetime_chunk_in_range(chunk, lower, upper, include_lower, include_upper):
+    if lower is not None:
+        low = np.min(chunk)
+        if low == NAT:
+            valid = chunk[chunk != NAT]
+            if not len(valid):
+                return True
+            low = valid.min()
+        if _lower_violation(include_lower)(low, lower):
+            return False
+
+    # NaT is the smallest int64, it never raises the maximum
+    if upper is not None:
+        if _upper_violation(include_upper)(np.max(chunk), upper):
+            return False
+
+    return True
+
+
+def _is_datetimelike(values):
+    return isinstance(values, (pd.arrays.DatetimeArray, pd.arrays.TimedeltaArray))
+
+
+def _int64_bound(values, bound):
+    """Convert a bound to the int64 representation of ``values``."""
+    if bound is None:
+        return None
+
+    unit = 'timedelta64[{}]' if isinstance(values, pd.arrays.TimedeltaArray) else 'datetime64[{}]'
+    unit = unit.format(getattr(values, 'unit', 'ns'))
+
+    if isinstance(values, pd.arrays.TimedeltaArray):
+        bound = pd.Timedelta(bound).to_timedelta64()
+    else:
+        bound = pd.Timestamp(bound)
+        if (bound.tz is None) != (values.tz is None):
+            raise TypeError('cannot compare tz-naive and tz-aware datetimes')
+        bound = bound.to_datetime64()
+
+    return int(bound.astype(unit).view('i8'))
+
+
+def _masked_in_range(values, lower, upper, include_lower, include_upper, chunk_size):
+    # nullable arrays: reduce over the data, dropping masked slots only
+    # in the chunks that have some
+    mask = values._mask
+    for start, chunk in iter_chunks(values._data, chunk_size):
+        chunk_mask = mask[start:start + chunk_size]
+        if chunk_mask.any():
+            chunk = chunk[~chunk_mask]
+            if not len(chunk):
+                continue
+        if not _numeric_chunk_in_range(chunk, lower, upper, include_lower, include_upper):
+            return False
+
+    return True
+
+
+def _category_position(categories, bound):
+    if bound is None:
+        return None
+
+    if bound not in categories:
+        raise TypeError('cannot compare an ordered categorical with {!r}, '
+                        'it is not a category'.format(bound))
+
+    return categories.get_loc(bound)
+
+
+def _category_violations(values, lower, upper, include_lower, include_upper):
+    """Flag the categories outside the range, plus a False slot for code -1."""
+    categories = values.categories
+    if values.ordered:
+        # ordered categoricals compare by category order, like pandas
+        category_values = np.arange(len(categories))
+        lower = _category_position(categories, lower)
+        upper = _category_position(categories, upper)
+    else:
+        category_values = column_values(categories.to_series())
+
+    masks = _violation_masks(category_values, lower, upper, include_lower, include_upper,
+                             max(len(categories), 1))
+    violations = np.zeros(len(categories) + 1, dtype=bool)
+    for start, mask in masks:
+        if mask is not None:
+            violations[start:start + len(mask)] = mask
+    return violations
+
+
+def _categorical_in_range(values, lower, upper, include_lower, include_upper, chunk_size):
+    violations = _category_violations(values, lower, upper, include_lower, include_upper)
+    if not violations.any():
+        return True
+
+    for _, codes in iter_chunks(values.codes, chunk_size):
+        if violations[codes].any():
+            return False
+
+    return True
+
+
+def _sparse_in_range(values, lower, upper, include_lower, include_upper, chunk_size):
+    if not in_range(values.sp_values, lower, upper, include_lower, include_upper, chunk_size):
+        return False
+
+    if values.sp_index.npoints == len(values):
+        return True
+
+    # every gap holds the fill value
+    fill = np.array([values.fill_value], dtype=values.sp_values.dtype)
+    return in_range(fill, lower, upper, include_lower, include_upper)
+
+
+def in_range(values, lower=None, upper=None,
+             include_lower=True, include_upper=True,
+             chunk_size=CHUNK_SIZE):
+    """Check that every value of an array lies between the bounds.
+
+    Missing values never violate. The array is scanned chunk by chunk and
+    the scan stops at the first violating chunk. Categorical, sparse,
+    datetime and nullable arrays are checked on their underlying storage.
+    """
+    bounds = (lower, upper, include_lower, include_upper, chunk_size)
+
+    if isinstance(values, pd.Categorical):
+        return _categorical_in_range(values, *bounds)
+
+    if isinstance(values, pd.arrays.SparseArray):
+        return _sparse_in_range(values, *bounds)
+
+    if getattr(values, '_mask', None) is not None and isinstance(values._data, np.ndarray):
+        return _masked_in_range(values, *bounds)
+
+    if _is_datetimelike(values):
+        lower = _int64_bound(values, lower)
+        upper = _int64_bound(values, upper)
+        values = values.asi8
+        check_chunk = _datetime_chunk_in_range
+    elif is_numeric_array(values):
+        check_chunk = _numeric_chunk_in_range
+    else:
+        check_chunk = _generic_chunk_in_range
+
+    for _, chunk in iter_chunks(values, chunk_size):
+        if not check_chunk(chunk, lower, upper, include_lower, include_upper):
+            return False
+
+    return True
+
+
+def frame_in_range(df, lower=None, upper=None,
+                   include_lower=True, include_upper=True,
+                   chunk_size=CHUNK_SIZE):
+    return column_all(
+        df,
+        lambda values: in_range(values, lower, upper,
+                                include_lower, include_upper, chunk_size),
+    )
+
+
+def is_per_column(bound):
+    return isinstance(bound, (dict, pd.Series))
+
+
+def column_bound(bound, label):
+    """Bound of one column from one bound for all or per-column dict / Series."""
+    if not is_per_column(bound):
+        return bound
+
+    bound = bound.get(label)
+    if bound is not None and pd.isna(bound):
+        return None
+    return bound
+
+
+def check_bound_labels(df, *bounds):
+    """Raise KeyError for per-column bounds naming a column not in ``df``."""
+    for bound in bounds:
+        if is_per_column(bound):
+            unknown = [label for label in bound.keys() if label not in df.columns]
+            if unknown:
+                raise KeyError('unknown columns: {}'.format(unknown))
+
+
+def frame_violations(df, lower=None, upper=None,
+                     include_lower=True, include_upper=True,
+                     chunk_size=CHUNK_SIZE):
+    """Return the labels of the columns holding a value outside their bounds.
+
+    Bounds are scalars or per-column dicts / Series; columns without a bound
+    are not scanned. Every column is read in place, without subset copies.
+    """
+    check_bound_labels(df, lower, upper)
+
+    def check(label, values):
+        low, high = column_bound(lower, label), column_bound(upper, label)
+        if low is None and high is None:
+            return True
+        return in_range(values, low, high, include_lower, include_upper, chunk_size)
+
+    passed = column_map(df, check, labels=True)
+    return [label for label, ok in zip(df.columns, passed) if not ok]
+
+
+def _violation_masks(values, lower, upper, include_lower, include_upper, chunk_size):
+    numeric = is_numeric_array(values)
+    for start, chunk in iter_chunks(values, chunk_size):
+        if numeric and _numeric_chunk_in_range(chunk, lower, upper,
+                                               include_lower, include_upper):
+            # cheap reductions prove the chunk clean, skip the mask
+            yield start, None
+            continue
+
+        mask = np.zeros(len(chunk), dtype=bool)
+        if lower is not None:
+            mask |= as_bool_mask(_lower_violation(include_lower)(chunk, lower))
+        if upper is not None:
+            mask |= as_bool_mask(_upper_violation(include_upper)(chunk, upper))
+        yield start, mask
+
+
+def _categorical_masks(values, lower, upper, include_lower, include_upper, chunk_size):
+    violations = _category_violations(values, lower, upper, include_lower, include_upper)
+    for start, codes in iter_chunks(values.codes, chunk_size):
+        yield start, violations[codes]
+
+
+def locate_out_of_range(values, limit, count=False, lower=None, upper=None,
+                        include_lower=True, include_upper=True,
+                        chunk_size=CHUNK_SIZE):
+    """Return (first ``limit`` violating positions, total or None)."""
+    if isinstance(values, pd.Categorical):
+        masks = _categorical_masks(values, lower, upper, include_lower, include_upper,
+                                   chunk_size)
+    else:
+        masks = _violation_masks(values, lower, upper, include_lower, include_upper,
+                                 chunk_size)
+    return first_positions(masks, limit, count)
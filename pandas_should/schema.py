@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from pandas.api import types
+
+from .blocks import column_values
+from .nulls import has_null
+
+# dtype=None accepts any dtype; nullable=False forbids missing values
+Column = namedtuple('Column', ['dtype', 'nullable'])
+Column.__new__.__defaults__ = (None, True)
+
+# generic dtype names accepted besides concrete dtypes
+DTYPE_KINDS = {
+    'numeric': lambda dtype: types.is_numeric_dtype(dtype) and not types.is_bool_dtype(dtype),
+    'integer': types.is_integer_dtype,
+    'float': types.is_float_dtype,
+    'bool': types.is_bool_dtype,
+    'datetime': types.is_datetime64_any_dtype,
+    'timedelta': types.is_timedelta64_dtype,
+    'string': lambda dtype: types.is_string_dtype(dtype) and not types.is_categorical_dtype(dtype),
+    'category': types.is_categorical_dtype,
+    'object': types.is_object_dtype,
+}
+
+
+def dtype_matches(dtype, expect):
+    if isinstance(expect, str) and expect in DTYPE_KINDS:
+        return bool(DTYPE_KINDS[expect](dtype))
+
+    return types.is_dtype_equal(dtype, expect)
+
+
+def _can_hold_null(dtype):
+    return not (isinstance(dtype, np.dtype) and dtype.kind in 'biu')
+
+
+class Schema(object):
+    """Structural expectations checked in O(columns) before any value check.
+
+    ``columns`` maps names to a dtype, a generic kind (see DTYPE_KINDS) or a
+    ``Column``. ``ordered`` requires that order, ``strict`` forbids other
+    columns and ``index`` is an Index class, dtype or kind.
+    """
+
+    def __init__(self, columns, ordered=False, strict=False, index=None):
+        self.columns_ = {
+            name: spec if isinstance(spec, Column) else Column(spec)
+            for name, spec in columns.items()
+        }
+        self.ordered_ = ordered
+        self.strict_ = strict
+        self.index_ = index
+
+    def _index_problems(self, index):
+        expect = self.index_
+        if expect is None:
+            return []
+
+        if isinstance(expect, type) and issubclass(expect, pd.Index):
+            if not isinstance(index, expect):
+                return ['index is {}, expected {}'.format(type(index).__name__, expect.__name__)]
+            return []
+
+        if not dtype_matches(index.dtype, expect):
+            return ['index dtype is {}, expected {}'.format(index.dtype, expect)]
+
+        return []
+
+    def structure_problems(self, df):
+        """Problems found from metadata alone, without reading any values."""
+        problems = []
+        labels = list(df.columns)
+        present = set(labels)
+
+        missing = [name for name in self.columns_ if name not in present]
+        problems.extend('missing column {!r}'.format(name) for name in missing)
+
+        if self.strict_:
+            extra = [label for label in labels if label not in self.columns_]
+            problems.extend('unexpected column {!r}'.format(label) for label in extra)
+
+        if self.ordered_ and not missing:
+            expected = list(self.columns_)
+            actual = [label for label in labels if label in self.columns_]
+            if actual != expected:
+                problems.append('columns are ordered {}, expected {}'.format(actual, expected))
+
+        dtypes = df.dtypes
+        for name, spec in self.columns_.items():
+            if name in present and spec.dtype is not None:
+                if not dtype_matches(dtypes[name], spec.dtype):
+                    problems.append('column {!r} is {}, expected {}'.format(
+                        name, dtypes[name], spec.dtype))
+
+        problems.extend(self._index_problems(df.index))
+        return problems
+
+    def null_problems(self, df):
+        """Columns declared non-nullable that hold missing values.
+
+        Columns whose dtype can't hold missing values are skipped without
+        reading them; the others stop at their first missing value.
+        """
+        problems = []
+        for name, spec in self.columns_.items():
+            if spec.nullable or not _can_hold_null(df[name].dtype):
+                continue
+
+            if has_null(column_values(df[name])):
+                problems.append('column {!r} has missing values'.format(name))
+        return problems
+
+    def problems(self, df):
+        problems = self.structure_problems(df)
+        if problems:
+            # fail fast: never touch the data of a frame with a wrong shape
+            return problems
+
+        return self.null_problems(df)
+
+    def matches(self, df):
+        return not self.problems(df)
@@ -1,17 +1,53 @@
 # -*- coding: utf-8 -*-
 
 import pandas as pd
-from pandas.util.testing import assert_series_equal
+
+from .blocks import column_values
+from .blocks import locate_in_series
+from .distinct import PRECISION
+from .distinct import count_distinct
+from .distinct import have_distinct
+from .drift import MAX_KS
+from .drift import MAX_SHARE_RATIO
+from .drift import MIN_SHARE
+from .drift import SIGMAS
+from .drift import match_distribution
+from .nulls import count_null
+from .nulls import has_null
+from .nulls import locate_null
+from .order import has_max_gap
+from .order import index_is_monotonic
+from .order import is_monotonic
+from .profiling import instrumented
+from .ranges import in_range
+from .ranges import locate_out_of_range
+from .stats import STATS_CACHE
+from .stats import stats_in_range
 
 
 class EqualAccessorMixin(object):
 
-    def equal(self, other_series):
+    def equal(self, other_series, message=False):
+        # comparison utilities are imported on first use to keep
+        # `import pandas_should` cheap
+        from .compare import series_equal
+
+        equal_ = series_equal(self.series_, other_series)
+
+        if not message:
+            return equal_
+
+        if equal_:
+            return equal_, None
+
+        # build the (expensive) diff only when it is asked for
+        from pandas.testing import assert_series_equal
         try:
             assert_series_equal(self.series_, other_series)
-        except AssertionError:
-            return False
-        return True
+        except AssertionError as e:
+            return equal_, str(e)
+
+        return equal_, None
 
     # alias
     be_equal_to = be_equals_to = be_eq_to = eq = equal
@@ -35,23 +71,40 @@ class EqualAccessorMixin(object):
 
 class NullAccessorMixin(object):
 
-    def have_null(self, count=False):
-        have_null_ = self.series_.isnull().any()
+    def _null_count(self):
+        stats = STATS_CACHE.series_stats(self.series_)
+        if stats is None:
+            return count_null(column_values(self.series_))
+
+        return stats.null_count_
+
+    def _has_null(self):
+        stats = STATS_CACHE.series_stats(self.series_)
+        if stats is None:
+            return has_null(column_values(self.series_))
 
+        return stats.null_count_ > 0
+
+    def have_null(self, count=False):
         if not count:
-            return have_null_
+            return self._has_null()
 
-        count = self.series_.isnull().sum()
+        count = self._null_count()
+        have_null_ = count > 0
 
         return have_null_, count
 
     def have_not_null(self):
-        have_null_ = any(self.series_.isnull())
+        have_null_ = self._has_null()
         return not have_null_
 
     # alias
     havent_null = have_not_null
 
+    def locate_null(self, n=10, count=False):
+        """Return the first ``n`` missing values and, optionally, their total."""
+        return locate_in_series(self.series_, locate_null, n, count)
+
 
 class LengthAccessorMixin(object):
 
@@ -65,71 +118,128 @@ class LengthAccessorMixin(object):
 
 class ValueRangeAccessorMixin(object):
 
-    def fall_within_range(self, range_min, range_max):
-        if (self.series_ < range_min).any():
-            return False
+    def _in_range(self, lower=None, upper=None, include_lower=True, include_upper=True):
+        values = column_values(self.series_)
+        stats = STATS_CACHE.series_stats(self.series_)
+        if stats is None:
+            return in_range(values, lower, upper, include_lower, include_upper)
 
-        if (self.series_ > range_max).any():
-            return False
+        return stats_in_range(stats, values, lower, upper, include_lower, include_upper)
 
-        return True
+    def fall_within_range(self, range_min, range_max):
+        return self._in_range(lower=range_min, upper=range_max)
 
     # alias
     value_range = fall_within_range
 
     def greater_than(self, min_value):
-        if (self.series_ <= min_value).any():
-            return False
-
-        return True
+        return self._in_range(lower=min_value, include_lower=False)
 
     # alias
     gt = greater_than
 
     def greater_than_or_equal(self, min_value):
-        if (self.series_ < min_value).any():
-            return False
-
-        return True
+        return self._in_range(lower=min_value)
 
     # alias
     gte = greater_than_or_equal
 
     def less_than(self, max_value):
-        if (self.series_ >= max_value).any():
-            return False
-
-        return True
+        return self._in_range(upper=max_value, include_upper=False)
 
     # alias
     lt = less_than
 
     def less_than_or_equal(self, max_value):
-        if (self.series_ > max_value).any():
-            return False
-
-        return True
+        return self._in_range(upper=max_value)
 
     # alias
     lte = less_than_or_equal
 
+    def locate_out_of_range(self, range_min=None, range_max=None, n=10, count=False,
+                            include_min=True, include_max=True):
+        """Return the first ``n`` values outside the range and, optionally, their total."""
+        def locate(values, limit, count):
+            return locate_out_of_range(values, limit, count, range_min, range_max,
+                                       include_min, include_max)
+
+        return locate_in_series(self.series_, locate, n, count)
+
 
 class ValueVarietyAccessorMixin(object):
 
-    def have_number_of_unique_values(self, size):
-        number_of_unique_values = len(self.series_.unique())
+    def have_number_of_unique_values(self, size, approx=False, precision=PRECISION):
+        values = column_values(self.series_)
+        if approx:
+            return have_distinct(values, size, approx=True, precision=precision)
+
+        stats = STATS_CACHE.series_stats(self.series_)
+        if stats is not None and stats.nunique_ is not None:
+            return stats.nunique_ == size
+
+        # stops counting once more than size values were seen
+        number_of_unique_values = count_distinct(values, limit=size)
+        if stats is not None and number_of_unique_values <= size:
+            stats.nunique_ = number_of_unique_values
+
         return number_of_unique_values == size
 
     # alias
     unique_values = have_number_of_unique_values
 
 
+class OrderAccessorMixin(object):
+
+    def be_monotonic(self, increasing=True, strict=False):
+        return is_monotonic(column_values(self.series_), increasing, strict)
+
+    # alias
+    be_sorted = monotonic = be_monotonic
+
+    def be_monotonic_increasing(self, strict=False):
+        return self.be_monotonic(increasing=True, strict=strict)
+
+    # alias
+    increasing = be_monotonic_increasing
+
+    def be_monotonic_decreasing(self, strict=False):
+        return self.be_monotonic(increasing=False, strict=strict)
+
+    # alias
+    decreasing = be_monotonic_decreasing
+
+    def have_max_gap(self, max_gap):
+        return has_max_gap(column_values(self.series_), max_gap)
+
+    # alias
+    max_gap = have_max_gap
+
+    def have_monotonic_index(self, increasing=True, strict=False):
+        return index_is_monotonic(self.series_.index, increasing, strict)
+
+
+class DriftAccessorMixin(object):
+
+    def match_distribution(self, reference, sigmas=SIGMAS, max_ks=MAX_KS,
+                           max_share_ratio=MAX_SHARE_RATIO, min_share=MIN_SHARE,
+                           problems=False):
+        """Check for drift against a saved DistributionProfile (or its path)."""
+        return match_distribution(self.series_, reference, sigmas, max_ks,
+                                  max_share_ratio, min_share, problems)
+
+    # alias
+    not_drift = match_distribution
+
+
 @pd.api.extensions.register_series_accessor('should')
+@instrumented('series_')
 class ShouldSeriesAccessor(EqualAccessorMixin,
                            NullAccessorMixin,
                            LengthAccessorMixin,
                            ValueRangeAccessorMixin,
-                           ValueVarietyAccessorMixin):
+                           ValueVarietyAccessorMixin,
+                           OrderAccessorMixin,
+                           DriftAccessorMixin):
 
     def __init__(self, series):
         self.series_ = series
@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .blocks import CHUNK_SIZE
+from .blocks import column_values
+from .blocks import is_numeric_array
+from .blocks import iter_chunks
+from .blocks import iter_columns
+from .parallel import column_map
+from .ranges import in_range
+
+
+class ColumnStats(object):
+    """Summary of a single column gathered in one chunked scan.
+
+    ``min_`` and ``max_`` ignore missing values. They are ``None`` when
+    the column has no valid values. ``has_extremes_`` is False when they
+    were not computed or the values are not comparable with each other.
+    """
+
+    def __init__(self, count=0, null_count=0,
+                 min_value=None, max_value=None, has_extremes=True):
+        self.count_ = count
+        self.null_count_ = null_count
+        self.min_ = min_value
+        self.max_ = max_value
+        self.has_extremes_ = has_extremes
+        # filled lazily by the checks that need it
+        self.nunique_ = None
+
+    @property
+    def valid_count(self):
+        return self.count_ - self.null_count_
+
+    def in_range(self, lower=None, upper=None,
+                 include_lower=True, include_upper=True):
+        """Answer a range check from the summary, or None when unknown."""
+        if self.valid_count == 0:
+            return True
+
+        if not self.has_extremes_:
+            return None
+
+        if self.min_ is None:
+            # no valid values, nulls were not counted
+            return True
+
+        lower = _comparable_bound(self.min_, lower)
+        upper = _comparable_bound(self.max_, upper)
+
+        if lower is not None:
+            if self.min_ < lower if include_lower else self.min_ <= lower:
+                return False
+
+        if upper is not None:
+            if self.max_ > upper if include_upper else self.max_ >= upper:
+                return False
+
+        return True
+
+    def merge(self, other):
+        """Add the summary of more rows of the same column."""
+        self.count_ += other.count_
+        self.null_count_ += other.null_count_
+        self.nunique_ = None
+
+        if self.has_extremes_ and other.has_extremes_:
+            try:
+                self.min_ = _merge_extreme(self.min_, other.min_, min)
+                self.max_ = _merge_extreme(self.max_, other.max_, max)
+                return self
+            except TypeError:
+                pass
+
+        self.has_extremes_ = False
+        self.min_ = self.max_ = None
+        return self
+
+
+def _comparable_bound(extreme, bound):
+    """Convert a bound like ``ranges.in_range`` does for datetime-like columns."""
+    if bound is None:
+        return None
+
+    if isinstance(extreme, pd.Timestamp):
+        bound = pd.Timestamp(bound)
+        if (bound.tz is None) != (extreme.tz is None):
+            raise TypeError('cannot compare tz-naive and tz-aware datetimes')
+    elif isinstance(extreme, pd.Timedelta):
+        bound = pd.Timedelta(bound)
+
+    return bound
+
+
+def _merge_extreme(current, candidate, pick):
+    if candidate is None:
+        return current
+
+    if current is None:
+        return candidate
+
+    return pick(current, candidate)
+
+
+def _numeric_chunk(chunk, nulls, extremes):
+    null_count = 0
+    if nulls and chunk.dtype.kind == 'f':
+        null_count = int(np.count_nonzero(np.isnan(chunk)))
+
+    if not extremes or null_count == len(chunk):
+        return null_count, None, None
+
+    lo, hi = np.fmin.reduce(chunk), np.fmax.reduce(chunk)
+    if lo != lo:
+        # an all-NaN chunk, also when nulls are not counted
+        return null_count, None, None
+
+    return null_count, lo, hi
+
+
+def _generic_chunk(chunk, nulls, extremes):
+    mask = np.asarray(pd.isna(chunk), dtype=bool)
+    null_count = int(np.count_nonzero(mask))
+
+    if not extremes or null_count == len(chunk):
+        return null_count, None, None
+
+    if null_count:
+        chunk = chunk[~mask]
+
+    return null_count, chunk.min(), chunk.max()
+
+
+def scan_column(values, nulls=True, extremes=True, chunk_size=CHUNK_SIZE):
+    """Compute null count and min / max of an array in a single pass.
+
+    Categoricals get no min / max: they order by category position, which
+    comparing the values to a bound would not respect.
+    """
+    if isinstance(values, pd.Categorical):
+        extremes = False
+
+    if is_numeric_array(values):
+        scan_chunk = _numeric_chunk
+    else:
+        scan_chunk = _generic_chunk
+
+    stats = ColumnStats(count=len(values), has_extremes=extremes)
+    for _, chunk in iter_chunks(values, chunk_size):
+        try:
+            null_count, lo, hi = scan_chunk(chunk, nulls, stats.has_extremes_)
+            stats.min_ = _merge_extreme(stats.min_, lo, min)
+            stats.max_ = _merge_extreme(stats.max_, hi, max)
+        except TypeError:
+            # values can not be ordered (e.g. mixed objects)
+            stats.has_extremes_ = False
+            stats.min_ = stats.max_ = None
+            null_count, _, _ = scan_chunk(chunk, nulls, False)
+
+        stats.null_count_ += null_count
+
+    return stats
+
+
+def stats_in_range(stats, values, lower=None, upper=None,
+                   include_lower=True, include_upper=True):
+    """Range check answered from stats, scanning values only if needed."""
+    result = stats.in_range(lower, upper, include_lower, include_upper)
+    if result is None:
+        return in_range(values, lower, upper, include_lower, include_upper)
+
+    return result
+
+
+def _array_root(values):
+    """Return the object that owns the memory of a column array."""
+    for attr in ('_ndarray', '_data'):
+        inner = getattr(values, attr, None)
+        if isinstance(inner, np.ndarray):
+            values = inner
+            break
+
+    if not isinstance(values, np.ndarray):
+        return values, None
+
+    pointer = values.__array_interface__['data'][0]
+    while isinstance(values.base, np.ndarray):
+        values = values.base
+
+    return values, pointer
+
+
+# id(array root) -> write version, bumped by pandas' in-place write paths
+_WRITES = {}
+_write_versions = itertools.count(1)
+
+# block manager methods that may write into the existing arrays
+WRITE_METHODS = (
+    'setitem', 'setitem_inplace', 'column_setitem', 'iset', 'putmask',
+    'fillna', 'replace', 'replace_list', 'interpolate',
+)
+
+
+def _record_writes(roots):
+    for root in roots:
+        key = id(root)
+        try:
+            if key not in _WRITES:
+                weakref.finalize(root, _WRITES.pop, key, None)
+        except TypeError:
+            # not weakly referable, such arrays are never cached
+            continue
+        _WRITES[key] = next(_write_versions)
+
+
+def _tracking_writes(method):
+    @functools.wraps(method)
+    def wrapper(mgr, *args, **kwargs):
+        if kwargs.get('inplace') is False:
+            return method(mgr, *args, **kwargs)
+
+        roots = [_array_root(block.values)[0] for block in mgr.blocks]
+        try:
+            return method(mgr, *args, **kwargs)
+        finally:
+            _record_writes(roots)
+
+    wrapper.tracking_writes_ = True
+    return wrapper
+
+
+def _track_writes():
+    """Make the block managers version the arrays they write into."""
+    from pandas.core.internals.managers import BlockManager
+    from pandas.core.internals.managers import SingleBlockManager
+
+    for manager in (BlockManager, SingleBlockManager):
+        for name in WRITE_METHODS:
+            method = getattr(manager, name, None)
+            if method is not None and not getattr(method, 'tracking_writes_', False):
+                setattr(manager, name, _tracking_writes(method))
+
+
+def _fingerprint(obj):
+    if obj.ndim == 1:
+        columns = [column_values(obj)]
+    else:
+        columns = [values for _, values in iter_columns(obj)]
+
+    fingerprint = []
+    for values in columns:
+        root, pointer = _array_root(values)
+        fingerprint.append((root, pointer, len(values), _WRITES.get(id(root))))
+    return fingerprint
+
+
+def _same_arrays(refs, fingerprint):
+    if len(refs) != len(fingerprint):
+        return False
+
+    return all(
+        ref() is root and ref_pointer == pointer and ref_len == length and ref_version == version
+        for (ref, ref_pointer, ref_len, ref_version), (root, pointer, length, version)
+        in zip(refs, fingerprint)
+    )
+
+
+class StatsCache(object):
+    """LRU cache of column statistics shared by every ``should`` accessor.
+
+    Entries are tied to the frame (or series) object, its pandas block
+    manager, the arrays backing each column and their write version.
+    While the cache is enabled pandas' block managers bump that version
+    on every write they make, so ``df[col] = ...``, ``.loc`` / ``.iloc`` /
+    ``.at`` / ``.iat`` assignment, ``s[i] = ...`` and in-place methods
+    invalidate entries, also through views sharing the arrays. Writes
+    that bypass pandas, such as ``df.values[...] = ...``, need an explicit
+    ``invalidate_stats(obj)``.
+
+    ``max_columns`` bounds the total number of cached columns across all
+    objects; 0 disables the cache.
+    """
+
+    def __init__(self, max_columns=0):
+        self.max_columns_ = max_columns
+        self.entries_ = OrderedDict()
+        self.size_ = 0
+        self.lock_ = threading.Lock()
+
+    def _lookup(self, obj):
+        key = id(obj)
+        entry = self.entries_.get(key)
+        if entry is None:
+            return None
+
+        obj_ref, mgr_ref, array_refs, stats = entry
+        if (obj_ref() is obj and mgr_ref() is getattr(obj, '_mgr', None)
+                and _same_arrays(array_refs, _fingerprint(obj))):
+            self.entries_.move_to_end(key)
+            return stats
+
+        self._discard(key)
+        return None
+
+    def _discard(self, key):
+        stats = self.entries_.pop(key)[-1]
+        self.size_ -= len(stats)
+
+    def _store(self, obj, stats):
+        key = id(obj)
+        if key in self.entries_:
+            self._discard(key)
+
+        try:
+            array_refs = [
+                (weakref.ref(root), pointer, length, version)
+                for root, pointer, length, version in _fingerprint(obj)
+            ]
+        except TypeError:
+            # the backing arrays can't be tracked, don't cache
+            return
+
+        self.entries_[key] = (weakref.ref(obj), weakref.ref(obj._mgr), array_refs, stats)
+        self.size_ += len(stats)
+
+        while self.size_ > self.max_columns_ and self.entries_:
+            self._discard(next(iter(self.entries_)))
+
+    def enabled_for(self, obj):
+        if self.max_columns_ <= 0 or getattr(obj, '_mgr', None) is None:
+            return False
+
+        return obj.ndim == 1 or obj.shape[1] <= self.max_columns_
+
+    def frame_stats(self, df):
+        """Return a list of ColumnStats in column order, or None if disabled."""
+        if not self.enabled_for(df):
+            return None
+
+        with self.lock_:
+            stats = self._lookup(df)
+        if stats is not None:
+            return stats
+
+        stats = column_map(df, scan_column)
+        with self.lock_:
+            self._store(df, stats)
+        return stats
+
+    def series_stats(self, series):
+        """Return the ColumnStats of a series, or None if disabled."""
+        if not self.enabled_for(series):
+            return None
+
+        with self.lock_:
+            stats = self._lookup(series)
+        if stats is not None:
+            return stats[0]
+
+        stats = [scan_column(column_values(series))]
+        with self.lock_:
+            self._store(series, stats)
+        return stats[0]
+
+    def invalidate(self, obj):
+        with self.lock_:
+            if id(obj) in self.entries_:
+                self._discard(id(obj))
+
+    def clear(self):
+        with self.lock_:
+            self.entries_.clear()
+            self.size_ = 0
+
+
+STATS_CACHE = StatsCache()
+
+
+def set_stats_cache(max_columns):
+    if max_columns > 0:
+        _track_writes()
+
+    with STATS_CACHE.lock_:
+        STATS_CACHE.max_columns_ = max_columns
+    STATS_CACHE.clear()
+
+
+def invalidate_stats(obj):
+    STATS_CACHE.invalidate(obj)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+import pandas as pd
+
+from .blocks import column_values
+from .distinct import PRECISION
+from .distinct import DistinctCounter
+from .distinct import HyperLogLog
+from .nulls import frame_has_null
+from .ranges import frame_in_range
+
+
+class CheckState(object):
+    """Mergeable per-check state updated one chunk at a time."""
+
+    def update(self, df):
+        raise NotImplementedError()
+
+    def merge(self, other):
+        raise NotImplementedError()
+
+    def decided(self):
+        return False
+
+    def result(self):
+        raise NotImplementedError()
+
+
+class NullState(CheckState):
+
+    def __init__(self, expect_null):
+        self.expect_null_ = expect_null
+        self.found_ = False
+
+    def update(self, df):
+        if not self.found_:
+            self.found_ = frame_has_null(df)
+
+    def merge(self, other):
+        self.found_ = self.found_ or other.found_
+
+    def decided(self):
+        return self.found_
+
+    def result(self):
+        return self.found_ == self.expect_null_
+
+
+class RangeState(CheckState):
+
+    def __init__(self, lower=None, upper=None,
+                 include_lower=True, include_upper=True):
+        self.lower_ = lower
+        self.upper_ = upper
+        self.include_lower_ = include_lower
+        self.include_upper_ = include_upper
+        self.within_ = True
+
+    def update(self, df):
+        if self.within_:
+            self.within_ = frame_in_range(df, self.lower_, self.upper_,
+                                          self.include_lower_, self.include_upper_)
+
+    def merge(self, other):
+        self.within_ = self.within_ and other.within_
+
+    def decided(self):
+        return not self.within_
+
+    def result(self):
+        return self.within_
+
+
+class LengthState(CheckState):
+
+    def __init__(self, expect):
+        self.expect_ = expect
+        self.length_ = 0
+
+    def update(self, df):
+        self.length_ += len(df)
+
+    def merge(self, other):
+        self.length_ += other.length_
+
+    def decided(self):
+        # the total can only grow
+        return self.length_ > self.expect_
+
+    def result(self):
+        return self.length_ == self.expect_
+
+
+class UniqueState(CheckState):
+
+    def __init__(self, size, column=None):
+        self.size_ = size
+        self.column_ = column
+        # stops collecting values once the count passes size
+        self.counter_ = DistinctCounter(limit=size)
+
+    def _select(self, df):
+        if self.column_ is not None:
+            return df[self.column_]
+
+        if df.shape[1] != 1:
+            raise ValueError('need \'column\' for multiple columns')
+
+        return df.iloc[:, 0]
+
+    def update(self, df):
+        if not self.decided():
+            self.counter_.update(column_values(self._select(df)))
+
+    def merge(self, other):
+        self.counter_.merge(other.counter_)
+
+    def decided(self):
+        # the number of unique values can only grow
+        return self.counter_.exceeded()
+
+    def result(self):
+        return self.counter_.count == self.size_
+
+
+class ApproxUniqueState(UniqueState):
+    """Like UniqueState, with a HyperLogLog sketch of constant size."""
+
+    def __init__(self, size, column=None, precision=PRECISION):
+        super(ApproxUniqueState, self).__init__(size, column)
+        self.sketch_ = HyperLogLog(precision)
+
+    def update(self, df):
+        self.sketch_.update(column_values(self._select(df)))
+
+    def merge(self, other):
+        self.sketch_.merge(other.sketch_)
+
+    def decided(self):
+        return False
+
+    def result(self):
+        return self.sketch_.matches(self.size_)
+
+
+class ShouldStream(object):
+    """Runs checks over an iterator of DataFrames in a single pass."""
+
+    def __init__(self, chunks):
+        self.chunks_ = chunks
+        self.checks_ = []
+        self.states_ = []
+
+    def _add(self, state_class, *args):
+        self.checks_.append((state_class, args))
+        self.states_.append(state_class(*args))
+        return self
+
+    def have_null(self):
+        return self._add(NullState, True)
+
+    def have_not_null(self):
+        return self._add(NullState, False)
+
+    # alias
+    havent_null = have_not_null
+
+    def fall_within_range(self, range_min, range_max):
+        return self._add(RangeState, range_min, range_max)
+
+    # alias
+    value_range = fall_within_range
+
+    def have_length(self, expect):
+        return self._add(LengthState, expect)
+
+    # alias
+    rows = rows_len = have_length_of_rows = have_length
+
+    def have_number_of_unique_values(self, size, column=None, approx=False,
+                                     precision=PRECISION):
+        if approx:
+            return self._add(ApproxUniqueState, size, column, precision)
+
+        return self._add(UniqueState, size, column)
+
+    # alias
+    unique_values = have_number_of_unique_values
+
+    def run(self):
+        for chunk in self.chunks_:
+            if isinstance(chunk, pd.Series):
+                chunk = chunk.to_frame()
+
+            pending = [state for state in self.states_ if not state.decided()]
+            if not pending:
+                break
+
+            for state in pending:
+                state.update(chunk)
+
+        return [state.result() for state in self.states_]
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+
+from .parallel import column_map
+from .schema import Schema
+from .stats import scan_column
+from .stats import stats_in_range
+
+CheckResult = namedtuple('CheckResult', ['name', 'args', 'passed'])
+
+
+class ShouldSuite(object):
+    """A set of expectations evaluated together in one scan per column."""
+
+    def __init__(self):
+        self.checks_ = []
+
+    def _add(self, name, *args):
+        self.checks_.append((name, args))
+        return self
+
+    def have_null(self):
+        return self._add('have_null')
+
+    def have_not_null(self):
+        return self._add('have_not_null')
+
+    # alias
+    havent_null = have_not_null
+
+    def fall_within_range(self, range_min, range_max):
+        return self._add('fall_within_range', range_min, range_max)
+
+    # alias
+    value_range = fall_within_range
+
+    def greater_than(self, min_value):
+        return self._add('greater_than', min_value)
+
+    # alias
+    gt = greater_than
+
+    def greater_than_or_equal(self, min_value):
+        return self._add('greater_than_or_equal', min_value)
+
+    # alias
+    gte = greater_than_or_equal
+
+    def less_than(self, max_value):
+        return self._add('less_than', max_value)
+
+    # alias
+    lt = less_than
+
+    def less_than_or_equal(self, max_value):
+        return self._add('less_than_or_equal', max_value)
+
+    # alias
+    lte = less_than_or_equal
+
+    def have_length(self, expect):
+        return self._add('have_length', expect)
+
+    def have_width(self, expect):
+        return self._add('have_width', expect)
+
+    def have_schema(self, schema):
+        """Gate the suite: on a structural mismatch no column is scanned."""
+        if not isinstance(schema, Schema):
+            schema = Schema(schema)
+        return self._add('have_schema', schema)
+
+    # alias
+    match_schema = have_schema
+
+    def plan(self):
+        """Return which column statistics the checks need."""
+        names = set(name for name, _ in self.checks_)
+        nulls = bool(names & NULL_CHECKS)
+        extremes = bool(names & set(RANGE_CHECKS))
+        return nulls, extremes
+
+    def _structure_ok(self, df):
+        return all(
+            not args[0].structure_problems(df)
+            for name, args in self.checks_ if name == 'have_schema'
+        )
+
+    def run(self, df):
+        nulls, extremes = self.plan()
+
+        if not self._structure_ok(df):
+            # value checks on a frame of the wrong shape fail without a scan
+            return [
+                CheckResult(name, args, bool(_evaluate_structure(name, args, df)))
+                for name, args in self.checks_
+            ]
+
+        columns = []
+        if nulls or extremes:
+            columns = column_map(
+                df,
+                lambda values: (values, scan_column(values, nulls=nulls, extremes=extremes)),
+            )
+
+        return [
+            CheckResult(name, args, bool(_evaluate(name, args, df, columns)))
+            for name, args in self.checks_
+        ]
+
+
+NULL_CHECKS = {'have_null', 'have_not_null'}
+
+# name -> (lower, upper, include_lower, include_upper) built from args
+RANGE_CHECKS = {
+    'fall_within_range': lambda args: (args[0], args[1], True, True),
+    'greater_than': lambda args: (args[0], None, False, True),
+    'greater_than_or_equal': lambda args: (args[0], None, True, True),
+    'less_than': lambda args: (None, args[0], True, False),
+    'less_than_or_equal': lambda args: (None, args[0], True, True),
+}
+
+
+def _evaluate_structure(name, args, df):
+    if name in NULL_CHECKS or name in RANGE_CHECKS:
+        return False
+
+    if name == 'have_schema':
+        return not args[0].structure_problems(df)
+
+    return _evaluate(name, args, df, [])
+
+
+def _evaluate(name, args, df, columns):
+    if name in RANGE_CHECKS:
+        bounds = RANGE_CHECKS[name](args)
+        return all(stats_in_range(stats, values, *bounds) for values, stats in columns)
+
+    if name == 'have_null':
+        return any(stats.null_count_ for _, stats in columns)
+
+    if name == 'have_not_null':
+        return not any(stats.null_count_ for _, stats in columns)
+
+    if name == 'have_length':
+        return df.shape[0] == args[0]
+
+    if name == 'have_width':
+        return df.shape[1] == args[0]
+
+    if name == 'have_schema':
+        return args[0].matches(df)
+
+    raise ValueError('unknown check: {}'.format(name))
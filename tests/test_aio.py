@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+import pandas_should  # noqa
+from pandas_should.aio import AsyncShould
+from pandas_should.aio import gather_report
+from pandas_should.aio import run_check
+from pandas_should.blocks import CheckCancelled
+from pandas_should.blocks import cancel_scope
+from pandas_should.ranges import in_range
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsyncShould(object):
+
+    def test_checks(self):
+        df = pd.DataFrame({'a': [1.0, 2.0, None]})
+
+        async def main():
+            should = AsyncShould(df)
+            return await should.have_null(count=True), await AsyncShould(df.a).gt(0)
+
+        assert run(main()) == ((True, {'a': 1}), True)
+
+    def test_gather_report(self):
+        df1 = pd.DataFrame({'a': [1, 2]})
+        df2 = pd.DataFrame({'a': [-1, 2]})
+
+        async def main():
+            with ThreadPoolExecutor(2) as executor:
+                return await gather_report({
+                    'df1': AsyncShould(df1, executor).gte(0),
+                    'df2': AsyncShould(df2, executor).gte(0),
+                    'width': AsyncShould(df2, executor).have_width(1),
+                })
+
+        assert run(main()) == {'df1': True, 'df2': False, 'width': True}
+
+    def test_unknown_check(self):
+        with pytest.raises(AttributeError):
+            AsyncShould(pd.Series([1])).no_such_check
+
+    def test_cancel(self):
+        started = threading.Event()
+        release = threading.Event()
+        stopped = threading.Event()
+        outcome = []
+
+        def slow_check():
+            started.set()
+            release.wait(5)
+            try:
+                # the next chunk notices the cancellation
+                return in_range(np.arange(10), 0, 9, chunk_size=1)
+            except CheckCancelled:
+                outcome.append('cancelled')
+                raise
+            finally:
+                stopped.set()
+
+        async def main():
+            task = asyncio.ensure_future(run_check(slow_check))
+            while not started.is_set():
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            release.set()
+
+        run(main())
+        assert stopped.wait(5)
+        assert outcome == ['cancelled']
+
+
+class TestCancelScope(object):
+
+    def test_stops_scan(self):
+        event = threading.Event()
+        event.set()
+        with cancel_scope(event):
+            with pytest.raises(CheckCancelled):
+                in_range(np.arange(10), 0, 9)
+        assert in_range(np.arange(10), 0, 9)
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from pandas.testing import assert_series_equal
+
+from pandas_should.compare import arrays_equal
+from pandas_should.compare import frames_equal
+from pandas_should.compare import series_equal
+
+
+def assert_equal(left, right, assert_func=assert_frame_equal):
+    try:
+        assert_func(left, right)
+    except AssertionError:
+        return False
+    return True
+
+
+DAYS = pd.date_range('2020-01-01', periods=3)
+UNORDERED = pd.Categorical(['x', 'y', 'x'], categories=['x', 'y'])
+
+
+BASE = pd.DataFrame({
+    'a': [1, 2, 3],
+    'b': [0.1, np.nan, 0.3],
+    'c': ['x', None, 'z'],
+    'd': pd.date_range('2020-01-01', periods=3),
+    'e': pd.array([1, None, 3], dtype='Int64'),
+})
+
+
+class TestFramesEqual(object):
+
+    @pytest.mark.parametrize('right', [
+        BASE.copy(),
+        BASE.assign(b=[0.1 + 1e-9, np.nan, 0.3]),
+        BASE.assign(b=[0.2, np.nan, 0.3]),
+        BASE.assign(a=[1.0, 2.0, 3.0]),
+        BASE.assign(c=['x', None, 'y']),
+        BASE.assign(e=pd.array([1, 2, 3], dtype='Int64')),
+        BASE.rename(columns={'a': 'A'}),
+        BASE.set_index(pd.Index([0, 1, 2])),
+        BASE.set_index(pd.Index([1, 2, 3])),
+        BASE.set_index(pd.Index([0, 1, 2], name='i')),
+        BASE.iloc[:2],
+        BASE[['a', 'b']],
+    ])
+    def test_matches_assert_frame_equal(self, right):
+        assert frames_equal(BASE, right) == assert_equal(BASE, right)
+
+    @pytest.mark.parametrize('left, right', [
+        (pd.DataFrame({'a': [1, 2, 3]}, index=DAYS),
+         pd.DataFrame({'a': [1, 2, 3]}, index=pd.DatetimeIndex(list(DAYS)))),
+        (pd.DataFrame([[1, 2, 3]], columns=DAYS),
+         pd.DataFrame([[1, 2, 3]], columns=pd.DatetimeIndex(list(DAYS)))),
+        (pd.DataFrame(index=DAYS), pd.DataFrame(index=pd.DatetimeIndex(list(DAYS)))),
+        (pd.DataFrame({'a': pd.array([0.3, None], dtype='Float64')}),
+         pd.DataFrame({'a': pd.array([0.1 + 0.2, None], dtype='Float64')})),
+        (pd.DataFrame({'a': pd.array([0.3, None], dtype='Float64')}),
+         pd.DataFrame({'a': pd.array([0.31, None], dtype='Float64')})),
+        (pd.DataFrame({'a': pd.array([0.3, None], dtype='Float64')}),
+         pd.DataFrame({'a': pd.array([None, 0.3], dtype='Float64')})),
+        (pd.DataFrame({'a': pd.Series([0.3, 'x', None], dtype=object)}),
+         pd.DataFrame({'a': pd.Series([0.1 + 0.2, 'x', np.nan], dtype=object)})),
+        (pd.DataFrame({'a': pd.Series([0.3, 'x'], dtype=object)}),
+         pd.DataFrame({'a': pd.Series([0.31, 'x'], dtype=object)})),
+        (pd.DataFrame({'a': pd.Series([1, 'x'], dtype=object)}),
+         pd.DataFrame({'a': pd.Series(['1', 'x'], dtype=object)})),
+        (pd.DataFrame({'a': UNORDERED}),
+         pd.DataFrame({'a': UNORDERED.reorder_categories(['y', 'x'])})),
+        (pd.DataFrame({'a': UNORDERED}), pd.DataFrame({'a': UNORDERED.copy()})),
+        (pd.DataFrame({'a': [1, 2, 3]}, index=pd.CategoricalIndex(UNORDERED)),
+         pd.DataFrame({'a': [1, 2, 3]},
+                      index=pd.CategoricalIndex(UNORDERED.reorder_categories(['y', 'x'])))),
+        (pd.DataFrame({'a': [1]}, index=[0.3]), pd.DataFrame({'a': [1]}, index=[0.1 + 0.2])),
+        (pd.DataFrame({'a': pd.Series(['x', None], dtype='string')}),
+         pd.DataFrame({'a': pd.Series(['x', None], dtype='string')})),
+        (pd.DataFrame({'a': pd.Series(['x', None], dtype='string')}),
+         pd.DataFrame({'a': pd.Series(['y', None], dtype='string')})),
+        (pd.DataFrame({'a': pd.Series(['x', pd.NA], dtype=object)}),
+         pd.DataFrame({'a': pd.Series(['x', pd.NA], dtype=object)})),
+        (pd.DataFrame({'a': pd.Series([np.array([1, 2]), np.array([3])], dtype=object)}),
+         pd.DataFrame({'a': pd.Series([np.array([1, 2]), np.array([3])], dtype=object)})),
+        (pd.DataFrame({'a': pd.Series([np.array([1, 2]), 'x'], dtype=object)}),
+         pd.DataFrame({'a': pd.Series([np.array([1, 3]), 'x'], dtype=object)})),
+        (pd.DataFrame({'a': [1]}).rename_axis(np.nan),
+         pd.DataFrame({'a': [1]}).rename_axis(np.nan)),
+    ])
+    def test_parity_with_assert_frame_equal(self, left, right):
+        assert frames_equal(left, right) == assert_equal(left, right)
+
+    def test_missing_in_other_rows(self):
+        # assert_frame_equal itself raises TypeError on pd.NA here
+        left = pd.DataFrame({'a': pd.Series(['x', pd.NA], dtype=object)})
+        assert not frames_equal(left, pd.DataFrame({'a': pd.Series([pd.NA, 'x'], dtype=object)}))
+        assert not left.should.equal(left.iloc[::-1].reset_index(drop=True))
+
+    def test_not_a_frame(self):
+        assert not frames_equal(BASE, BASE['a'])
+
+
+class TestSeriesEqual(object):
+
+    def test_name(self):
+        assert series_equal(BASE['a'], BASE['a'].copy())
+        assert not series_equal(BASE['a'], BASE['a'].rename('x'))
+
+    def test_dtype(self):
+        assert not series_equal(BASE['a'], BASE['a'].astype('float64'))
+
+    @pytest.mark.parametrize('left, right', [
+        (pd.Series([1, 2, 3], index=DAYS),
+         pd.Series([1, 2, 3], index=pd.DatetimeIndex(list(DAYS)))),
+        (pd.Series(pd.array([0.3], dtype='Float64')),
+         pd.Series(pd.array([0.1 + 0.2], dtype='Float64'))),
+        (pd.Series(UNORDERED), pd.Series(UNORDERED.reorder_categories(['y', 'x']))),
+        (pd.Series([1], name=np.nan), pd.Series([1], name=np.nan)),
+        (pd.Series([1], name=np.nan), pd.Series([1], name=None)),
+        (pd.Series(['x', pd.NA], dtype=object), pd.Series(['x', pd.NA], dtype=object)),
+    ])
+    def test_parity_with_assert_series_equal(self, left, right):
+        assert series_equal(left, right) == assert_equal(left, right, assert_series_equal)
+
+
+class TestArraysEqual(object):
+
+    def test_chunked_mismatch(self):
+        left = np.arange(10)
+        right = left.copy()
+        right[9] = -1
+        assert arrays_equal(left, left.copy(), chunk_size=3)
+        assert not arrays_equal(left, right, chunk_size=3)
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
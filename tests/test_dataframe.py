@@ -20,6 +20,14 @@ class TestEqualAccessorMixin(object):
         df2 = pd.DataFrame([1, 2, 3, 4], columns=['id'])
         assert not df1.should.equal(df2)
 
+    def test_equal_message(self):
+        df1 = pd.DataFrame([1, 2, 3], columns=['id'])
+        df2 = pd.DataFrame([1, 2, 4], columns=['id'])
+        assert df1.should.equal(df1.copy(), message=True) == (True, None)
+        equal, message = df1.should.equal(df2, message=True)
+        assert not equal
+        assert 'id' in message
+
     @pytest.mark.parametrize('alias_name', [
         'be_equal_to', 'be_equals_to', 'be_eq_to', 'eq',
     ])
@@ -156,6 +164,16 @@ class TestNullAccessorMixin(object):
         df = pd.DataFrame([1, 2, 3], columns=['id'])
         assert hasattr(df.should, alias_name)
 
+    def test_locate_null(self):
+        df = pd.DataFrame({
+            'a': [1.0, None, 3.0, None],
+            'b': ['x', None, 'z', 'w'],
+        }, index=list('pqrs'))
+        located = df.should.locate_null(n=2, count=True)
+        assert [(v.row, v.column) for v in located.violations] == [('q', 'a'), ('s', 'a')]
+        assert located.total == 3
+        assert df.should.locate_null(n=1).total is None
+
 
 class TestShapeAccessorMixin(object):
 
@@ -211,6 +229,11 @@ class TestShapeAccessorMixin(object):
         df = pd.DataFrame([1, 2, 3], columns=['id'])
         assert hasattr(df.should, alias_name)
 
+    def test_have_monotonic_index(self):
+        df = pd.DataFrame({'a': [1, 2]}, index=pd.to_datetime(['2020-01-01', '2020-01-02']))
+        assert df.should.have_monotonic_index(strict=True)
+        assert not df.should.have_monotonic_index(increasing=False)
+
 
 class TestValueRangeAccessorMixin(object):
 
@@ -281,6 +304,160 @@ class TestValueRangeAccessorMixin(object):
         df = pd.DataFrame([1, 2, 3], columns=['id'])
         assert hasattr(df.should, alias_name)
 
+    def test_locate_out_of_range(self):
+        df = pd.DataFrame({
+            'a': [1, 5, 3],
+            'b': [-1.0, 2.0, 9.0],
+        })
+        located = df.should.locate_out_of_range(0, 4, n=10, count=True)
+        assert located.violations == [(1, 'a', 5), (0, 'b', -1.0), (2, 'b', 9.0)]
+        assert located.total == 3
+        located = df.should.locate_out_of_range(range_min=1, include_min=False, n=1)
+        assert located.violations == [(0, 'a', 1)]
+        assert located.total is None
+
+    def test_per_column_bounds(self):
+        df = pd.DataFrame({
+            'age': [20, 70, 30],
+            'score': [0.5, None, 1.5],
+        })
+        limits = {'age': 65, 'score': 1.0}
+        assert not df.should.fall_within_range(0, limits)
+        assert df.should.fall_within_range(0, limits, report=True) == (False, ['age', 'score'])
+        assert df.should.lte(pd.Series({'age': 70, 'score': 1.5}))
+        assert df.should.gt({'age': 19}, report=True) == (True, [])
+        assert df.should.gt(0.5, report=True) == (False, ['score'])
+
+    def test_per_column_bounds_cached(self):
+        from pandas_should.stats import set_stats_cache
+        df = pd.DataFrame({'age': [20, 70], 'score': [0.5, 1.5]})
+        set_stats_cache(max_columns=10)
+        try:
+            assert df.should.lt({'age': 70, 'score': 2}, report=True) == (False, ['age'])
+            assert df.should.lt({'age': 71}, report=True) == (True, [])
+        finally:
+            set_stats_cache(max_columns=0)
+
+    def test_sparse_and_categorical(self):
+        df = pd.DataFrame({
+            'sparse': pd.arrays.SparseArray([0, 0, 0, 7], fill_value=0),
+            'category': pd.Categorical([1, 2, None, 2]),
+        })
+        assert df.should.fall_within_range(0, 7)
+        assert not df.should.fall_within_range(1, 7)
+        assert df.should.have_null(count=True) == (True, {'sparse': 0, 'category': 1})
+
+
+class TestValueVarietyAccessorMixin(object):
+
+    def test_have_number_of_unique_values(self):
+        df = pd.DataFrame({'a': [1, 2, 3], 'b': [1, 1, 2]})
+        assert not df.should.have_number_of_unique_values(3)
+        assert df[['a']].should.have_number_of_unique_values(3)
+        assert df.should.have_number_of_unique_values({'a': 3, 'b': 2})
+        assert not df.should.have_number_of_unique_values({'b': 3})
+
+    @pytest.mark.parametrize('alias_name', ['unique_values'])
+    def test_have_number_of_unique_values_aliases(self, alias_name):
+        df = pd.DataFrame([1, 2, 3], columns=['id'])
+        assert hasattr(df.should, alias_name)
+
+
+class TestReferenceAccessorMixin(object):
+
+    def test_have_foreign_key(self):
+        dim = pd.DataFrame({'customer_id': [1, 2, 3]})
+        fact = pd.DataFrame({'cid': [1, 1, 3, None]})
+        assert fact.should.have_foreign_key('cid', dim, 'customer_id')
+        assert not dim.should.have_foreign_key('customer_id', fact, 'cid')
+        assert dim.should.have_foreign_key('customer_id', fact, 'cid', count=True) == (False, 1)
+
+    def test_have_foreign_key_reuses_index(self):
+        from pandas_should.keys import KeyIndex
+        index = KeyIndex(pd.DataFrame({'id': [1, 2]}), 'id')
+        assert pd.DataFrame({'id': [2, 1]}).should.have_foreign_key('id', index)
+        assert not pd.DataFrame({'x': [3]}).should.have_foreign_key('x', index)
+
+    def test_have_unique_key(self):
+        df = pd.DataFrame({
+            'order_id': [1, 1, 2, 2],
+            'line': [1, 2, 1, 1],
+        })
+        assert not df.should.have_unique_key('order_id')
+        assert not df.should.have_unique_key(['order_id', 'line'])
+        assert df.should.have_unique_key(['order_id', 'line'], count=True) == (False, 1)
+        assert df.iloc[:3].should.have_unique_key()
+
+    @pytest.mark.parametrize('alias_name', ['unique_key', 'primary_key'])
+    def test_have_unique_key_aliases(self, alias_name):
+        df = pd.DataFrame([1, 2, 3], columns=['id'])
+        assert hasattr(df.should, alias_name)
+
+    @pytest.mark.parametrize('alias_name', ['references'])
+    def test_have_foreign_key_aliases(self, alias_name):
+        df = pd.DataFrame([1, 2, 3], columns=['id'])
+        assert hasattr(df.should, alias_name)
+
+
+class TestGroupAccessorMixin(object):
+
+    def test_groupby(self):
+        df = pd.DataFrame({'region': ['eu', 'eu', 'us'], 'amount': [10, 20, 30]})
+        assert df.should.groupby('region').fall_within_range(10, 30)
+        assert not df.should.groupby('region').have_length(2)
+        passed, failing = df.should.groupby('region').lte(pd.Series({'eu': 15}), keys=True)
+        assert not passed
+        assert list(failing) == ['eu']
+
+    @pytest.mark.parametrize('alias_name', ['by'])
+    def test_groupby_aliases(self, alias_name):
+        df = pd.DataFrame([1, 2, 3], columns=['id'])
+        assert hasattr(df.should, alias_name)
+
+
+class TestPredicateAccessorMixin(object):
+
+    def test_satisfy(self):
+        df = pd.DataFrame({'a': [0, 1, 5], 'b': [1, 1, 3], 'c': [1.0, None, 2.0]})
+        assert df.iloc[[0]].should.satisfy('0 <= a <= b and notnull(c)')
+        assert not df.should.satisfy('0 <= a <= b and notnull(c)')
+        assert df.should.satisfy('a <= b', engine='pandas', count=True) == (False, 1)
+
+    @pytest.mark.parametrize('alias_name', ['satisfies'])
+    def test_satisfy_aliases(self, alias_name):
+        df = pd.DataFrame([1, 2, 3], columns=['id'])
+        assert hasattr(df.should, alias_name)
+
+
+class TestSchemaAccessorMixin(object):
+
+    def test_have_schema(self):
+        df = pd.DataFrame({'id': [1, 2], 'price': [0.5, None]})
+        assert df.should.have_schema({'id': 'int64', 'price': 'float'})
+        assert not df.should.have_schema({'id': 'int64', 'price': 'object'})
+        assert df.should.have_schema({'name': 'object'}, problems=True) == (
+            False, ["missing column 'name'"])
+
+    @pytest.mark.parametrize('alias_name', ['match_schema'])
+    def test_have_schema_aliases(self, alias_name):
+        df = pd.DataFrame([1, 2, 3], columns=['id'])
+        assert hasattr(df.should, alias_name)
+
+
+class TestDriftAccessorMixin(object):
+
+    def test_match_distribution(self):
+        from pandas_should.drift import DistributionProfile
+        reference = DistributionProfile.build(pd.DataFrame({'c': ['a'] * 9 + ['b']}))
+        df = pd.DataFrame({'c': ['a'] * 6 + ['b'] * 4})
+        assert not df.should.match_distribution(reference)
+        assert df.should.match_distribution(reference, max_share_ratio=5)
+
+    @pytest.mark.parametrize('alias_name', ['not_drift'])
+    def test_match_distribution_aliases(self, alias_name):
+        df = pd.DataFrame([1, 2, 3], columns=['id'])
+        assert hasattr(df.should, alias_name)
+
 
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
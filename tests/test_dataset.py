@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import pandas as pd
+
+from pandas_should.dataset import ShouldDataset
+from pandas_should.dataset import check_partition
+from pandas_should.dataset import list_partitions
+
+
+@pytest.fixture
+def lake(tmp_path):
+    partitions = {
+        'date=1/part-0.csv': pd.DataFrame({'id': [1, 2], 'amount': [1.0, 2.0]}),
+        'date=1/part-1.csv': pd.DataFrame({'id': [3], 'amount': [None]}),
+        'date=2/part-0.csv.gz': pd.DataFrame({'id': [4, 5], 'amount': [3.0, 50.0]}),
+    }
+    for name, df in partitions.items():
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        df.to_csv(path, index=False)
+    (tmp_path / '_SUCCESS').touch()
+    (tmp_path / 'date=1' / 'notes.txt').touch()
+    return tmp_path
+
+
+def checks(dataset):
+    return (dataset
+            .have_length(5)
+            .have_not_null()
+            .fall_within_range(0, 10)
+            .have_number_of_unique_values(5, 'id'))
+
+
+class TestListPartitions(object):
+
+    def test_walks_data_files(self, lake):
+        found = [p[len(str(lake)) + 1:] for p in list_partitions(str(lake))]
+        assert found == ['date=1/part-0.csv', 'date=1/part-1.csv', 'date=2/part-0.csv.gz']
+
+    def test_single_file(self, lake):
+        path = str(lake / 'date=1' / 'part-0.csv')
+        assert list_partitions(path) == [path]
+
+
+class TestCheckPartition(object):
+
+    def test_results(self, lake):
+        dataset = checks(ShouldDataset(lake))
+        states, result = check_partition(str(lake / 'date=1' / 'part-1.csv'), dataset.checks_)
+        assert result.rows == 1
+        # only the nulls are decided by this partition alone
+        assert result.results == [None, False, None, None]
+
+    def test_rows_stop_with_the_checks(self, lake):
+        dataset = ShouldDataset(lake).have_not_null()
+        path = str(lake / 'date=1' / 'part-1.csv')
+        with open(path, 'a') as f:
+            f.write('6,1.0\n')
+        _, result = check_partition(path, dataset.checks_, read_kwargs={'chunksize': 1})
+        # the second chunk was never checked
+        assert result.rows == 1
+        assert result.results == [False]
+
+
+class TestShouldDataset(object):
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_run(self, lake, workers):
+        dataset = checks(ShouldDataset(lake, workers=workers))
+        assert dataset.run() == [True, False, False, True]
+        failures = dataset.failures()
+        assert [result.path[len(str(lake)) + 1:] for result in failures] == [
+            'date=1/part-1.csv', 'date=2/part-0.csv.gz']
+        assert sum(result.rows for result in dataset.report_) == 5
+
+    def test_total_length_across_partitions(self, lake):
+        dataset = ShouldDataset(lake, workers=2).have_length(4).have_length(5)
+        assert dataset.run() == [False, True]
+
+    def test_approx_unique(self, lake):
+        dataset = ShouldDataset(lake).have_number_of_unique_values(5, 'id', approx=True)
+        assert dataset.run() == [True]
+
+    def test_read_kwargs_chunks(self, lake):
+        dataset = ShouldDataset(lake, workers=1, read_kwargs={'chunksize': 1})
+        assert dataset.have_length(5).run() == [True]
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
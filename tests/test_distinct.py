@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas_should.distinct import HyperLogLog
+from pandas_should.distinct import count_distinct
+
+SERIES = [
+    pd.Series([1, 2, 2, 3]),
+    pd.Series([1.0, np.nan, 2.0, np.nan]),
+    pd.Series(['a', None, 'b', 'a', np.nan]),
+    pd.Series(pd.to_datetime(['2020-01-01', None, '2020-01-01'])),
+    pd.Series(pd.array([1, None, 1], dtype='Int64')),
+    pd.Series(pd.Categorical(['x', None, 'y', 'x'])),
+]
+
+
+class TestCountDistinct(object):
+
+    @pytest.mark.parametrize('s', SERIES)
+    def test_matches_unique(self, s):
+        assert count_distinct(s.array, chunk_size=2) == len(s.unique())
+
+    def test_stops_over_limit(self):
+        values = np.arange(1000)
+        assert count_distinct(values, limit=3, chunk_size=10) == 10
+
+
+class TestHyperLogLog(object):
+
+    @pytest.mark.parametrize('size', [10, 1000, 100000])
+    def test_estimate(self, size):
+        values = np.arange(size) * 7
+        sketch = HyperLogLog().update(values)
+        assert sketch.matches(size)
+        assert not sketch.matches(size * 2)
+
+    def test_merge(self):
+        left = HyperLogLog().update(np.arange(0, 60000))
+        right = HyperLogLog().update(np.arange(40000, 100000))
+        assert left.merge(right).matches(100000)
+
+    def test_merge_precision(self):
+        with pytest.raises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+    def test_strings(self):
+        values = np.array(['id-{}'.format(i) for i in range(5000)], dtype=object)
+        assert HyperLogLog().update(values).matches(5000)
+        assert HyperLogLog().update(pd.Series(values).array).matches(5000)
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
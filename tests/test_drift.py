@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas_should.drift import DistributionProfile
+from pandas_should.drift import FrequencyTable
+from pandas_should.drift import QuantileSketch
+from pandas_should.drift import match_distribution
+
+
+@pytest.fixture
+def rng():
+    return np.random.RandomState(0)
+
+
+@pytest.fixture
+def reference(rng):
+    return pd.DataFrame({
+        'amount': rng.normal(size=100000),
+        'country': rng.choice(['jp', 'us', 'fr'], size=100000, p=[0.5, 0.4, 0.1]),
+    })
+
+
+class TestQuantileSketch(object):
+
+    def test_quantiles(self, rng):
+        values = rng.uniform(size=100000)
+        sketch = QuantileSketch().update(values)
+        assert sum(len(items) for items in sketch.levels_) < 3000
+        for q in [0.01, 0.25, 0.5, 0.9, 0.99]:
+            assert sketch.quantile(q) == pytest.approx(q, abs=0.01)
+
+    def test_merge_matches_single_pass(self, rng):
+        values = rng.normal(size=50000)
+        merged = QuantileSketch()
+        for chunk in np.array_split(values, 17):
+            merged.merge(QuantileSketch().update(chunk))
+        assert merged.ks_distance(QuantileSketch().update(values)) < 0.02
+
+    def test_roundtrip(self, rng):
+        sketch = QuantileSketch().update(rng.normal(size=1000))
+        loaded = QuantileSketch.from_dict(sketch.to_dict())
+        assert loaded.ks_distance(sketch) == 0
+
+
+class TestFrequencyTable(object):
+
+    def test_bounded(self):
+        table = FrequencyTable(max_categories=2).update(np.array(['a', 'a', 'a', 'b', 'b', 'c']))
+        assert table.counts_ == {'a': 3, 'b': 2}
+        assert table.total == 6
+
+    def test_share_ratio(self):
+        reference = FrequencyTable().update(np.array(['a'] * 9 + ['b']))
+        current = FrequencyTable().update(np.array(['a'] * 8 + ['b'] * 2))
+        assert current.compare(reference, max_share_ratio=2.5) == []
+        assert current.compare(reference, max_share_ratio=1.5) == [
+            "share of 'b' went from 0.1 to 0.2"]
+
+
+class TestDistributionProfile(object):
+
+    def test_same_distribution(self, rng, reference):
+        profile = DistributionProfile.build(reference)
+        batch = pd.DataFrame({
+            'amount': rng.normal(size=5000),
+            'country': rng.choice(['jp', 'us', 'fr'], size=5000, p=[0.5, 0.4, 0.1]),
+        })
+        assert match_distribution(batch, profile)
+
+    def test_drift(self, rng, reference):
+        profile = DistributionProfile.build(reference)
+        batch = pd.DataFrame({
+            'amount': rng.normal(loc=6, size=5000),
+            'country': rng.choice(['jp', 'us', 'fr'], size=5000, p=[0.4, 0.4, 0.2]),
+        })
+        match, problems = match_distribution(batch, profile, problems=True)
+        assert not match
+        assert [problem.split(':')[0] for problem in problems] == [
+            "column 'amount'", "column 'amount'", "column 'country'"]
+
+    def test_merge_chunks(self, reference):
+        chunks = [DistributionProfile.build(chunk) for chunk in np.array_split(reference, 4)]
+        merged = chunks[0]
+        for chunk in chunks[1:]:
+            merged.merge(chunk)
+        whole = DistributionProfile.build(reference)
+        assert merged.columns_['amount'].mean_ == pytest.approx(whole.columns_['amount'].mean_)
+        assert merged.columns_['amount'].std == pytest.approx(whole.columns_['amount'].std)
+        assert merged.columns_['country'].counts_ == whole.columns_['country'].counts_
+        assert merged.compare(whole) == []
+
+    def test_save_load(self, tmp_path, reference):
+        path = str(tmp_path / 'reference.json')
+        DistributionProfile.build(reference).save(path)
+        assert match_distribution(reference, path)
+
+    def test_missing_column(self, reference):
+        profile = DistributionProfile.build(reference)
+        assert match_distribution(reference[['amount']], profile, problems=True) == (
+            False, ["missing column 'country'"])
+
+    def test_datetime_and_nullable(self):
+        df = pd.DataFrame({
+            'at': pd.date_range('2020-01-01', periods=100, freq='H'),
+            'n': pd.array(list(range(99)) + [None], dtype='Int64'),
+        })
+        profile = DistributionProfile.build(df)
+        assert [summary.kind for summary in profile.columns_.values()] == ['numeric', 'numeric']
+        assert profile.columns_['n'].count_ == 99
+        assert match_distribution(df, profile)
+
+        chunked = DistributionProfile.build(df.assign(at=df['at'].where(df.index != 3)),
+                                            chunk_size=7)
+        assert chunked.columns_['at'].count_ == 99
+        assert chunked.columns_['n'].mean_ == profile.columns_['n'].mean_
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
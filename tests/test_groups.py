@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas_should.groups import GroupedShould
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'region': ['eu', 'eu', 'us', 'us', 'jp'],
+        'customer': [1, 2, 3, 3, 4],
+        'amount': [10.0, 20.0, 5.0, np.nan, 100.0],
+    })
+
+
+def keys(result):
+    passed, failing = result
+    assert passed == (len(failing) == 0)
+    return list(failing)
+
+
+class TestGroupedShould(object):
+
+    def test_range(self, df):
+        grouped = GroupedShould(df, 'region', 'amount')
+        assert keys(grouped.fall_within_range(0, 50, keys=True)) == ['jp']
+        assert keys(grouped.gt(5, keys=True)) == ['us']
+        assert keys(grouped.gte(5, keys=True)) == []
+        assert keys(grouped.lt(20, keys=True)) == ['eu', 'jp']
+        assert grouped.lte(100)
+
+    def test_range_is_one_aggregation(self, df, monkeypatch):
+        calls = []
+        agg = pd.core.groupby.DataFrameGroupBy.agg
+
+        def counting(self, *args, **kwargs):
+            calls.append(args)
+            return agg(self, *args, **kwargs)
+
+        monkeypatch.setattr(pd.core.groupby.DataFrameGroupBy, 'agg', counting)
+        grouped = GroupedShould(df, 'region', ['customer', 'amount'])
+        assert keys(grouped.fall_within_range(0, 50, keys=True)) == ['jp']
+        assert calls == [(['min', 'max'],)]
+
+    def test_range_bounds_by_group(self, df):
+        grouped = GroupedShould(df, 'region', 'amount')
+        limits = pd.Series({'eu': 15, 'us': 10})
+        # jp has no limit
+        assert keys(grouped.lte(limits, keys=True)) == ['eu']
+
+    def test_nulls(self, df):
+        grouped = GroupedShould(df, 'region')
+        assert keys(grouped.have_not_null(keys=True)) == ['us']
+        assert keys(grouped.have_null(keys=True)) == ['eu', 'jp']
+
+    def test_length(self, df):
+        grouped = GroupedShould(df, 'region')
+        assert keys(grouped.have_length(2, keys=True)) == ['jp']
+        assert grouped.have_length(pd.Series({'jp': 1}))
+
+    def test_length_in_range_of_expected_groups(self, df):
+        grouped = GroupedShould(df, 'customer')
+        expected = pd.Series(1, index=pd.Index([1, 2, 3, 4, 5], name='customer'))
+        result = grouped.have_length_in_range(range_min=expected, range_max=1, keys=True)
+        assert keys(result) == [3, 5]
+        assert result[1].name == 'customer'
+
+    def test_unique_values(self, df):
+        grouped = GroupedShould(df, 'region', 'customer')
+        assert keys(grouped.have_number_of_unique_values(2, keys=True)) == ['us', 'jp']
+        assert keys(grouped.unique_values(pd.Series({'eu': 2}), keys=True)) == []
+
+    def test_multiple_keys(self, df):
+        grouped = GroupedShould(df, ['region', 'customer'])
+        assert keys(grouped.have_length(1, keys=True)) == [('us', 3)]
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
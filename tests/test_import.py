@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+
+import pytest
+
+# generous upper bound on top of importing pandas itself
+MAX_IMPORT_SECONDS = 0.5
+
+PROBE = '''
+import sys
+import time
+import pandas
+start = time.perf_counter()
+import pandas_should
+elapsed = time.perf_counter() - start
+print(elapsed)
+print('pandas.util.testing' in sys.modules)
+print('pandas_should.compare' in sys.modules)
+'''
+
+
+def probe():
+    output = subprocess.check_output([sys.executable, '-c', PROBE])
+    elapsed, util_testing, compare = output.decode().split()
+    return float(elapsed), util_testing == 'True', compare == 'True'
+
+
+class TestImport(object):
+
+    def test_no_heavy_modules(self):
+        _, util_testing, compare = probe()
+        assert not util_testing
+        assert not compare
+
+    def test_import_time(self):
+        elapsed = min(probe()[0] for _ in range(3))
+        assert elapsed < MAX_IMPORT_SECONDS
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas_should.incremental import IncrementalValidator
+
+
+class TestIncrementalValidator(object):
+
+    def test_only_new_rows_are_checked(self):
+        validator = IncrementalValidator().have_not_null().fall_within_range(0, 10)
+        df = pd.DataFrame({'a': [1.0, 2.0]})
+        assert validator.validate(df) == [True, True]
+        assert validator.watermark_ == 2
+
+        df = pd.concat([df, pd.DataFrame({'a': [3.0]})], ignore_index=True)
+        assert validator.validate(df) == [True, True]
+
+        # rows before the watermark are not rescanned
+        df.iloc[0, 0] = np.nan
+        assert validator.validate(df) == [True, True]
+
+        df = pd.concat([df, pd.DataFrame({'a': [11.0]})], ignore_index=True)
+        assert validator.validate(df) == [True, False]
+
+    def test_failures_are_remembered(self):
+        validator = IncrementalValidator().have_not_null()
+        df = pd.DataFrame({'a': [None, 1.0]})
+        assert validator.validate(df) == [False]
+        df = pd.concat([df, pd.DataFrame({'a': [2.0]})], ignore_index=True)
+        assert validator.validate(df) == [False]
+
+    def test_length_and_unique(self):
+        validator = IncrementalValidator().have_length(4).have_number_of_unique_values(3)
+        s = pd.Series([1, 2])
+        assert validator.validate(s) == [False, False]
+        s = pd.concat([s, pd.Series([2, 3])], ignore_index=True)
+        assert validator.validate(s) == [True, True]
+
+    def test_not_append_only(self):
+        validator = IncrementalValidator().have_not_null()
+        validator.validate(pd.DataFrame({'a': [1, 2]}))
+        with pytest.raises(ValueError):
+            validator.validate(pd.DataFrame({'a': [1]}))
+        with pytest.raises(ValueError):
+            validator.validate(pd.DataFrame({'b': [1, 2, 3]}))
+
+    def test_reset(self):
+        validator = IncrementalValidator().have_not_null()
+        assert validator.validate(pd.DataFrame({'a': [None]})) == [False]
+        validator.reset()
+        assert validator.validate(pd.DataFrame({'a': [1.0]})) == [True]
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
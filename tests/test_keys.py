@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas_should.keys import KeyIndex
+from pandas_should.keys import count_duplicate_rows
+from pandas_should.keys import hash_rows
+
+
+@pytest.fixture
+def dim():
+    return pd.DataFrame({
+        'region': ['eu', 'eu', 'us', None],
+        'id': [1, 2, 1, 3],
+    })
+
+
+class TestKeyIndex(object):
+
+    def test_single_column(self, dim):
+        index = KeyIndex(dim, 'id')
+        assert len(index) == 3
+        fact = pd.DataFrame({'id': [1, 2, 4, np.nan, 4]})
+        assert index.count_orphans(fact, chunk_size=2) == 2
+        assert index.count_orphans(fact, stop_early=True, chunk_size=2) == 1
+
+    def test_multiple_columns(self, dim):
+        index = KeyIndex(dim, ['region', 'id'])
+        # the row with a missing region is not indexed
+        assert len(index) == 3
+        fact = pd.DataFrame({'r': ['eu', 'us', 'us', None], 'k': [2, 1, 2, 3]})
+        assert index.count_orphans(fact, ['r', 'k']) == 1
+
+    def test_column_count_mismatch(self, dim):
+        with pytest.raises(ValueError):
+            KeyIndex(dim, ['region', 'id']).count_orphans(dim, 'id')
+
+
+class TestDuplicateRows(object):
+
+    @pytest.mark.parametrize('columns', [None, 'a', ['a', 'b'], ['b', 'c']])
+    def test_matches_duplicated(self, columns):
+        df = pd.DataFrame({
+            'a': [1, 1, 2, 1, 2, 3],
+            'b': ['x', 'x', 'y', 'z', 'y', None],
+            'c': [0.5, np.nan, 0.5, np.nan, 0.5, np.nan],
+        })
+        expect = df.duplicated(subset=columns).sum()
+        assert count_duplicate_rows(df, columns, chunk_size=4) == expect
+        for chunk_size in (2, 4, 10):
+            found = count_duplicate_rows(df, columns, stop_early=True, chunk_size=chunk_size)
+            assert found == int(expect > 0)
+
+    def test_stop_early_hashes_lazily(self, monkeypatch):
+        import pandas_should.keys
+        hashed = []
+        hash_chunk = pandas_should.keys._hash_chunk
+
+        def counting(df, columns, start, stop):
+            hashed.append(start)
+            return hash_chunk(df, columns, start, stop)
+
+        monkeypatch.setattr(pandas_should.keys, '_hash_chunk', counting)
+        df = pd.DataFrame({'a': [1, 1] + list(range(2, 100))})
+        assert count_duplicate_rows(df, stop_early=True, chunk_size=10) == 1
+        assert hashed == [0]
+
+    def test_stop_early_hash_collisions(self, monkeypatch):
+        import pandas_should.keys
+
+        def colliding(df, columns, start, stop):
+            return np.zeros(len(df.iloc[start:stop]), dtype='uint64')
+
+        monkeypatch.setattr(pandas_should.keys, '_hash_chunk', colliding)
+        assert count_duplicate_rows(pd.DataFrame({'a': [1, 2, 3]}), stop_early=True) == 0
+        df = pd.DataFrame({'a': [1, 2, 3, 2]})
+        assert count_duplicate_rows(df, stop_early=True, chunk_size=2) == 1
+
+    def test_hash_rows_chunked(self):
+        df = pd.DataFrame({'a': range(10), 'b': list('abcdeabcde')})
+        expect = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        assert (hash_rows(df, chunk_size=3) == expect).all()
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas_should.nulls import count_null
+from pandas_should.nulls import frame_count_null
+from pandas_should.nulls import frame_has_null
+from pandas_should.nulls import has_null
+from pandas_should.nulls import locate_null
+
+SERIES = [
+    pd.Series([1, 2, 3]),
+    pd.Series([True, False]),
+    pd.Series([1.0, np.nan, 3.0, np.nan]),
+    pd.Series([1.0, 2.0, 3.0]),
+    pd.Series(pd.to_datetime(['2020-01-01', None, '2020-01-03'])),
+    pd.Series(pd.to_datetime(['2020-01-01', None])).dt.tz_localize('UTC'),
+    pd.Series(pd.to_timedelta(['1 day', None])),
+    pd.Series(pd.array([1, None, 3], dtype='Int64')),
+    pd.Series(pd.array([True, None], dtype='boolean')),
+    pd.Series(pd.array(['a', None], dtype='string')),
+    pd.Series(pd.Categorical(['a', None, 'b'])),
+    pd.Series(pd.Categorical(['a', 'b'])),
+    pd.Series(['a', None, np.nan]),
+    pd.Series(['a', 'b']),
+    pd.Series(pd.arrays.SparseArray([0, 0, np.nan, 1, 0], fill_value=0)),
+    pd.Series(pd.arrays.SparseArray([np.nan, 1.0, np.nan, 2.0])),
+    pd.Series(pd.arrays.SparseArray([np.nan, np.nan])),
+]
+
+
+class TestHasNull(object):
+
+    @pytest.mark.parametrize('s', SERIES)
+    def test_matches_isnull(self, s):
+        assert has_null(s.array, chunk_size=1) == s.isnull().any()
+
+    @pytest.mark.parametrize('s', SERIES)
+    def test_count_matches_isnull(self, s):
+        assert count_null(s.array, chunk_size=2) == s.isnull().sum()
+
+    @pytest.mark.parametrize('s', SERIES)
+    def test_locate_matches_isnull(self, s):
+        expect = list(np.flatnonzero(s.isnull().to_numpy()))
+        assert locate_null(s.array, 10, True, chunk_size=3) == (expect, len(expect))
+
+    def test_numpy_float(self):
+        values = np.array([1.0, 2.0, np.nan])
+        assert has_null(values, chunk_size=2)
+        assert count_null(values) == 1
+
+
+class TestFrame(object):
+
+    def test_frame(self):
+        df = pd.DataFrame({'a': [1, 2], 'b': [np.nan, 1.0]})
+        assert frame_has_null(df)
+        assert frame_count_null(df) == {'a': 0, 'b': 1}
+        assert not frame_has_null(df[['a']])
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas_should.order import has_max_gap
+from pandas_should.order import index_is_monotonic
+from pandas_should.order import is_monotonic
+
+SERIES = [
+    pd.Series([1, 2, 2, 3]),
+    pd.Series([3, 2, 1]),
+    pd.Series([1, 3, 2]),
+    pd.Series([1.0, np.nan, 3.0]),
+    pd.Series(np.array([1, 2, 3], dtype='uint8')),
+    pd.Series(pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-02'])),
+    pd.Series(pd.to_datetime(['2020-01-01', None])),
+    pd.Series(pd.array([1, 2, 3], dtype='Int64')),
+    pd.Series(pd.array([1, None, 3], dtype='Int64')),
+    pd.Series(['a', 'b', 'b']),
+    pd.Series(pd.Categorical(['lo', 'hi'], categories=['lo', 'hi'], ordered=True)),
+]
+
+
+class TestIsMonotonic(object):
+
+    @pytest.mark.parametrize('s', SERIES)
+    @pytest.mark.parametrize('increasing', [True, False])
+    def test_matches_pandas(self, s, increasing):
+        expect = s.is_monotonic_increasing if increasing else s.is_monotonic_decreasing
+        assert is_monotonic(s.array, increasing, chunk_size=1) == expect
+
+    @pytest.mark.parametrize('s', SERIES)
+    def test_strict_matches_pandas(self, s):
+        expect = s.is_monotonic_increasing and s.is_unique
+        assert is_monotonic(s.array, strict=True, chunk_size=2) == expect
+
+    def test_unordered_categorical(self):
+        with pytest.raises(TypeError):
+            is_monotonic(pd.Categorical(['a', 'b']))
+
+
+class TestHasMaxGap(object):
+
+    def test_numeric(self):
+        values = np.array([1, 2, 4, 7], dtype='uint8')
+        assert has_max_gap(values, 3, chunk_size=2)
+        assert not has_max_gap(values, 2, chunk_size=2)
+
+    def test_datetime(self):
+        values = pd.Series(pd.to_datetime(['2020-01-01 00:00', '2020-01-01 00:05',
+                                           '2020-01-01 00:20'])).array
+        assert has_max_gap(values, '15min')
+        assert not has_max_gap(values, pd.Timedelta(minutes=10))
+
+
+class TestIndexIsMonotonic(object):
+
+    def test_flags(self):
+        index = pd.Index([1, 2, 2])
+        assert index_is_monotonic(index)
+        assert not index_is_monotonic(index, strict=True)
+        assert not index_is_monotonic(index, increasing=False)
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+import pandas_should  # noqa
+from pandas_should.blocks import iter_chunks
+from pandas_should.parallel import column_all
+from pandas_should.parallel import column_map
+from pandas_should.parallel import get_parallel
+from pandas_should.parallel import parallel
+
+
+@pytest.fixture
+def df():
+    data = np.arange(200, dtype='float64').reshape(20, 10)
+    data[5, 7] = np.nan
+    return pd.DataFrame(data)
+
+
+class TestParallel(object):
+
+    def test_context_restores(self):
+        before = get_parallel()
+        with parallel(workers=4, min_size=0):
+            assert get_parallel() == (4, 0)
+        assert get_parallel() == before
+
+    def test_accessor_results(self, df):
+        serial = (
+            df.should.fall_within_range(0, 199),
+            df.should.gt(0),
+            df.should.have_null(count=True),
+            df.should.lte({3: 60, 8: 100}, report=True),
+        )
+        with parallel(workers=4, min_size=0):
+            assert (
+                df.should.fall_within_range(0, 199),
+                df.should.gt(0),
+                df.should.have_null(count=True),
+                df.should.lte({3: 60, 8: 100}, report=True),
+            ) == serial
+
+    def test_column_all_short_circuit(self, df):
+        with parallel(workers=2, min_size=0):
+            assert not column_all(df, lambda values: values[0] != 3)
+            assert column_all(df, lambda values: values[0] < 10)
+
+    def test_column_all_stops_running_columns(self):
+        df = pd.DataFrame({'fails': np.ones(100), 'long': np.zeros(100)})
+        scanned, done = [], threading.Event()
+
+        def check(values):
+            if values[0] == 1:
+                # give the long column time to start
+                time.sleep(0.05)
+                return False
+            try:
+                for _ in iter_chunks(values, chunk_size=1):
+                    scanned.append(1)
+                    time.sleep(0.01)
+                return True
+            finally:
+                done.set()
+
+        with parallel(workers=2, min_size=0):
+            assert not column_all(df, check)
+            assert done.wait(5)
+        assert 0 < len(scanned) < 100
+
+    def test_column_map_keeps_order(self, df):
+        with parallel(workers=3, min_size=0):
+            assert column_map(df, lambda values: values[0]) == list(df.iloc[0])
+
+    def test_column_map_labels(self, df):
+        with parallel(workers=3, min_size=0):
+            assert column_map(df, lambda label, values: label, labels=True) == list(df.columns)
+
+    def test_below_min_size_is_serial(self, df):
+        with parallel(workers=2, min_size=df.size + 1):
+            assert column_all(df, lambda values: True)
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
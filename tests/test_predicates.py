@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas_should.predicates import Predicate
+from pandas_should.predicates import count_failing
+from pandas_should.predicates import kernel_source
+from pandas_should.predicates import resolve_engine
+from pandas_should.predicates import to_numexpr
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'a': [0, 1, 5, 2],
+        'b': [1, 1, 3, 3],
+        'c': [1.0, np.nan, 2.0, 3.0],
+    })
+
+
+EXPR = '0 <= a <= b and notnull(c)'
+
+
+class TestPredicate(object):
+
+    def test_columns(self):
+        assert Predicate(EXPR).columns_ == ['a', 'b', 'c']
+
+    @pytest.mark.parametrize('expr', [
+        'a.sum() > 0',
+        'f(a)',
+        'a in b',
+        'lambda: a',
+    ])
+    def test_unsupported(self, expr):
+        with pytest.raises(ValueError):
+            Predicate(expr)
+
+    def test_to_numexpr(self):
+        assert to_numexpr(Predicate(EXPR).tree_) == '(((0 <= a) & (a <= b)) & (c == c))'
+
+    def test_to_numexpr_constants(self):
+        assert to_numexpr(Predicate('a > 0 or 1').tree_) == '(((a > 0)) | True)'
+        assert to_numexpr(Predicate('not 0').tree_) == '(~False)'
+
+    def test_kernel_source(self, df):
+        namespace = {}
+        exec(kernel_source(Predicate(EXPR)), namespace)
+        arrays = [df[column].to_numpy() for column in 'abc']
+        assert namespace['kernel'](*arrays, False) == 2
+        assert namespace['kernel'](*arrays, True) == 1
+
+
+class TestCountFailing(object):
+
+    @pytest.mark.parametrize('chunk_size', [1, 3, 10])
+    def test_pandas(self, df, chunk_size):
+        assert count_failing(df, EXPR, 'pandas', chunk_size=chunk_size) == 2
+        assert count_failing(df, EXPR, 'pandas', stop_early=True, chunk_size=1) == 1
+
+    @pytest.mark.parametrize('expr, expect', [
+        ('not (a > 1) or -b > -3', 2),
+        ('a * 2 >= b', 1),
+        ('isnull(c) or c % 2 == 1', 1),
+        ('1 < 2', 0),
+        ('1 > 2', 4),
+        ('not 1 > 0', 4),
+        ('a > 0 or 1', 0),
+        ('a > 0 and 0', 4),
+        ("not '' and a > 0", 1),
+    ])
+    def test_expressions(self, df, expr, expect):
+        assert count_failing(df, expr, 'pandas') == expect
+
+    def test_nullable_and_objects(self):
+        df = pd.DataFrame({
+            'n': pd.array([1, None, 3], dtype='Int64'),
+            's': ['x', 'y', None],
+        })
+        assert count_failing(df, 'n > 0') == 1
+        assert count_failing(df, "s == 'x' or isnull(s)") == 1
+
+    def test_unknown_column(self, df):
+        with pytest.raises(KeyError):
+            count_failing(df, 'z > 0')
+
+    @pytest.mark.parametrize('engine', ['numba', 'numexpr'])
+    def test_compiled(self, df, engine):
+        pytest.importorskip(engine)
+        assert count_failing(df, EXPR, engine) == 2
+        assert count_failing(df, EXPR, engine, stop_early=True) == 1
+
+
+class TestResolveEngine(object):
+
+    def test_falls_back_to_pandas(self):
+        arrays = {'s': pd.Series(['x']).array}
+        assert resolve_engine('auto', Predicate('s > 0'), arrays) == 'pandas'
+        assert resolve_engine('auto', Predicate("a == 'x'"), {}) == 'pandas'
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            resolve_engine('cython', Predicate('a > 0'), {})
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
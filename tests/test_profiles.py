@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import gc
+import os
+import weakref
+
+import pytest
+
+import pandas as pd
+
+import pandas_should.profiles
+from pandas_should.profiles import FileProfile
+from pandas_should.profiles import ProfileCache
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'id': [1, 2, 3],
+        'amount': [0.5, None, 2.0],
+        'name': ['x', 'y', None],
+        'at': pd.date_range('2020-01-01', periods=3, tz='Asia/Tokyo'),
+    })
+
+
+@pytest.fixture
+def csv(tmp_path, df):
+    path = str(tmp_path / 'data.csv')
+    df.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ProfileCache(str(tmp_path / 'cache'))
+
+
+def no_reads(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('parsed a file with a cached profile')
+
+    monkeypatch.setattr(pandas_should.profiles, '_read', fail)
+
+
+class TestFileProfile(object):
+
+    def test_roundtrip(self, df):
+        profile = FileProfile.build([df.iloc[:2], df.iloc[2:]], key=['k'])
+        loaded = FileProfile.from_bytes(profile.to_bytes())
+        assert loaded.rows_ == 3
+        assert loaded.key_ == ['k']
+        for label, column in loaded.columns_.items():
+            original = profile.columns_[label]
+            assert column.stats_.min_ == original.stats_.min_
+            assert column.stats_.max_ == original.stats_.max_
+            assert column.stats_.null_count_ == original.stats_.null_count_
+            assert column.stats_.nunique_ == 3
+            assert (column.sketch_.registers_ == original.sketch_.registers_).all()
+
+    def test_one_frame_at_a_time(self, df):
+        previous = []
+
+        def frames():
+            for start in range(3):
+                # only the frame being profiled may still be alive
+                gc.collect()
+                assert all(ref() is None for ref in previous[:-1])
+                chunk = df.iloc[start:start + 1].copy()
+                previous.append(weakref.ref(chunk))
+                yield chunk
+                del chunk
+
+        profile = FileProfile.build(frames())
+        whole = FileProfile.build([df])
+        assert profile.rows_ == 3
+        for label, column in profile.columns_.items():
+            assert column.stats_.min_ == whole.columns_[label].stats_.min_
+            assert column.stats_.null_count_ == whole.columns_[label].stats_.null_count_
+
+    def test_compact(self, df):
+        assert len(FileProfile.build([df]).to_bytes()) < 1024
+
+    def test_rejects_other_formats(self):
+        with pytest.raises(ValueError):
+            FileProfile.from_bytes(b'garbage')
+
+
+class TestProfileCache(object):
+
+    def test_hit_skips_parsing(self, cache, csv, monkeypatch):
+        cache.profile(csv)
+        no_reads(monkeypatch)
+        should = cache.should(csv)
+        assert should.have_length(3)
+        assert should.have_null()
+        assert should.have_number_of_unique_values({'id': 3})
+        assert should.have_number_of_unique_values(3, approx=True)
+
+    def test_range_from_profile(self, cache, tmp_path, monkeypatch):
+        path = str(tmp_path / 'numbers.csv')
+        pd.DataFrame({'a': [1, 2], 'b': [0.5, None]}).to_csv(path, index=False)
+        cache.profile(path)
+        no_reads(monkeypatch)
+        should = cache.should(path)
+        assert should.fall_within_range(0, 2)
+        assert not should.gt(0.5)
+        assert should.lte(2)
+
+    def test_datetime_range_from_profile(self, cache, tmp_path, monkeypatch):
+        path = str(tmp_path / 'dates.csv')
+        pd.DataFrame({'at': pd.date_range('2019-01-02', periods=3)}).to_csv(path, index=False)
+        read_kwargs = {'parse_dates': ['at']}
+        cache.profile(path, read_kwargs=read_kwargs)
+        no_reads(monkeypatch)
+        should = cache.should(path, read_kwargs=read_kwargs)
+        assert should.gte('2019-01-01')
+        assert not should.gt('2019-01-02')
+
+    def test_changed_file_is_profiled_again(self, cache, csv):
+        assert cache.profile(csv).rows_ == 3
+        pd.DataFrame({'id': [1]}).to_csv(csv, index=False)
+        assert cache.profile(csv).rows_ == 1
+
+    def test_unknown_answers_read_the_file(self, cache, tmp_path):
+        path = str(tmp_path / 'mixed.csv')
+        pd.DataFrame({'a': [1, 2]}).to_csv(path, index=False)
+        profile = cache.profile(path)
+        profile.columns_['a'].stats_.has_extremes_ = False
+        cache.put(profile)
+        assert cache.should(path).fall_within_range(1, 2)
+
+    def test_eviction(self, tmp_path, df):
+        cache = ProfileCache(str(tmp_path / 'cache'), max_bytes=1000)
+        paths = []
+        for i in range(4):
+            path = str(tmp_path / '{}.csv'.format(i))
+            df.iloc[:i + 1].to_csv(path, index=False)
+            paths.append(path)
+            cache.profile(path)
+        assert sum(size for _, size, _ in cache._entries()) <= 1000
+        assert cache.get(paths[-1]) is not None
+        assert cache.get(paths[0]) is None
+
+    def test_corrupt_entry_is_dropped(self, cache, csv):
+        cache.profile(csv)
+        (_, _, entry), = cache._entries()
+        with open(entry, 'wb') as f:
+            f.write(b'PSPF')
+        assert cache.get(csv) is None
+        assert not os.path.exists(entry)
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
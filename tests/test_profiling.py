@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+import pandas_should  # noqa
+from pandas_should.profiling import JsonLinesSink
+from pandas_should.profiling import LoggingSink
+from pandas_should.profiling import add_sink
+from pandas_should.profiling import profile
+from pandas_should.profiling import remove_sink
+
+
+class TestProfile(object):
+
+    def test_records_checks(self):
+        df = pd.DataFrame({'a': np.arange(10, dtype='float64')})
+        with profile() as sink:
+            assert df.should.gt(-1)
+            assert df.a.should.have_not_null()
+        records = sink.records_
+        assert [r.name for r in records] == ['greater_than', 'have_not_null']
+        assert [r.kind for r in records] == ['DataFrame', 'Series']
+        assert records[0].shape == (10, 1)
+        assert records[0].bytes_scanned == 80
+        assert records[0].peak_bytes is None
+        assert sink.summary()['greater_than'][0] == 1
+
+    def test_nested_checks_recorded_once(self):
+        df = pd.DataFrame({'a': [1, 2]})
+        with profile() as sink:
+            df.should.neq(df)
+        assert [r.name for r in sink.records_] == ['not_equal']
+
+    def test_trace_memory(self):
+        df = pd.DataFrame({'a': np.arange(100000)})
+        with profile(trace_memory=True) as sink:
+            df.should.equal(df.copy())
+        assert sink.records_[0].peak_bytes >= 0
+
+    def test_disabled(self):
+        records = []
+        add_sink(records.append)
+        remove_sink(records.append)
+        pd.Series([1]).should.have_length(1)
+        assert records == []
+
+    def test_logging_sink(self, caplog):
+        with caplog.at_level(logging.INFO, logger='pandas_should'):
+            with profile(LoggingSink()):
+                pd.Series([1, 2]).should.have_length(2)
+        assert 'should.have_length Series(2,)' in caplog.text
+
+    def test_json_lines_sink(self, tmpdir):
+        path = str(tmpdir.join('checks.jsonl'))
+        with profile(JsonLinesSink(path)):
+            pd.Series([1, 2]).should.have_length(2)
+            pd.Series([1, 2]).should.gt(0)
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        assert [line['name'] for line in lines] == ['have_length', 'greater_than']
+        assert lines[0]['shape'] == [2]
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
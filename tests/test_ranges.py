@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas_should.ranges import frame_in_range
+from pandas_should.ranges import frame_violations
+from pandas_should.ranges import in_range
+from pandas_should.ranges import locate_out_of_range
+
+
+class TestInRange(object):
+
+    @pytest.mark.parametrize('lower, upper, expect', [
+        (0, 9, True),
+        (1, 9, False),
+        (0, 8, False),
+        (None, 9, True),
+        (0, None, True),
+    ])
+    def test_chunked(self, lower, upper, expect):
+        values = np.arange(10, dtype='float64')
+        assert in_range(values, lower, upper, chunk_size=3) == expect
+
+    def test_exclusive_bounds(self):
+        values = np.array([1, 2, 3])
+        assert not in_range(values, lower=1, include_lower=False)
+        assert not in_range(values, upper=3, include_upper=False)
+        assert in_range(values, lower=0, upper=4,
+                        include_lower=False, include_upper=False)
+
+    def test_nan_is_ignored(self):
+        values = np.array([np.nan, 0.5, np.nan])
+        assert in_range(values, 0, 1, chunk_size=1)
+
+    def test_datetime(self):
+        values = pd.Series(pd.date_range('2020-01-01', periods=5)).array
+        assert in_range(values, pd.Timestamp('2020-01-01'), pd.Timestamp('2020-01-05'))
+        assert not in_range(values, upper=pd.Timestamp('2020-01-04'), chunk_size=2)
+
+    def test_nullable(self):
+        values = pd.array([1, None, 3], dtype='Int64')
+        assert in_range(values, 1, 3)
+        assert not in_range(values, 2, 3)
+
+    @pytest.mark.parametrize('lower, upper, expect', [
+        (1, 3, True),
+        (2, 3, False),
+        (1, 2, False),
+    ])
+    def test_unordered_categorical(self, lower, upper, expect):
+        values = pd.Categorical([3, 1, None, 2], categories=[1, 2, 3, 4])
+        assert in_range(values, lower, upper, chunk_size=1) == expect
+
+    def test_ordered_categorical(self):
+        values = pd.Categorical(['lo', 'hi', 'mid'], categories=['lo', 'mid', 'hi'], ordered=True)
+        assert in_range(values, 'lo', 'hi')
+        assert not in_range(values, 'mid')
+        with pytest.raises(TypeError):
+            in_range(values, 'other')
+
+    @pytest.mark.parametrize('lower, upper, expect', [
+        (0, 5, True),
+        (1, 5, False),
+        (None, 4, False),
+        (-1, None, True),
+    ])
+    def test_sparse(self, lower, upper, expect):
+        values = pd.arrays.SparseArray([0, 0, 1, np.nan, 0, 5], fill_value=0)
+        assert in_range(values, lower, upper) == expect
+
+    def test_sparse_without_gaps_ignores_fill(self):
+        values = pd.arrays.SparseArray([1, 2], fill_value=0, kind='integer')
+        assert values.sp_index.npoints == 2
+        assert in_range(values, 1, 2)
+
+    def test_datetime_nat(self):
+        values = pd.Series(pd.to_datetime(['2020-01-02', None, '2020-01-05'])).array
+        assert in_range(values, '2020-01-02', '2020-01-05', chunk_size=1)
+        assert not in_range(values, '2020-01-03')
+        assert in_range(values[1:2], '2030-01-01')
+
+    def test_datetime_tz(self):
+        values = pd.Series(pd.date_range('2020-01-01', periods=2, tz='UTC')).array
+        assert not in_range(values, upper=pd.Timestamp('2020-01-02', tz='Asia/Tokyo'))
+        with pytest.raises(TypeError):
+            in_range(values, pd.Timestamp('2020-01-01'))
+
+    def test_timedelta(self):
+        values = pd.Series(pd.to_timedelta([1, 2, None], unit='s')).array
+        assert in_range(values, '1s', '2s')
+        assert not in_range(values, upper='2s', include_upper=False)
+
+    def test_nullable_mask_hides_data(self):
+        values = pd.array([5, None, 1], dtype='Int64')
+        values._data[1] = 100
+        assert in_range(values, 1, 5, chunk_size=1)
+        assert in_range(values, 1, 5)
+
+
+class TestFrameInRange(object):
+
+    def test_mixed_dtypes(self):
+        df = pd.DataFrame({
+            'a': [1, 2, 3],
+            'b': [0.5, np.nan, 2.5],
+        })
+        assert frame_in_range(df, 0, 3)
+        assert not frame_in_range(df, 1, 3)
+
+
+class TestFrameViolations(object):
+
+    @pytest.fixture
+    def df(self):
+        return pd.DataFrame({
+            'age': [20, 70, 30],
+            'score': [0.5, np.nan, 1.5],
+            'name': ['a', 'b', 'c'],
+        })
+
+    def test_per_column_bounds(self, df):
+        lower = {'age': 0, 'score': 0}
+        upper = pd.Series({'age': 65, 'score': 1.0})
+        assert frame_violations(df, lower, upper) == ['age', 'score']
+        assert frame_violations(df, lower, {'age': 70, 'score': np.nan}) == []
+
+    def test_scalar_and_per_column(self, df):
+        assert frame_violations(df[['age', 'score']], 0, {'age': 70}) == []
+        assert frame_violations(df[['age', 'score']], 1, {'age': 70}) == ['score']
+
+    def test_unbounded_columns_are_not_scanned(self, df, monkeypatch):
+        import pandas_should.ranges
+        scanned = []
+        in_range = pandas_should.ranges.in_range
+
+        def spy(values, *args):
+            scanned.append(values)
+            return in_range(values, *args)
+
+        monkeypatch.setattr(pandas_should.ranges, 'in_range', spy)
+        frame_violations(df, {'age': 0})
+        assert len(scanned) == 1
+        assert np.shares_memory(scanned[0], df['age'].to_numpy())
+
+    def test_unknown_column(self, df):
+        with pytest.raises(KeyError):
+            frame_violations(df, {'height': 0})
+
+
+class TestLocateOutOfRange(object):
+
+    def test_bounded_by_limit(self):
+        values = np.arange(100, dtype='float64')
+        positions, total = locate_out_of_range(values, 3, lower=10, upper=89, chunk_size=7)
+        assert positions == [0, 1, 2]
+        assert total is None
+
+    def test_count(self):
+        values = np.arange(100)
+        positions, total = locate_out_of_range(values, 2, True, upper=89, chunk_size=7)
+        assert positions == [90, 91]
+        assert total == 10
+
+    def test_nullable(self):
+        values = pd.array([None, 5, 1], dtype='Int64')
+        assert locate_out_of_range(values, 5, True, upper=2) == ([1], 1)
+
+    def test_categorical(self):
+        values = pd.Categorical([3, 1, None, 2, 3])
+        assert locate_out_of_range(values, 5, True, lower=2, chunk_size=2) == ([1], 1)
+        assert locate_out_of_range(values, 1, True, upper=2, chunk_size=2) == ([0], 2)
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
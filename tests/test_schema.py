@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas_should.schema import Column
+from pandas_should.schema import Schema
+from pandas_should.schema import dtype_matches
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'id': np.arange(3),
+        'price': [0.5, np.nan, 1.5],
+        'name': ['a', 'b', None],
+    }, index=pd.date_range('2020-01-01', periods=3))
+
+
+class TestDtypeMatches(object):
+
+    @pytest.mark.parametrize('dtype, expect, matches', [
+        ('int64', 'int64', True),
+        ('int64', 'integer', True),
+        ('int64', 'numeric', True),
+        ('bool', 'numeric', False),
+        ('float64', 'int64', False),
+        ('object', 'float', False),
+        ('Int64', 'integer', True),
+        ('category', 'string', False),
+        ('datetime64[ns]', 'datetime', True),
+    ])
+    def test_dtype_matches(self, dtype, expect, matches):
+        assert dtype_matches(pd.Series([], dtype=dtype).dtype, expect) == matches
+
+
+class TestSchema(object):
+
+    def test_matches(self, df):
+        schema = Schema({'id': 'integer', 'price': 'float64', 'name': 'object'},
+                        ordered=True, strict=True, index=pd.DatetimeIndex)
+        assert schema.matches(df)
+
+    def test_structure_problems(self, df):
+        schema = Schema({'price': 'float', 'id': 'float', 'other': None},
+                        strict=True, index='integer')
+        assert schema.structure_problems(df) == [
+            "missing column 'other'",
+            "unexpected column 'name'",
+            "column 'id' is int64, expected float",
+            'index dtype is datetime64[ns], expected integer',
+        ]
+
+    def test_order(self, df):
+        assert Schema({'id': None, 'name': None}, ordered=True).matches(df)
+        assert not Schema({'name': None, 'id': None}, ordered=True).matches(df)
+
+    def test_nullability(self, df):
+        assert Schema({'id': Column(nullable=False)}).matches(df)
+        assert Schema({'price': Column('float', nullable=False)}).problems(df) == [
+            "column 'price' has missing values"]
+
+    def test_structure_fails_before_nulls(self, df, monkeypatch):
+        import pandas_should.schema
+
+        def fail(values):
+            raise AssertionError('read values of a frame with the wrong schema')
+
+        monkeypatch.setattr(pandas_should.schema, 'has_null', fail)
+        schema = Schema({'price': Column('object', nullable=False)})
+        assert schema.problems(df) == ["column 'price' is float64, expected object"]
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
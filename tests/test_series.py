@@ -3,9 +3,11 @@
 
 import pytest
 
+import numpy as np
 import pandas as pd
 
 import pandas_should  # noqa
+from pandas_should.drift import DistributionProfile
 
 
 class TestEqualAccessorMixin(object):
@@ -20,6 +22,14 @@ class TestEqualAccessorMixin(object):
         s2 = pd.Series([1, 2, 3, 4])
         assert not s1.should.equal(s2)
 
+    def test_equal_message(self):
+        s1 = pd.Series([1, 2, 3])
+        s2 = pd.Series([1, 2, 4])
+        assert s1.should.equal(s1.copy(), message=True) == (True, None)
+        equal, message = s1.should.equal(s2, message=True)
+        assert not equal
+        assert message
+
     @pytest.mark.parametrize('alias_name', [
         'be_equal_to', 'be_equals_to', 'be_eq_to', 'eq',
     ])
@@ -83,6 +93,12 @@ class TestNullAccessorMixin(object):
         s = pd.Series([1, None, 3])
         assert not s.should.have_not_null()
 
+    def test_locate_null(self):
+        s = pd.Series(pd.array([1, None, 3, None], dtype='Int64'), name='x')
+        located = s.should.locate_null(n=1, count=True)
+        assert located.violations == [(1, 'x', pd.NA)]
+        assert located.total == 2
+
     @pytest.mark.parametrize('alias_name', ['havent_null'])
     def test_have_not_null_aliases(self, alias_name):
         s = pd.Series([1, 2, 3])
@@ -170,6 +186,13 @@ class TestValueRangeAccessorMixin(object):
         s = pd.Series([1, 2, 3])
         assert hasattr(s.should, alias_name)
 
+    def test_locate_out_of_range(self):
+        s = pd.Series(pd.date_range('2020-01-01', periods=5))
+        located = s.should.locate_out_of_range(range_max=pd.Timestamp('2020-01-03'),
+                                               include_max=False, count=True)
+        assert [v.row for v in located.violations] == [2, 3, 4]
+        assert located.total == 3
+
 
 class TestCardinalityAccessorMixin(object):
 
@@ -178,11 +201,50 @@ class TestCardinalityAccessorMixin(object):
         assert s.should.have_number_of_unique_values(3)
         assert not s.should.have_number_of_unique_values(2)
 
+    def test_have_number_of_unique_values_approx(self):
+        s = pd.Series(range(10000))
+        assert s.should.have_number_of_unique_values(10000, approx=True)
+        assert not s.should.have_number_of_unique_values(5000, approx=True)
+
     @pytest.mark.parametrize('alias_name', ['unique_values'])
     def test_fall_within_the_range_aliases(self, alias_name):
         s = pd.Series([1, 2, 3])
         assert hasattr(s.should, alias_name)
 
 
+class TestOrderAccessorMixin(object):
+
+    def test_be_monotonic(self):
+        s = pd.Series([1, 2, 2])
+        assert s.should.be_monotonic()
+        assert not s.should.be_monotonic(strict=True)
+        assert s.should.be_monotonic_increasing()
+        assert not s.should.be_monotonic_decreasing()
+
+    @pytest.mark.parametrize('alias_name', ['be_sorted', 'monotonic'])
+    def test_be_monotonic_aliases(self, alias_name):
+        s = pd.Series([1, 2, 3])
+        assert hasattr(s.should, alias_name)
+
+    def test_have_max_gap(self):
+        s = pd.Series(pd.date_range('2020-01-01', periods=3, freq='H'))
+        assert s.should.have_max_gap('1H')
+        assert not s.should.have_max_gap('30min')
+
+    def test_have_monotonic_index(self):
+        s = pd.Series([1, 2], index=[2, 1])
+        assert s.should.have_monotonic_index(increasing=False, strict=True)
+        assert not s.should.have_monotonic_index()
+
+
+class TestDriftAccessorMixin(object):
+
+    def test_match_distribution(self):
+        rng = np.random.RandomState(0)
+        reference = DistributionProfile.build(pd.Series(rng.normal(size=10000), name='x'))
+        assert pd.Series(rng.normal(size=1000)).should.match_distribution(reference)
+        assert not pd.Series(rng.normal(loc=6, size=1000)).should.not_drift(reference)
+
+
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
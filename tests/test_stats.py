@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+import pandas_should  # noqa
+from pandas_should.stats import STATS_CACHE
+from pandas_should.stats import invalidate_stats
+from pandas_should.stats import scan_column
+from pandas_should.stats import set_stats_cache
+
+
+@pytest.fixture
+def cache():
+    set_stats_cache(max_columns=4)
+    yield STATS_CACHE
+    set_stats_cache(max_columns=0)
+
+
+class TestScanColumn(object):
+
+    def test_float(self):
+        stats = scan_column(np.array([np.nan, 3.0, 1.0, np.nan, 2.0]), chunk_size=2)
+        assert stats.count_ == 5
+        assert stats.null_count_ == 2
+        assert (stats.min_, stats.max_) == (1.0, 3.0)
+
+    def test_nullable(self):
+        stats = scan_column(pd.array([None, 5, 4], dtype='Int64'), chunk_size=2)
+        assert stats.null_count_ == 1
+        assert (stats.min_, stats.max_) == (4, 5)
+
+    def test_merge(self):
+        stats = scan_column(np.array([np.nan, 3.0])).merge(scan_column(np.array([1.0])))
+        assert (stats.count_, stats.null_count_) == (3, 1)
+        assert (stats.min_, stats.max_) == (1.0, 3.0)
+        stats.merge(scan_column(np.array(['a'], dtype=object)))
+        assert not stats.has_extremes_
+        assert stats.in_range(0, 1) is None
+
+    def test_all_null(self):
+        stats = scan_column(np.array([np.nan, np.nan]))
+        assert stats.valid_count == 0
+        assert stats.in_range(0, 1)
+
+    def test_nan_only_chunk(self):
+        values = np.r_[np.full(4, np.nan), -5.0]
+        for nulls in (True, False):
+            stats = scan_column(values, nulls=nulls, chunk_size=4)
+            assert (stats.min_, stats.max_) == (-5.0, -5.0)
+            assert not stats.in_range(0)
+
+        stats = scan_column(np.full(4, np.nan), nulls=False, chunk_size=2)
+        assert stats.min_ is None
+        assert stats.in_range(0, 1)
+
+    def test_ordered_categorical(self):
+        values = pd.Categorical(['a'], categories=['b', 'a'], ordered=True)
+        assert scan_column(values).in_range('b') is None
+
+    def test_datetime_bounds(self):
+        stats = scan_column(pd.Series(pd.date_range('2019-01-02', periods=3)).array)
+        assert stats.in_range('2019-01-01', '2019-01-04')
+        assert not stats.in_range('2019-01-03')
+        with pytest.raises(TypeError):
+            stats.in_range(pd.Timestamp('2019-01-01', tz='UTC'))
+
+        stats = scan_column(pd.Series(pd.to_timedelta([1, 2], unit='s')).array)
+        assert stats.in_range('1s', '2s')
+        assert not stats.in_range(upper='1s')
+
+    def test_mixed_objects(self):
+        values = pd.Series(['a', 1, None]).array
+        stats = scan_column(values, chunk_size=1)
+        assert stats.null_count_ == 1
+        assert not stats.has_extremes_
+        assert stats.in_range(0, 1) is None
+
+    @pytest.mark.parametrize('lower, upper, include_lower, include_upper, expect', [
+        (1, 3, True, True, True),
+        (1, 3, False, True, False),
+        (1, 3, True, False, False),
+        (2, None, True, True, False),
+    ])
+    def test_in_range(self, lower, upper, include_lower, include_upper, expect):
+        stats = scan_column(np.array([1, 2, 3]))
+        assert stats.in_range(lower, upper, include_lower, include_upper) == expect
+
+
+class TestStatsCache(object):
+
+    def test_disabled_by_default(self):
+        df = pd.DataFrame({'a': [1, 2]})
+        assert STATS_CACHE.frame_stats(df) is None
+
+    def test_shared_between_accessors(self, cache):
+        df = pd.DataFrame({'a': [1.0, 2.0], 'b': [np.nan, 5.0]})
+        assert df.should.gt(0)
+        stats = cache.frame_stats(df)
+        assert cache.frame_stats(df) is stats
+        assert [s.max_ for s in stats] == [2.0, 5.0]
+        assert df.should.have_null(count=True) == (True, {'a': 0, 'b': 1})
+        assert not df.should.lte(4)
+
+    @pytest.mark.parametrize('mutate', [
+        lambda df: df.__setitem__('a', [-1.0, 2.0]),
+        lambda df: df.fillna(-1.0, inplace=True),
+        lambda df: df.replace(1.0, -1.0, inplace=True),
+    ])
+    @pytest.mark.parametrize('b', [[np.nan, 5.0], [np.nan, 5]])
+    def test_invalidated_by_mutation(self, cache, mutate, b):
+        df = pd.DataFrame({'a': [1.0, 2.0], 'b': b})
+        assert df.should.gt(0)
+        mutate(df)
+        assert not df.should.gt(0)
+
+    def test_explicit_invalidation(self, cache):
+        df = pd.DataFrame({'a': [1.0, 2.0]})
+        assert df.should.gt(0)
+        df.values[0, 0] = -1.0
+        invalidate_stats(df)
+        assert not df.should.gt(0)
+
+    @pytest.mark.parametrize('mutate', [
+        lambda df: df.iloc.__setitem__((0, 0), -1.0),
+        lambda df: df.loc.__setitem__((0, 'a'), -1.0),
+        lambda df: df.at.__setitem__((0, 'a'), -5.0),
+        lambda df: df.iat.__setitem__((0, 0), -5.0),
+        lambda df: df.mask(df > 1.5, -1.0, inplace=True),
+    ])
+    @pytest.mark.parametrize('b', [[1.0, 2.0], [1, 2]])
+    def test_element_writes(self, cache, mutate, b):
+        df = pd.DataFrame({'a': [1.0, 2.0], 'b': b})
+        assert df.should.gt(0)
+        mutate(df)
+        assert not df.should.gt(0)
+
+    @pytest.mark.parametrize('mutate', [
+        lambda s: s.__setitem__(0, -1.0),
+        lambda s: s.iloc.__setitem__(0, -1.0),
+        lambda s: s.at.__setitem__(0, -1.0),
+        lambda s: s.iat.__setitem__(0, -1.0),
+    ])
+    def test_series_element_writes(self, cache, mutate):
+        s = pd.Series([1.0, 2.0, 3.0])
+        assert s.should.gt(0)
+        assert s.should.have_number_of_unique_values(3)
+        mutate(s)
+        assert not s.should.gt(0)
+        s[0] = 2.0
+        assert s.should.gt(0)
+        assert s.should.have_number_of_unique_values(2)
+
+    def test_nullable_element_write(self, cache):
+        df = pd.DataFrame({'a': pd.array([1, 2], dtype='Int64'), 'b': ['x', 'y']})
+        assert df.should.have_not_null()
+        df.at[0, 'a'] = None
+        assert not df.should.have_not_null()
+
+    def test_series(self, cache):
+        s = pd.Series([1, 2, 2, None])
+        assert s.should.have_null(count=True) == (True, 1)
+        assert s.should.have_number_of_unique_values(3)
+        assert cache.series_stats(s).nunique_ == 3
+        assert s.should.fall_within_range(1, 2)
+
+    def test_lru_eviction(self, cache):
+        frames = [pd.DataFrame({'a': [i], 'b': [i]}) for i in range(3)]
+        for df in frames:
+            cache.frame_stats(df)
+        assert cache.size_ == 4
+        assert id(frames[0]) not in cache.entries_
+        assert id(frames[2]) in cache.entries_
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import io
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from pandas_should.streaming import ShouldStream
+from pandas_should.streaming import UniqueState
+
+
+def chunked(df, size):
+    for start in range(0, len(df), size):
+        yield df.iloc[start:start + size]
+
+
+class TestShouldStream(object):
+
+    def test_matches_in_memory(self):
+        df = pd.DataFrame({
+            'a': [1, 2, 3, 4, 5],
+            'b': [0.1, 0.2, np.nan, 0.4, 0.5],
+        })
+        stream = ShouldStream(chunked(df, 2))
+        stream.have_not_null().have_null()
+        stream.fall_within_range(0, 5).fall_within_range(1, 4)
+        stream.have_length(5).have_length(4)
+        stream.have_number_of_unique_values(5, column='a')
+        assert stream.run() == [
+            df.should.have_not_null(),
+            df.should.have_null(),
+            df.should.fall_within_range(0, 5),
+            df.should.fall_within_range(1, 4),
+            df.should.have_length(5),
+            df.should.have_length(4),
+            df.a.should.have_number_of_unique_values(5),
+        ]
+
+    def test_read_csv_chunks(self):
+        buf = io.StringIO('x\n1\n2\n2\n\n3\n')
+        reader = pd.read_csv(buf, chunksize=2, skip_blank_lines=False)
+        results = ShouldStream(reader).have_not_null().have_number_of_unique_values(4).run()
+        assert results == [False, True]
+
+    def test_series_chunks(self):
+        chunks = [pd.Series([1, 2]), pd.Series([2, 3])]
+        assert ShouldStream(chunks).have_number_of_unique_values(3).run() == [True]
+
+    def test_unique_needs_column(self):
+        chunks = [pd.DataFrame({'a': [1], 'b': [2]})]
+        with pytest.raises(ValueError):
+            ShouldStream(chunks).have_number_of_unique_values(1).run()
+
+    def test_stops_when_decided(self):
+        consumed = []
+
+        def chunks():
+            for i in range(10):
+                consumed.append(i)
+                yield pd.DataFrame({'a': [None if i == 1 else i]})
+
+        assert ShouldStream(chunks()).have_not_null().run() == [False]
+        assert consumed == [0, 1, 2]
+
+    def test_unique_counts_incrementally(self):
+        first, second = UniqueState(3), UniqueState(3)
+        first.update(pd.DataFrame({'a': [1.0, np.nan, 1.0]}))
+        second.update(pd.DataFrame({'a': [np.nan, 2.0, 3.0]}))
+        first.merge(second)
+        assert first.counter_.count == 4
+        assert first.decided() and not first.result()
+
+    def test_unique_stops_within_chunk(self):
+        state = UniqueState(2)
+        # gives up after the first chunk of the counter past the limit
+        state.counter_.update(np.arange(100), chunk_size=10)
+        assert state.decided()
+        assert state.counter_.count == 10
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
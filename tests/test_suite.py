@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+import pandas_should  # noqa
+from pandas_should.suite import ShouldSuite
+
+
+class TestShouldSuite(object):
+
+    def test_matches_accessor(self):
+        df = pd.DataFrame({
+            'a': [1, 2, 3],
+            'b': [0.5, np.nan, 2.5],
+            'c': pd.date_range('2020-01-01', periods=3),
+        })
+        suite = ShouldSuite()
+        suite.have_null().have_not_null()
+        suite.have_length(3).have_width(2)
+        results = df.should.run_suite(suite)
+        assert [r.passed for r in results] == [True, False, True, False]
+        assert results[2].name == 'have_length'
+        assert results[2].args == (3,)
+
+    @pytest.mark.parametrize('check, args', [
+        ('fall_within_range', (0, 3)),
+        ('fall_within_range', (1, 2.5)),
+        ('gt', (0,)),
+        ('gt', (0.5,)),
+        ('gte', (0.5,)),
+        ('lt', (3,)),
+        ('lt', (2.5,)),
+        ('lte', (3,)),
+    ])
+    def test_range_matches_accessor(self, check, args):
+        df = pd.DataFrame({
+            'a': [1, 2, 3],
+            'b': [0.5, np.nan, 2.5],
+            'c': pd.array([1, None, 2], dtype='Int64'),
+        })
+        suite = getattr(ShouldSuite(), check)(*args)
+        expect = getattr(df.should, check)(*args)
+        assert df.should.pass_suite(suite) == expect
+
+    @pytest.mark.parametrize('df, check, args', [
+        (pd.DataFrame({'a': np.r_[np.full(65536, np.nan), -5.0]}), 'gte', (0,)),
+        (pd.DataFrame({'a': pd.Categorical(['a'], categories=['b', 'a'], ordered=True)}),
+         'gte', ('b',)),
+        (pd.DataFrame({'a': pd.date_range('2019-01-02', periods=3)}), 'gte', ('2019-01-01',)),
+        (pd.DataFrame({'a': pd.date_range('2019-01-02', periods=3)}), 'lt', ('2019-01-03',)),
+    ])
+    def test_range_edge_cases_match_accessor(self, df, check, args):
+        suite = getattr(ShouldSuite(), check)(*args)
+        assert df.should.pass_suite(suite) == getattr(df.should, check)(*args)
+
+    def test_unordered_objects_fall_back(self):
+        df = pd.DataFrame({'a': ['x', 'y']})
+        suite = ShouldSuite().gte('x').lt('y')
+        assert [r.passed for r in df.should.run_suite(suite)] == [True, False]
+
+    def test_schema_gates_value_checks(self, monkeypatch):
+        import pandas_should.suite
+        df = pd.DataFrame({'a': ['x', 'y']})
+        suite = ShouldSuite().have_schema({'a': 'numeric'}).gte(0).have_length(2)
+
+        def fail(*args, **kwargs):
+            raise AssertionError('scanned a frame with the wrong schema')
+
+        monkeypatch.setattr(pandas_should.suite, 'column_map', fail)
+        assert [r.passed for r in df.should.run_suite(suite)] == [False, False, True]
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])